@@ -2,6 +2,7 @@
 """Main entry point for Data Explorer application."""
 
 import tkinter as tk
+import multiprocessing
 import sys
 from pathlib import Path
 
@@ -14,6 +15,8 @@ from app.main_window import MainWindow
 
 def main():
     """Main entry point."""
+    # Frozen builds must not rerun the app in diff worker processes
+    multiprocessing.freeze_support()
     root = tk.Tk()
     app = MainWindow(root)
     root.mainloop()
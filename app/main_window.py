@@ -1,18 +1,25 @@
 """Main window for the Data Explorer application."""
 
+import importlib
 import tkinter as tk
 from tkinter import ttk
-from typing import Optional
-from app.tabs.migration_tool.migration_tab import MigrationToolTab
-from app.tabs.data_explorer.explorer_tab import DataExplorerTab
+from typing import Dict, Optional
 from app.modules.ui_components import StatusBar
 from app.modules.theme import Theme
 from app.modules.theme_manager import ThemeManager
+from app.modules.session_manager import SessionManager
 
 
 class MainWindow:
     """Main application window with tabbed interface."""
     
+    # Notebook tabs as (label, attribute, module, class); each tab module is
+    # imported and constructed the first time its tab is selected
+    TABS = [
+        ("  Migration Tool  ", "migration_tab", "app.tabs.migration_tool.migration_tab", "MigrationToolTab"),
+        ("  Data Explorer  ", "explorer_tab", "app.tabs.data_explorer.explorer_tab", "DataExplorerTab"),
+    ]
+    
     def __init__(self, root: tk.Tk):
         self.root = root
         self.root.title("Data Explorer - Migration Tool & Data Visualization")
@@ -23,6 +30,9 @@ class MainWindow:
         self.theme_manager = ThemeManager()
         self.current_theme_colors = self.theme_manager.get_current_theme()
         
+        # Previous session (open files, filters, selection), restored by each tab
+        self.session_manager = SessionManager()
+        
         # Configure theme
         self.style = ttk.Style()
         Theme.configure_theme(self.style, self.current_theme_colors)
@@ -38,6 +48,21 @@ class MainWindow:
         
         # Center window on screen
         self.center_window()
+        
+        # Reopen the tab that was selected when the app was last closed
+        selected = self.session_manager.get('window').get('tab', 0)
+        if isinstance(selected, int) and 0 <= selected < len(self.TABS):
+            self.notebook.select(selected)
+        
+        # Show the performance HUD if it was on when the app was last closed
+        if self.session_manager.get('window').get('hud'):
+            self.toggle_hud()
+        
+        # Save the session when the window is closed
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+        # Build the initially selected tab once the window skeleton is painted
+        self.root.after_idle(self.on_tab_changed)
     
     def on_theme_changed(self, mode: str):
         """Handle theme change."""
@@ -56,11 +81,9 @@ class MainWindow:
         if hasattr(self, 'status_bar'):
             self.status_bar.update_theme(self.current_theme_colors)
         
-        # Notify tabs to update theme
-        if hasattr(self, 'migration_tab'):
-            self.migration_tab.update_theme(self.current_theme_colors)
-        if hasattr(self, 'explorer_tab'):
-            self.explorer_tab.update_theme(self.current_theme_colors)
+        # Notify built tabs to update theme; unbuilt tabs read it on construction
+        for tab in self.tabs.values():
+            tab.update_theme(self.current_theme_colors)
     
     def center_window(self):
         """Center the window on the screen."""
@@ -107,6 +130,15 @@ class MainWindow:
         )
         self.theme_button.pack(side='right')
         
+        # Performance HUD toggle (the HUD itself is shown in the status bar)
+        self.hud_button = ttk.Button(
+            header_frame,
+            text="⏱ Performance",
+            command=self.toggle_hud,
+            style='Secondary.TButton'
+        )
+        self.hud_button.pack(side='right', padx=(0, 10))
+        
         # Create notebook (tabbed interface) with custom styling
         notebook_frame = ttk.Frame(main_container)
         notebook_frame.pack(fill="both", expand=True)
@@ -114,12 +146,13 @@ class MainWindow:
         self.notebook = ttk.Notebook(notebook_frame)
         self.notebook.pack(fill="both", expand=True)
         
-        # Create tabs (pass theme manager)
-        self.migration_tab = MigrationToolTab(self.notebook, self.theme_manager)
-        self.notebook.add(self.migration_tab.frame, text="  Migration Tool  ")
-        
-        self.explorer_tab = DataExplorerTab(self.notebook, self.theme_manager)
-        self.notebook.add(self.explorer_tab.frame, text="  Data Explorer  ")
+        # Add placeholder pages; tabs are built on first selection (see ensure_tab)
+        self.tabs: Dict[int, object] = {}
+        self.tab_pages = []
+        for label, _, _, _ in self.TABS:
+            page = ttk.Frame(self.notebook)
+            self.notebook.add(page, text=label)
+            self.tab_pages.append(page)
         
         # Status bar at bottom
         status_container = ttk.Frame(main_container)
@@ -138,10 +171,47 @@ class MainWindow:
         theme_text = "🌙 Dark" if self.theme_manager.current_mode == "light" else "☀️ Light"
         self.theme_button.config(text=theme_text)
     
+    def toggle_hud(self):
+        """Show or hide load, filter and chart timings in the status bar."""
+        if self.status_bar.hud_enabled:
+            self.status_bar.disable_hud()
+        else:
+            from app.modules.perf_monitor import PerfMonitor
+            self.status_bar.enable_hud(PerfMonitor.instance())
+        self.session_manager.update('window', hud=self.status_bar.hud_enabled)
+    
+    def ensure_tab(self, index: int):
+        """Import and build a tab the first time it is selected."""
+        tab = self.tabs.get(index)
+        if tab is None:
+            _, attribute, module_name, class_name = self.TABS[index]
+            self.root.config(cursor="watch")
+            self.root.update_idletasks()
+            try:
+                tab_class = getattr(importlib.import_module(module_name), class_name)
+                tab = tab_class(self.tab_pages[index], self.theme_manager, self.session_manager)
+                tab.frame.pack(fill="both", expand=True)
+            finally:
+                self.root.config(cursor="")
+            self.tabs[index] = tab
+            setattr(self, attribute, tab)
+        return tab
+    
     def on_tab_changed(self, event=None):
         """Handle tab change event."""
         selected = self.notebook.index(self.notebook.select())
+        self.ensure_tab(selected)
         if selected == 0:
             self.status_bar.set_status("Migration Tool - Load user data files to analyze migration patterns", self.current_theme_colors['INFO'])
         elif selected == 1:
             self.status_bar.set_status("Data Explorer - Upload CSV/JSON files to explore and visualize your data", self.current_theme_colors['INFO'])
+    
+    def on_close(self):
+        """Save every built tab's session state, then close the window."""
+        for tab in self.tabs.values():
+            try:
+                tab.save_session()
+            except Exception:
+                pass  # Never block closing the window
+        self.session_manager.update('window', tab=self.notebook.index(self.notebook.select()))
+        self.root.destroy()
@@ -0,0 +1,81 @@
+"""Run blocking work in a worker thread and hand results back to the Tk thread."""
+
+import queue
+import threading
+from typing import Any, Callable, Iterable, Optional
+
+
+class BackgroundTask:
+    """Iterate a producer in a worker thread and deliver each item on the Tk thread.
+
+    The producer is a zero-argument callable returning an iterable (usually a
+    generator). Items are queued by the worker and drained by a ``widget.after``
+    poll, so the callbacks may safely touch Tk widgets. ``cancel`` stops
+    delivery immediately and lets the worker exit at its next item.
+    """
+    
+    # Interval between queue polls on the Tk thread
+    POLL_MS = 50
+    
+    def __init__(self, widget, producer: Callable[[], Iterable[Any]],
+                 on_item: Callable[[Any], None],
+                 on_done: Optional[Callable[[], None]] = None,
+                 on_error: Optional[Callable[[Exception], None]] = None):
+        self.widget = widget
+        self.producer = producer
+        self.on_item = on_item
+        self.on_done = on_done
+        self.on_error = on_error
+        self._queue: queue.Queue = queue.Queue()
+        self._cancelled = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._finished = False
+    
+    def start(self):
+        """Start the worker thread and the Tk-side poll."""
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self.widget.after(self.POLL_MS, self._poll)
+        return self
+    
+    def cancel(self):
+        """Stop delivering items; the worker exits before producing the next one."""
+        self._cancelled.set()
+    
+    @property
+    def running(self) -> bool:
+        """Whether the task is still delivering items."""
+        return not self._finished and not self._cancelled.is_set()
+    
+    def _run(self):
+        """Worker thread body: forward produced items, then a completion marker."""
+        try:
+            for item in self.producer():
+                if self._cancelled.is_set():
+                    return
+                self._queue.put(('item', item))
+            self._queue.put(('done', None))
+        except Exception as e:
+            self._queue.put(('error', e))
+    
+    def _poll(self):
+        """Drain queued items on the Tk thread and reschedule until finished."""
+        while not self._cancelled.is_set():
+            try:
+                kind, payload = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            
+            if kind == 'item':
+                self.on_item(payload)
+                continue
+            
+            self._finished = True
+            if kind == 'done' and self.on_done:
+                self.on_done()
+            elif kind == 'error' and self.on_error:
+                self.on_error(payload)
+            return
+        
+        if not self._cancelled.is_set():
+            self.widget.after(self.POLL_MS, self._poll)
@@ -0,0 +1,173 @@
+"""Size-bounded LRU cache of chart aggregates and rendered charts."""
+
+import hashlib
+import os
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Hashable, Iterable, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+
+class ChartCache:
+    """Memoizes what a chart needs so repeating it skips the work.
+
+    Two kinds of entries share one byte budget:
+
+    - aggregates (value counts, histograms, correlation matrices, samples),
+      keyed by ``(fingerprint, 'aggregate', name)`` so every chart type and
+      library built from the same data reuses them;
+    - rendered output (a rasterized matplotlib image or plotly figure JSON),
+      keyed by ``chart_key(fingerprint, chart type, columns, library, theme)``.
+
+    Entries are evicted least recently used first once ``max_bytes`` is
+    exceeded. A dataset's entries are dropped with ``invalidate`` when it is
+    reloaded. The cache is shared between the Tk thread and the render
+    worker, so every access takes a lock; values are computed outside it.
+    """
+    
+    # Default budget for all cached aggregates and rendered charts
+    MAX_BYTES = 256 * 1024 * 1024
+    
+    # Rows hashed (evenly spaced) when fingerprinting a DataFrame
+    FINGERPRINT_ROWS = 1000
+    
+    _instance: Optional['ChartCache'] = None
+    
+    def __init__(self, max_bytes: int = MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple, Tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def instance(cls) -> 'ChartCache':
+        """The application-wide cache."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
+    @staticmethod
+    def fingerprint(data: Any) -> str:
+        """Identify a dataset: its identity, shape, dtypes and a sample of its rows.
+
+        DataFrames hash up to ``FINGERPRINT_ROWS`` evenly spaced rows, so the
+        cost does not grow with the row count. Objects with a ``directory``
+        (out-of-core stores) are identified by it, since the store directory
+        is already keyed by the source file's path, size and mtime.
+        """
+        digest = hashlib.sha1()
+        if isinstance(data, pd.DataFrame):
+            digest.update(repr((id(data), data.shape, [str(col) for col in data.columns], [str(dtype) for dtype in data.dtypes])).encode('utf-8'))
+            if len(data):
+                positions = np.unique(np.linspace(0, len(data) - 1, min(len(data), ChartCache.FINGERPRINT_ROWS)).astype(np.int64))
+                sample = data.iloc[positions]
+                try:
+                    hashed = pd.util.hash_pandas_object(sample, index=False)
+                except TypeError:
+                    # List cells (unexploded arrays) are unhashable; hash their text
+                    hashed = pd.util.hash_pandas_object(sample.astype(str), index=False)
+                digest.update(hashed.to_numpy().tobytes())
+        elif hasattr(data, 'directory'):
+            digest.update(str(Path(data.directory).resolve()).encode('utf-8'))
+        else:
+            digest.update(repr((id(data), type(data).__name__)).encode('utf-8'))
+        return digest.hexdigest()[:16]
+    
+    @staticmethod
+    def file_fingerprint(paths: Iterable[Optional[str]]) -> str:
+        """Identify data loaded from files by their paths, sizes and mtimes."""
+        parts = []
+        for path in paths:
+            if path and os.path.exists(path):
+                stat = os.stat(path)
+                parts.append(f"{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}")
+        return hashlib.sha1("\n".join(parts).encode('utf-8')).hexdigest()[:16]
+    
+    @staticmethod
+    def theme_key(theme_colors: Optional[dict]) -> str:
+        """A short stable key for a theme's colors."""
+        if not theme_colors:
+            return ""
+        return hashlib.sha1(repr(sorted(theme_colors.items())).encode('utf-8')).hexdigest()[:8]
+    
+    @staticmethod
+    def chart_key(fingerprint: str, chart_type: str, columns: Iterable[str], library: str, theme_colors: Optional[dict] = None) -> Tuple:
+        """Key of a rendered chart."""
+        return (fingerprint, 'chart', chart_type, tuple(columns), library, ChartCache.theme_key(theme_colors))
+    
+    @staticmethod
+    def size_of(value: Any) -> int:
+        """Approximate bytes held by a cached value."""
+        if isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+            usage = value.memory_usage(index=True, deep=True)
+            return int(usage.sum() if isinstance(usage, pd.Series) else usage)
+        if isinstance(value, np.ndarray):
+            return value.nbytes
+        if isinstance(value, (str, bytes)):
+            return len(value)
+        if isinstance(value, (tuple, list)):
+            return sum(ChartCache.size_of(item) for item in value)
+        if hasattr(value, 'width') and hasattr(value, 'height'):
+            # A rasterized chart: its RGBA buffer dominates
+            return value.width * value.height * 4
+        return sys.getsizeof(value)
+    
+    def get(self, key: Hashable) -> Any:
+        """The cached value for a key (marking it recently used), or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+    
+    def put(self, key: Hashable, value: Any, size: Optional[int] = None):
+        """Store a value, evicting least recently used entries to fit the budget.
+
+        Values larger than the whole budget are not cached.
+        """
+        size = self.size_of(value) if size is None else size
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.total_bytes -= previous[1]
+            self._entries[key] = (value, size)
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.total_bytes -= evicted
+    
+    def aggregate(self, fingerprint: Optional[str], name: Tuple, compute: Callable[[], Any]) -> Any:
+        """Memoized ``compute()`` for an aggregate of a dataset; uncached without a fingerprint."""
+        if fingerprint is None:
+            return compute()
+        key = (fingerprint, 'aggregate') + tuple(name)
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+    
+    def invalidate(self, *fingerprints: str) -> int:
+        """Drop every entry of the given datasets; returns the number dropped."""
+        targets = set(fingerprints)
+        with self._lock:
+            stale = [key for key in self._entries if key[0] in targets]
+            for key in stale:
+                self.total_bytes -= self._entries.pop(key)[1]
+        return len(stale)
+    
+    def clear(self):
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
@@ -1,19 +1,34 @@
 """Chart engine for creating various types of charts using matplotlib and plotly."""
 
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Union, TYPE_CHECKING
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
+from app.modules.downsample import Downsampler
+from app.modules.correlation import CorrelationEngine
+from app.modules.theme import Theme
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+# plotly is imported inside the plotly builders: it is only needed when an
+# interactive chart is requested and costs a noticeable share of startup.
+
+Theme.apply_matplotlib_style()
 
 
 class ChartEngine:
     """Engine for creating charts with matplotlib and plotly."""
     
+    # Interactive charts embed their data in the HTML. Above these row counts
+    # the plotly builders aggregate in numpy instead of shipping raw values:
+    # scatter plots switch to WebGL, then to a binned density grid, and
+    # histograms are binned before export.
+    WEBGL_POINTS = 20_000
+    DENSITY_POINTS = 500_000
+    DENSITY_BINS = 200
+    HISTOGRAM_POINTS = 50_000
+    
     @staticmethod
     def create_line_chart_matplotlib(
         data: pd.DataFrame,
@@ -26,7 +41,16 @@ class ChartEngine:
         fig = Figure(figsize=figsize, dpi=100)
         ax = fig.add_subplot(111)
         
-        ax.plot(data[x_col], data[y_col], marker='o', linewidth=2)
+        # Reduce to screen resolution when there are more points than pixels
+        marker = 'o'
+        indices = None
+        if pd.api.types.is_numeric_dtype(data[y_col]):
+            indices = Downsampler.line_indices(data[x_col].to_numpy(), data[y_col].to_numpy(dtype=float, na_value=np.nan), figsize[0] * fig.dpi)
+        if indices is not None:
+            data = data.iloc[indices]
+            marker = None
+        
+        ax.plot(data[x_col], data[y_col], marker=marker, linewidth=2)
         ax.set_title(title)
         ax.set_xlabel(x_col)
         ax.set_ylabel(y_col)
@@ -90,6 +114,27 @@ class ChartEngine:
         
         return fig
     
+    @staticmethod
+    def create_binned_histogram_matplotlib(
+        counts: np.ndarray,
+        edges: np.ndarray,
+        name: str,
+        title: str = "Histogram",
+        figsize: tuple = (8, 4)
+    ) -> Figure:
+        """Create a histogram from precomputed bin counts using matplotlib."""
+        fig = Figure(figsize=figsize, dpi=100)
+        ax = fig.add_subplot(111)
+        
+        ax.hist(edges[:-1], bins=edges, weights=counts, edgecolor='black', alpha=0.7)
+        ax.set_title(title)
+        ax.set_xlabel(name)
+        ax.set_ylabel('Frequency')
+        ax.grid(True, alpha=0.3)
+        fig.tight_layout()
+        
+        return fig
+    
     @staticmethod
     def create_scatter_plot_matplotlib(
         data: pd.DataFrame,
@@ -102,6 +147,12 @@ class ChartEngine:
         fig = Figure(figsize=figsize, dpi=100)
         ax = fig.add_subplot(111)
         
+        # Keep one point per pixel cell; overplotted points are invisible anyway
+        if pd.api.types.is_numeric_dtype(data[x_col]) and pd.api.types.is_numeric_dtype(data[y_col]):
+            width, height = int(figsize[0] * fig.dpi), int(figsize[1] * fig.dpi)
+            if len(data) > width * height:
+                data = data.iloc[Downsampler.pixel_indices(data[x_col].to_numpy(dtype=float, na_value=np.nan), data[y_col].to_numpy(dtype=float, na_value=np.nan), width, height)]
+        
         ax.scatter(data[x_col], data[y_col], alpha=0.6)
         ax.set_title(title)
         ax.set_xlabel(x_col)
@@ -117,8 +168,10 @@ class ChartEngine:
         x_col: str,
         y_col: str,
         title: str = "Line Chart"
-    ) -> go.Figure:
+    ) -> 'go.Figure':
         """Create an interactive line chart using plotly."""
+        import plotly.graph_objects as go
+        
         fig = go.Figure()
         
         fig.add_trace(go.Scatter(
@@ -143,8 +196,10 @@ class ChartEngine:
     def create_bar_chart_plotly(
         data: pd.Series,
         title: str = "Bar Chart"
-    ) -> go.Figure:
+    ) -> 'go.Figure':
         """Create an interactive bar chart using plotly."""
+        import plotly.graph_objects as go
+        
         fig = go.Figure()
         
         fig.add_trace(go.Bar(
@@ -166,8 +221,10 @@ class ChartEngine:
     def create_pie_chart_plotly(
         data: pd.Series,
         title: str = "Pie Chart"
-    ) -> go.Figure:
+    ) -> 'go.Figure':
         """Create an interactive pie chart using plotly."""
+        import plotly.graph_objects as go
+        
         fig = go.Figure(data=[go.Pie(
             labels=data.index,
             values=data.values,
@@ -186,12 +243,25 @@ class ChartEngine:
         data: pd.Series,
         title: str = "Histogram",
         bins: int = 30
-    ) -> go.Figure:
-        """Create an interactive histogram using plotly."""
+    ) -> 'go.Figure':
+        """Create an interactive histogram using plotly.
+        
+        Numeric columns above ``HISTOGRAM_POINTS`` values are binned with
+        numpy so only the bin counts are written to the HTML.
+        """
+        import plotly.graph_objects as go
+        
+        values = data.dropna()
+        if len(values) > ChartEngine.HISTOGRAM_POINTS and pd.api.types.is_numeric_dtype(values):
+            finite = values.to_numpy(dtype=np.float64)
+            finite = finite[np.isfinite(finite)]
+            counts, edges = np.histogram(finite, bins=bins)
+            return ChartEngine.create_binned_histogram_plotly(counts, edges, data.name, title)
+        
         fig = go.Figure()
         
         fig.add_trace(go.Histogram(
-            x=data.dropna(),
+            x=values,
             nbinsx=bins,
             name=title
         ))
@@ -205,6 +275,35 @@ class ChartEngine:
         
         return fig
     
+    @staticmethod
+    def create_binned_histogram_plotly(
+        counts: np.ndarray,
+        edges: np.ndarray,
+        name: str,
+        title: str = "Histogram"
+    ) -> 'go.Figure':
+        """Create an interactive histogram from precomputed bin counts using plotly."""
+        import plotly.graph_objects as go
+        
+        fig = go.Figure()
+        
+        fig.add_trace(go.Bar(
+            x=(edges[:-1] + edges[1:]) / 2,
+            y=counts,
+            width=np.diff(edges),
+            name=title
+        ))
+        
+        fig.update_layout(
+            title=title,
+            xaxis_title=name,
+            yaxis_title='Frequency',
+            bargap=0,
+            template='plotly_white'
+        )
+        
+        return fig
+    
     @staticmethod
     def create_scatter_plot_plotly(
         data: pd.DataFrame,
@@ -212,13 +311,30 @@ class ChartEngine:
         y_col: str,
         title: str = "Scatter Plot",
         color_col: Optional[str] = None
-    ) -> go.Figure:
-        """Create an interactive scatter plot using plotly."""
+    ) -> 'go.Figure':
+        """Create an interactive scatter plot using plotly.
+        
+        Above ``WEBGL_POINTS`` rows markers are drawn with WebGL; above
+        ``DENSITY_POINTS`` numeric rows the plot becomes a binned density
+        heatmap computed with numpy.
+        """
+        import plotly.graph_objects as go
+        
+        numeric = pd.api.types.is_numeric_dtype(data[x_col]) and pd.api.types.is_numeric_dtype(data[y_col])
         if color_col:
-            fig = px.scatter(data, x=x_col, y=y_col, color=color_col, title=title)
+            import plotly.express as px
+            render_mode = 'webgl' if len(data) > ChartEngine.WEBGL_POINTS else 'svg'
+            fig = px.scatter(data, x=x_col, y=y_col, color=color_col, title=title, render_mode=render_mode)
+        elif numeric and len(data) > ChartEngine.DENSITY_POINTS:
+            fig = ChartEngine.create_density_plotly(
+                data[x_col].to_numpy(dtype=float, na_value=np.nan),
+                data[y_col].to_numpy(dtype=float, na_value=np.nan),
+                x_col, y_col, title
+            )
         else:
+            trace = go.Scattergl if len(data) > ChartEngine.WEBGL_POINTS else go.Scatter
             fig = go.Figure()
-            fig.add_trace(go.Scatter(
+            fig.add_trace(trace(
                 x=data[x_col],
                 y=data[y_col],
                 mode='markers',
@@ -233,25 +349,83 @@ class ChartEngine:
         
         return fig
     
+    @staticmethod
+    def create_density_plotly(
+        x: np.ndarray,
+        y: np.ndarray,
+        x_label: str,
+        y_label: str,
+        title: str = "Scatter Plot",
+        bins: int = DENSITY_BINS
+    ) -> 'go.Figure':
+        """Create a binned 2D density plot (points per cell) using plotly."""
+        import plotly.graph_objects as go
+        
+        finite = np.isfinite(x) & np.isfinite(y)
+        counts, x_edges, y_edges = np.histogram2d(x[finite], y[finite], bins=bins)
+        # Empty cells stay transparent instead of drawing the lowest colour
+        z = np.where(counts > 0, counts, np.nan).T
+        
+        fig = go.Figure(data=go.Heatmap(
+            z=z,
+            x=(x_edges[:-1] + x_edges[1:]) / 2,
+            y=(y_edges[:-1] + y_edges[1:]) / 2,
+            colorscale='Viridis',
+            colorbar=dict(title="Points"),
+            hovertemplate=f"{x_label}: %{{x}}<br>{y_label}: %{{y}}<br>Points: %{{z}}<extra></extra>"
+        ))
+        
+        fig.update_layout(
+            title=f"{title} (density of {int(finite.sum()):,} points)",
+            xaxis_title=x_label,
+            yaxis_title=y_label,
+            template='plotly_white'
+        )
+        
+        return fig
+    
     @staticmethod
     def create_heatmap_plotly(
         data: pd.DataFrame,
-        title: str = "Correlation Heatmap"
-    ) -> go.Figure:
+        title: str = "Correlation Heatmap",
+        max_columns: int = CorrelationEngine.HEATMAP_COLUMNS
+    ) -> 'go.Figure':
         """Create a correlation heatmap using plotly."""
-        corr = data.corr()
+        corr = CorrelationEngine.matrix(data)
+        return ChartEngine.create_correlation_heatmap_plotly(corr, title, max_columns)
+    
+    @staticmethod
+    def create_correlation_heatmap_plotly(
+        corr: pd.DataFrame,
+        title: str = "Correlation Heatmap",
+        max_columns: int = CorrelationEngine.HEATMAP_COLUMNS
+    ) -> 'go.Figure':
+        """Draw a precomputed correlation matrix, limited to its strongest columns.
         
-        fig = go.Figure(data=go.Heatmap(
-            z=corr.values,
-            x=corr.columns,
-            y=corr.index,
+        Wide matrices are cut to the ``max_columns`` columns taking part in
+        the strongest pairs; columns are ordered so correlated ones cluster.
+        Cells are labelled only while the grid is small enough to read.
+        """
+        import plotly.graph_objects as go
+        
+        columns = CorrelationEngine.select_columns(corr, max_columns)
+        shown = corr.loc[columns, columns]
+        if len(columns) < len(corr.columns):
+            title = f"{title} (strongest {len(columns)} of {len(corr.columns)} columns)"
+        
+        heatmap = dict(
+            z=shown.values,
+            x=shown.columns,
+            y=shown.index,
             colorscale='RdBu',
             zmid=0,
-            text=corr.values,
-            texttemplate='%{text:.2f}',
-            textfont={"size": 10},
+            zmin=-1,
+            zmax=1,
             colorbar=dict(title="Correlation")
-        ))
+        )
+        if len(columns) <= CorrelationEngine.ANNOTATE_COLUMNS:
+            heatmap.update(text=shown.values, texttemplate='%{text:.2f}', textfont={"size": 10})
+        fig = go.Figure(data=go.Heatmap(**heatmap))
         
         fig.update_layout(
             title=title,
@@ -0,0 +1,297 @@
+"""Persistent matplotlib canvas host for charts that update in place."""
+
+import time
+from typing import Dict, List, Optional, Sequence, Union, Callable
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.axes import Axes
+from matplotlib.lines import Line2D
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from app.modules.downsample import Downsampler
+from app.modules.perf_monitor import PerfMonitor
+from app.modules.theme import Theme
+
+Theme.apply_matplotlib_style()
+
+
+class ChartHost:
+    """Owns one Figure/canvas pair per panel and updates its artists in place.
+
+    Axes are created once per key and reused. Lines registered through
+    ``update_line`` are animated artists: when the axes limits are unchanged,
+    a data update restores the cached background and blits only those lines
+    instead of redrawing the whole figure.
+    
+    Lines updated with ``downsample=True`` keep their full-resolution data and
+    only hand matplotlib a screen-resolution subset; zooming re-samples the
+    visible range so detail reappears as the view narrows.
+    
+    Colors are bound to theme roles (``'PRIMARY'``, ``'BORDER'``, ...) rather
+    than literal values, so ``apply_theme`` can recolor every artist in place
+    and issue a single redraw instead of rebuilding the figure.
+    
+    With ``parent=None`` the host is headless: the figure gets a plain Agg
+    canvas and is rasterized by the caller (e.g. the RenderService on a
+    worker thread, or ``savefig`` in a headless report), so the same drawing
+    code can run off the Tk thread. Headless lines are not animated, since
+    there is no blitting and ``savefig`` skips animated artists.
+    """
+    
+    def __init__(self, parent, theme_colors: dict, figsize: tuple = (10, 5), dpi: int = 100):
+        self.theme_colors = theme_colors
+        self.figure = Figure(figsize=figsize, dpi=dpi, facecolor=theme_colors['BG_PRIMARY'])
+        if parent is None:
+            self.canvas = FigureCanvasAgg(self.figure)
+            self.widget = None
+        else:
+            # Imported here so headless hosts work where Tk is not installed
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            self.canvas = FigureCanvasTkAgg(self.figure, parent)
+            self.widget = self.canvas.get_tk_widget()
+        
+        self.axes: Dict[str, Axes] = {}
+        self.lines: Dict[str, Line2D] = {}
+        self._full_data: Dict[str, tuple] = {}
+        self._markers: Dict[str, str] = {}
+        self._zoom_axes: set = set()
+        self._resampling = False
+        self._color_bindings: List[tuple] = []
+        self._styled_axes: Dict[Axes, bool] = {}
+        self._background = None
+        self._visible = False
+        # When the pending full redraw was first requested (for the performance HUD)
+        self._draw_requested: Optional[float] = None
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+    
+    def show(self, **pack_kwargs):
+        """Pack the canvas widget if it is not already visible."""
+        if self.widget is not None and not self._visible:
+            self.widget.pack(fill="both", expand=True, **pack_kwargs)
+            self._visible = True
+    
+    def hide(self):
+        """Unpack the canvas widget, keeping the figure for reuse."""
+        if self.widget is not None and self._visible:
+            self.widget.pack_forget()
+            self._visible = False
+    
+    @property
+    def visible(self) -> bool:
+        """Whether the canvas widget is currently packed."""
+        return self._visible
+    
+    def get_axes(self, key: str, *subplot_args) -> Axes:
+        """Get the axes for a key, creating it on first use."""
+        ax = self.axes.get(key)
+        if ax is None:
+            ax = self.figure.add_subplot(*(subplot_args or (111,)), facecolor=self.theme_colors['BG_PRIMARY'])
+            self.axes[key] = ax
+        return ax
+    
+    def reset_axes(self, key: str, *subplot_args) -> Axes:
+        """Clear an axes for a full content rebuild while keeping the canvas."""
+        ax = self.get_axes(key, *subplot_args)
+        self.lines = {name: line for name, line in self.lines.items() if line.axes is not ax}
+        self._full_data = {name: data for name, data in self._full_data.items() if name in self.lines}
+        self._color_bindings = [binding for binding in self._color_bindings if binding[0] is not ax]
+        self._styled_axes.pop(ax, None)
+        ax.clear()
+        ax.set_facecolor(self.theme_colors['BG_PRIMARY'])
+        return ax
+    
+    def bind_color(self, ax: Optional[Axes], artist, role: str, setter: Union[str, Callable] = 'set_color'):
+        """Color an artist from a theme role and remember the binding for apply_theme.
+        
+        Bindings owned by an axes are dropped when that axes is reset.
+        """
+        self._color_bindings.append((ax, artist, setter, role))
+        self._apply_binding(artist, setter, self.theme_colors[role])
+        return artist
+    
+    @staticmethod
+    def _apply_binding(artist, setter: Union[str, Callable], color: str):
+        """Apply a color through a setter name or callable."""
+        if callable(setter):
+            setter(artist, color)
+        else:
+            getattr(artist, setter)(color)
+    
+    def style_axes(self, ax: Axes, title: str = "", xlabel: str = "", ylabel: str = "",
+                   title_size: int = 13, label_size: int = 11, tick_size: Optional[int] = None, grid: bool = True):
+        """Apply titles, labels and theme-bound colors to an axes."""
+        if title:
+            ax.set_title(title, fontsize=title_size, fontweight='bold', pad=15 if title_size > 12 else 10)
+        if xlabel:
+            ax.set_xlabel(xlabel, fontsize=label_size)
+        if ylabel:
+            ax.set_ylabel(ylabel, fontsize=label_size)
+        if tick_size:
+            ax.tick_params(labelsize=tick_size)
+        if grid:
+            ax.grid(True, alpha=0.2)
+        self._styled_axes[ax] = grid
+        self._style_axes_colors(ax, self.theme_colors, grid)
+    
+    @staticmethod
+    def _style_axes_colors(ax: Axes, theme_colors: dict, grid: bool = True):
+        """Recolor the standard axes decorations for a theme."""
+        ax.set_facecolor(theme_colors['BG_PRIMARY'])
+        ax.title.set_color(theme_colors['TEXT_PRIMARY'])
+        ax.xaxis.label.set_color(theme_colors['TEXT_PRIMARY'])
+        ax.yaxis.label.set_color(theme_colors['TEXT_PRIMARY'])
+        ax.tick_params(colors=theme_colors['TEXT_PRIMARY'])
+        if grid:
+            ax.tick_params(grid_color=theme_colors['BORDER'])
+        for spine in ax.spines.values():
+            spine.set_color(theme_colors['BORDER'])
+    
+    def apply_theme(self, theme_colors: dict):
+        """Recolor the figure, styled axes and bound artists, then redraw once."""
+        self.theme_colors = theme_colors
+        self.figure.set_facecolor(theme_colors['BG_PRIMARY'])
+        for ax in self.axes.values():
+            if ax in self._styled_axes:
+                self._style_axes_colors(ax, theme_colors, self._styled_axes[ax])
+            else:
+                ax.set_facecolor(theme_colors['BG_PRIMARY'])
+        for _, artist, setter, role in self._color_bindings:
+            self._apply_binding(artist, setter, theme_colors[role])
+        self.draw()
+    
+    def update_line(self, key: str, ax: Axes, x: Sequence, y: Sequence, downsample: bool = False,
+                    color_role: Optional[str] = None, **line_kwargs) -> Line2D:
+        """Set a line's data in place, blitting when the view limits are unchanged."""
+        line = self.lines.get(key)
+        created = line is None
+        if created:
+            line, = ax.plot([], [], animated=self.widget is not None, **line_kwargs)
+            self.lines[key] = line
+            self._markers[key] = line.get_marker()
+            if color_role:
+                self.bind_color(ax, line, color_role)
+        
+        old_limits = (ax.get_xlim(), ax.get_ylim())
+        if downsample:
+            self._full_data[key] = (np.asarray(x), np.asarray(y))
+            if ax not in self._zoom_axes:
+                ax.callbacks.connect('xlim_changed', self._on_xlim_changed)
+                self._zoom_axes.add(ax)
+            self._resample_line(key, None)
+        else:
+            self._full_data.pop(key, None)
+            line.set_data(x, y)
+        
+        self._resampling = True
+        try:
+            ax.set_autoscale_on(True)
+            ax.relim()
+            ax.autoscale_view()
+        finally:
+            self._resampling = False
+        
+        if created or (ax.get_xlim(), ax.get_ylim()) != old_limits:
+            self.draw()
+        else:
+            self.blit()
+        return line
+    
+    def _resample_line(self, key: str, xlim):
+        """Give a downsampled line the screen-resolution subset of its visible range."""
+        line = self.lines[key]
+        x, y = self._full_data[key]
+        if xlim is not None:
+            visible = Downsampler.visible_slice(x, *sorted(xlim))
+            x, y = x[visible], y[visible]
+        
+        indices = Downsampler.line_indices(x, y, line.axes.bbox.width)
+        if indices is None:
+            line.set_data(x, y)
+            line.set_marker(self._markers[key])
+        else:
+            # Markers on a reduced series would suggest samples that do not exist
+            line.set_data(x[indices], y[indices])
+            line.set_marker('None')
+    
+    def _on_xlim_changed(self, ax: Axes):
+        """Re-sample downsampled lines of an axes after a zoom or pan."""
+        if self._resampling:
+            return
+        for key, line in self.lines.items():
+            if key in self._full_data and line.axes is ax:
+                self._resample_line(key, ax.get_xlim())
+    
+    def enable_scroll_zoom(self, ax: Axes):
+        """Zoom the x axis with the mouse wheel; double-click resets the view."""
+        def on_scroll(event):
+            if event.inaxes is not ax or event.xdata is None:
+                return
+            scale = 0.8 if event.button == 'up' else 1.25
+            lo, hi = ax.get_xlim()
+            ax.set_xlim(event.xdata - (event.xdata - lo) * scale, event.xdata + (hi - event.xdata) * scale)
+            self.draw()
+        
+        def on_press(event):
+            if event.inaxes is ax and event.dblclick:
+                self.reset_zoom(ax)
+        
+        self.canvas.mpl_connect('scroll_event', on_scroll)
+        self.canvas.mpl_connect('button_press_event', on_press)
+    
+    def reset_zoom(self, ax: Axes):
+        """Restore the full data extent of an axes."""
+        for key, line in self.lines.items():
+            if key in self._full_data and line.axes is ax:
+                self._resample_line(key, None)
+        ax.set_autoscale_on(True)
+        ax.relim()
+        ax.autoscale_view()
+        self.draw()
+    
+    def draw(self):
+        """Request a full redraw; the cached background is refreshed afterwards."""
+        if self.widget is None:
+            # Headless figures are rasterized by whoever owns them
+            return
+        if self._draw_requested is None:
+            self._draw_requested = time.perf_counter()
+        self.canvas.draw_idle()
+    
+    def blit(self):
+        """Redraw only the animated lines on top of the cached background."""
+        if self.widget is None:
+            return
+        if self._background is None:
+            self.draw()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_animated()
+        self.canvas.blit(self.figure.bbox)
+    
+    def _draw_animated(self):
+        """Draw all animated lines onto the current renderer."""
+        for line in self.lines.values():
+            if line.axes is not None and line.get_visible():
+                line.axes.draw_artist(line)
+    
+    def _on_draw(self, event):
+        """Cache the static background after every full draw."""
+        if self.widget is None:
+            return
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_animated()
+        if self._draw_requested is not None:
+            PerfMonitor.instance().record('chart', "chart host", time.perf_counter() - self._draw_requested)
+            self._draw_requested = None
+    
+    def destroy(self):
+        """Release the figure and the Tk widget."""
+        self.hide()
+        self.figure.clear()
+        if self.widget is not None:
+            self.widget.destroy()
+        self.axes = {}
+        self.lines = {}
+        self._full_data = {}
+        self._color_bindings = []
+        self._styled_axes = {}
+        self._background = None
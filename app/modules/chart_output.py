@@ -0,0 +1,248 @@
+"""Deliver interactive plotly charts to the browser without re-embedding plotly.js."""
+
+import tempfile
+import threading
+import time
+import webbrowser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+
+VIEWER_HTML = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Data Explorer Chart</title>
+<script src="/plotly.min.js"></script>
+<style>
+html, body { margin: 0; height: 100%; font-family: sans-serif; }
+#chart { width: 100%; height: 100%; }
+#status { position: fixed; top: 8px; right: 12px; color: #888; font-size: 12px; }
+</style>
+</head>
+<body>
+<div id="status">Waiting for chart...</div>
+<div id="chart"></div>
+<script>
+let version = 0;
+const status = document.getElementById('status');
+async function poll() {
+  while (true) {
+    try {
+      const response = await fetch(`/figure?since=${version}`, {cache: 'no-store'});
+      if (response.status === 200) {
+        const update = await response.json();
+        version = update.version;
+        const title = update.figure.layout && update.figure.layout.title;
+        document.title = (title && title.text) || 'Data Explorer Chart';
+        await Plotly.react('chart', update.figure.data, update.figure.layout, {responsive: true});
+      }
+      status.textContent = '';
+    } catch (error) {
+      status.textContent = 'Data Explorer is not running';
+      await new Promise(resolve => setTimeout(resolve, 2000));
+    }
+  }
+}
+poll();
+</script>
+</body>
+</html>
+"""
+
+
+class ChartFiles:
+    """Standalone chart HTML files that share one plotly.js file.
+
+    Every chart links ``plotly-<version>.min.js`` in the same directory
+    instead of embedding the ~3.5 MB bundle, so a file costs only its figure
+    data. Old chart files are deleted on each write.
+    """
+    
+    DIRECTORY = Path(tempfile.gettempdir()) / "data-explorer-charts"
+    
+    # Chart files kept, and the age after which any chart file is deleted
+    MAX_FILES = 20
+    MAX_AGE_SECONDS = 24 * 3600
+    
+    @staticmethod
+    def plotly_asset() -> Path:
+        """The shared plotly.js file for the installed plotly version, written once."""
+        import plotly
+        from plotly.offline import get_plotlyjs
+        
+        ChartFiles.DIRECTORY.mkdir(parents=True, exist_ok=True)
+        asset = ChartFiles.DIRECTORY / f"plotly-{plotly.__version__}.min.js"
+        if not asset.exists():
+            # Write under a temporary name so a reader never sees a partial file
+            partial = asset.with_suffix(f".{threading.get_ident()}.part")
+            partial.write_text(get_plotlyjs(), encoding='utf-8')
+            partial.replace(asset)
+        return asset
+    
+    @staticmethod
+    def write(fig) -> Path:
+        """Write a figure as HTML linking the shared plotly.js; returns the file path."""
+        asset = ChartFiles.plotly_asset()
+        ChartFiles.collect_garbage(keep=ChartFiles.MAX_FILES - 1)
+        path = ChartFiles.DIRECTORY / f"chart-{time.time_ns()}.html"
+        fig.write_html(str(path), include_plotlyjs=asset.name, full_html=True)
+        return path
+    
+    @staticmethod
+    def collect_garbage(keep: int = MAX_FILES, max_age: float = MAX_AGE_SECONDS) -> int:
+        """Delete chart files beyond the newest ``keep`` or older than ``max_age``; returns the count."""
+        if not ChartFiles.DIRECTORY.exists():
+            return 0
+        
+        charts = []
+        for path in ChartFiles.DIRECTORY.glob("chart-*.html"):
+            try:
+                charts.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+        charts.sort(reverse=True)
+        
+        cutoff = time.time() - max_age
+        removed = 0
+        for index, (modified, path) in enumerate(charts):
+            if index >= keep or modified < cutoff:
+                path.unlink(missing_ok=True)
+                removed += 1
+        
+        # plotly.js bundles left behind by other plotly versions
+        try:
+            import plotly
+            current = f"plotly-{plotly.__version__}.min.js"
+            for path in ChartFiles.DIRECTORY.glob("plotly-*.min.js"):
+                if path.name != current:
+                    path.unlink(missing_ok=True)
+                    removed += 1
+        except ImportError:
+            pass
+        return removed
+
+
+class ChartServer:
+    """A local HTTP server that shows the latest chart in one reusable browser tab.
+
+    The viewer page loads plotly.js once and long-polls ``/figure`` for the
+    next figure's JSON, redrawing in place with ``Plotly.react``. ``show``
+    only opens a browser tab when no viewer is connected, so successive
+    charts replace each other instead of piling up tabs and files.
+    """
+    
+    # How long a /figure request waits for a new chart before returning empty
+    LONG_POLL_SECONDS = 25
+    
+    # A viewer that has not polled for this long is treated as closed; also
+    # the grace period for a freshly opened tab to connect
+    VIEWER_TIMEOUT_SECONDS = 5
+    
+    _instance: Optional['ChartServer'] = None
+    
+    def __init__(self):
+        self._condition = threading.Condition()
+        self.version = 0
+        self.figure_json = "null"
+        self.waiting = 0
+        self.last_poll = 0.0
+        self.plotly_js = ChartFiles.plotly_asset().read_bytes()
+        
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                if url.path == '/':
+                    self.send_body(VIEWER_HTML.encode('utf-8'), 'text/html; charset=utf-8')
+                elif url.path == '/plotly.min.js':
+                    self.send_body(server.plotly_js, 'application/javascript', cache=True)
+                elif url.path == '/figure':
+                    since = int(parse_qs(url.query).get('since', ['0'])[0])
+                    update = server.next_figure(since)
+                    if update is None:
+                        self.send_response(204)
+                        self.end_headers()
+                    else:
+                        self.send_body(update.encode('utf-8'), 'application/json')
+                else:
+                    self.send_error(404)
+            
+            def send_body(self, body: bytes, content_type: str, cache: bool = False):
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('Cache-Control', 'max-age=86400' if cache else 'no-store')
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+    
+    @classmethod
+    def instance(cls) -> 'ChartServer':
+        """The application-wide server, started on first use."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
+    def next_figure(self, since: int) -> Optional[str]:
+        """Block until a figure other than ``since`` is published; None on timeout.
+
+        Any other version counts, so a tab left open from an earlier run picks
+        up this server's first chart.
+        """
+        with self._condition:
+            self.waiting += 1
+            try:
+                self._condition.wait_for(lambda: self.version != since, timeout=self.LONG_POLL_SECONDS)
+                if self.version == since:
+                    return None
+                return f'{{"version": {self.version}, "figure": {self.figure_json}}}'
+            finally:
+                self.waiting -= 1
+                self.last_poll = time.monotonic()
+    
+    def viewer_connected(self) -> bool:
+        """Whether a viewer tab is polling (or was between polls just now)."""
+        with self._condition:
+            return self.waiting > 0 or time.monotonic() - self.last_poll < self.VIEWER_TIMEOUT_SECONDS
+    
+    def show(self, fig) -> bool:
+        """Publish a figure (or its JSON) to the viewer; returns True if a new tab was opened."""
+        figure_json = fig if isinstance(fig, str) else fig.to_json()
+        with self._condition:
+            self.figure_json = figure_json
+            self.version += 1
+            self._condition.notify_all()
+        if self.viewer_connected():
+            return False
+        with self._condition:
+            self.last_poll = time.monotonic()
+        webbrowser.open(self.url)
+        return True
+    
+    @staticmethod
+    def publish(fig) -> str:
+        """Show a figure (or its JSON) in the reusable tab, or as a chart file if the server cannot start.
+
+        Returns "opened", "updated" or "file".
+        """
+        try:
+            server = ChartServer.instance()
+        except OSError:
+            if isinstance(fig, str):
+                import plotly.io as pio
+                fig = pio.from_json(fig)
+            path = ChartFiles.write(fig)
+            webbrowser.open(path.as_uri())
+            return "file"
+        return "opened" if server.show(fig) else "updated"
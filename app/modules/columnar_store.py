@@ -0,0 +1,554 @@
+"""Memory-mapped columnar storage for files larger than memory."""
+
+import hashlib
+import json
+import mmap
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+import numpy as np
+import pandas as pd
+
+from app.modules.file_loader import FileLoader
+from app.modules.json_flattener import JsonFlattener
+from app.modules.profiler import DatasetProfiler, SpaceSaving
+
+
+class ColumnWriter:
+    """Append-only writer for one stored column.
+
+    ``float`` columns are raw little-endian float64 values with NaN for
+    missing entries. ``text`` columns use an Arrow-style layout: UTF-8 bytes
+    in ``.bin``, int64 end offsets in ``.off`` and a uint8 validity mask in
+    ``.valid``. A float column that meets a non-numeric value is widened to
+    text (``widen``) rather than storing the value as missing.
+    """
+    
+    def __init__(self, directory: Path, file_id: str, kind: str):
+        self.kind = kind
+        self.directory = directory
+        self.file_id = file_id
+        self.end = 0
+        if kind == 'float':
+            self.values = open(directory / f"{file_id}.f8", 'wb')
+        else:
+            self.data = open(directory / f"{file_id}.bin", 'wb')
+            self.offsets = open(directory / f"{file_id}.off", 'wb')
+            self.valid = open(directory / f"{file_id}.valid", 'wb')
+            self.offsets.write(np.zeros(1, dtype='<i8').tobytes())
+    
+    def append(self, series: pd.Series):
+        """Append one chunk of values."""
+        present = series.notna().to_numpy()
+        if self.kind == 'float':
+            values = pd.to_numeric(series, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+            self.values.write(values.astype('<f8').tobytes())
+            return
+        
+        encoded = series.astype(str).where(present, "").str.encode('utf-8')
+        lengths = encoded.str.len().to_numpy(dtype=np.int64)
+        ends = self.end + np.cumsum(lengths)
+        self.data.write(b"".join(encoded.tolist()))
+        self.offsets.write(ends.astype('<i8').tobytes())
+        self.valid.write(present.astype(np.uint8).tobytes())
+        if len(ends):
+            self.end = int(ends[-1])
+    
+    def fits(self, series: pd.Series) -> bool:
+        """Whether a chunk can be appended without turning values into missing ones."""
+        if self.kind != 'float' or (pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype)):
+            return True
+        values = pd.to_numeric(series, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+        return not np.any(series.notna().to_numpy() & np.isnan(values))
+    
+    def widen(self) -> 'ColumnWriter':
+        """Rewrite this float column as text; returns the writer that replaces it."""
+        self.values.close()
+        path = self.directory / f"{self.file_id}.f8"
+        text = ColumnWriter(self.directory, self.file_id, 'text')
+        with open(path, 'rb') as f:
+            while True:
+                block = f.read(ColumnarStore.SCAN_ROWS * 8)
+                if not block:
+                    break
+                values = pd.Series(np.frombuffer(block, dtype='<f8'))
+                # Whole numbers read back as "3", not "3.0", like the source text
+                integral = values.notna() & (values % 1 == 0) & (values.abs() < 2 ** 63)
+                formatted = values.astype(object)
+                formatted[integral] = values[integral].astype(np.int64).astype(str)
+                formatted[~integral & values.notna()] = values[~integral & values.notna()].astype(str)
+                text.append(formatted)
+        path.unlink()
+        return text
+    
+    def append_missing(self, count: int):
+        """Append ``count`` missing values (rows from chunks without this column)."""
+        if count <= 0:
+            return
+        if self.kind == 'float':
+            self.values.write(np.full(count, np.nan, dtype='<f8').tobytes())
+        else:
+            self.offsets.write(np.full(count, self.end, dtype='<i8').tobytes())
+            self.valid.write(np.zeros(count, dtype=np.uint8).tobytes())
+    
+    def close(self):
+        """Flush and close the column files."""
+        handles = [self.values] if self.kind == 'float' else [self.data, self.offsets, self.valid]
+        for handle in handles:
+            handle.close()
+
+
+class ColumnarStore:
+    """A file converted once into memory-mapped columns and scanned in row groups.
+
+    Conversion streams the source through ``FileLoader`` chunk by chunk, so
+    neither conversion nor any later scan holds more than one row group in
+    memory. Numeric columns are stored as float64 (widened to text if a later
+    chunk holds text); everything else as text.
+    Random access (``take``) reads only the requested rows, which is what
+    the virtual table needs, and whole-column work (profiling, value counts,
+    histograms) iterates ``SCAN_ROWS`` rows at a time.
+    """
+    
+    # Rows read per scanned row group
+    SCAN_ROWS = 1_000_000
+    # Rows sampled for point charts (line, scatter, correlation)
+    CHART_ROWS = 200_000
+    # Values tracked for approximate value counts of high-cardinality columns
+    VALUE_COUNT_CAPACITY = 1_000
+    # Files larger than this share of available memory are loaded out of core
+    MEMORY_FRACTION = 0.25
+    # Threshold used when available memory cannot be determined
+    FALLBACK_BYTES = 2 * 1024 ** 3
+    # Bump when the on-disk layout changes so stale stores are rebuilt
+    FORMAT_VERSION = 2
+    # Disk space kept for cached stores, and the age after which an unused store is deleted
+    CACHE_MAX_BYTES = 20 * 1024 ** 3
+    CACHE_MAX_AGE_SECONDS = 7 * 24 * 3600
+    # Unfinished writes older than this were left by a process that died
+    PARTIAL_MAX_AGE_SECONDS = 24 * 3600
+    
+    # Running total of cached store bytes, kept by write_chunks and collect_garbage
+    _cache_total: Optional[int] = None
+    _cache_lock = threading.Lock()
+    
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+        try:
+            with open(self.directory / "meta.json", 'r', encoding='utf-8') as f:
+                self.meta = json.load(f)
+        except Exception as e:
+            raise Exception(f"Error opening columnar store {directory}: {str(e)}")
+        
+        self.rows: int = self.meta['rows']
+        self.kinds: Dict[str, str] = {column['name']: column['kind'] for column in self.meta['columns']}
+        self.file_ids: Dict[str, str] = {column['name']: column['file'] for column in self.meta['columns']}
+        self._arrays: Dict[str, Dict[str, Any]] = {}
+    
+    def __len__(self) -> int:
+        return self.rows
+    
+    @property
+    def columns(self) -> List[str]:
+        """Column names in source order."""
+        return list(self.kinds)
+    
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.rows, len(self.kinds)
+    
+    @property
+    def dtypes(self) -> Dict[str, str]:
+        """dtype of each column as returned by reads."""
+        return {col: 'float64' if kind == 'float' else 'object' for col, kind in self.kinds.items()}
+    
+    @property
+    def numeric_columns(self) -> List[str]:
+        return [col for col, kind in self.kinds.items() if kind == 'float']
+    
+    @staticmethod
+    def available_memory() -> Optional[int]:
+        """Available physical memory in bytes, when the platform reports it."""
+        for pages in ('SC_AVPHYS_PAGES', 'SC_PHYS_PAGES'):
+            try:
+                return os.sysconf(pages) * os.sysconf('SC_PAGE_SIZE')
+            except (AttributeError, ValueError, OSError):
+                continue
+        return None
+    
+    @staticmethod
+    def should_use(file_path: Union[str, Path]) -> bool:
+        """Whether a file is too large to load comfortably as a DataFrame."""
+        size = os.path.getsize(file_path)
+        available = ColumnarStore.available_memory()
+        if available is None:
+            return size > ColumnarStore.FALLBACK_BYTES
+        return size > available * ColumnarStore.MEMORY_FRACTION
+    
+    @staticmethod
+    def store_dir_for(file_path: Union[str, Path]) -> Path:
+        """Cache directory for a source file, keyed by its path, size and mtime."""
+        stat = os.stat(file_path)
+        key = f"{os.path.abspath(file_path)}|{stat.st_size}|{stat.st_mtime_ns}|{ColumnarStore.FORMAT_VERSION}"
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+        return ColumnarStore.cache_root() / digest
+    
+    @staticmethod
+    def cache_root() -> Path:
+        """Directory holding every cached store."""
+        return Path(tempfile.gettempdir()) / "data-explorer-stores"
+    
+    @staticmethod
+    def cache_bytes() -> int:
+        """Disk space used by the cached stores, measured by walking the cache."""
+        total = ColumnarStore.directory_bytes(ColumnarStore.cache_root())
+        ColumnarStore.set_tracked_bytes(total)
+        return total
+    
+    @staticmethod
+    def tracked_cache_bytes() -> Optional[int]:
+        """The running total of cached store bytes without touching the disk.
+
+        None until a write or garbage collection has measured the cache in
+        this process; cheap enough to poll from the Tk thread.
+        """
+        with ColumnarStore._cache_lock:
+            return ColumnarStore._cache_total
+    
+    @staticmethod
+    def set_tracked_bytes(total: int, added: bool = False):
+        """Replace the running total, or add to it when it is known and ``added`` is set."""
+        with ColumnarStore._cache_lock:
+            if not added:
+                ColumnarStore._cache_total = total
+            elif ColumnarStore._cache_total is not None:
+                ColumnarStore._cache_total += total
+    
+    @staticmethod
+    def directory_bytes(directory: Path) -> int:
+        """Total size of the files under a directory."""
+        total = 0
+        for root, _, files in os.walk(directory):
+            for name in files:
+                try:
+                    total += os.path.getsize(os.path.join(root, name))
+                except OSError:
+                    continue  # Removed while walking
+        return total
+    
+    @staticmethod
+    def collect_garbage(max_bytes: int = CACHE_MAX_BYTES, max_age: float = CACHE_MAX_AGE_SECONDS) -> int:
+        """Delete stores beyond ``max_bytes`` (least recently used first) or unused for ``max_age``.
+
+        The most recently used store is always kept. Returns the number of
+        directories removed, including abandoned unfinished writes.
+        """
+        root = ColumnarStore.cache_root()
+        if not root.exists():
+            ColumnarStore.set_tracked_bytes(0)
+            return 0
+        
+        now = time.time()
+        stores = []
+        removed = 0
+        for path in root.iterdir():
+            try:
+                if path.name.endswith(".part"):
+                    if path.stat().st_mtime < now - ColumnarStore.PARTIAL_MAX_AGE_SECONDS:
+                        shutil.rmtree(path, ignore_errors=True)
+                        removed += 1
+                    continue
+                # open_cached touches meta.json, so its mtime is the last use
+                stores.append(((path / "meta.json").stat().st_mtime, path))
+            except OSError:
+                continue  # Being replaced, or left without meta.json by an old version
+        stores.sort(reverse=True)
+        
+        used = kept = 0
+        for index, (last_used, path) in enumerate(stores):
+            size = ColumnarStore.directory_bytes(path)
+            used += size
+            if index > 0 and (used > max_bytes or last_used < now - max_age):
+                shutil.rmtree(path, ignore_errors=True)
+                removed += 1
+            else:
+                kept += size
+        ColumnarStore.set_tracked_bytes(kept)
+        return removed
+    
+    @staticmethod
+    def open_cached(file_path: Union[str, Path]) -> Optional['ColumnarStore']:
+        """The previously converted store of a file, if it is still current."""
+        return ColumnarStore.open_directory(ColumnarStore.store_dir_for(file_path))
+    
+    @staticmethod
+    def open_directory(directory: Path) -> Optional['ColumnarStore']:
+        """The complete store in a cache directory, or None if there is none."""
+        if not (directory / "meta.json").exists():
+            return None
+        try:
+            store = ColumnarStore(directory)
+            # Mark the store as recently used for collect_garbage
+            os.utime(directory / "meta.json")
+            return store
+        except Exception:
+            return None
+    
+    @staticmethod
+    def convert(file_path: Union[str, Path], directory: Optional[Union[str, Path]] = None) -> Iterator[Tuple[int, int]]:
+        """Convert a CSV/JSON/JSONL file into a store, yielding (rows written, bytes read).
+
+        A column's kind is set by the first chunk it appears in: numeric
+        columns are stored as float64, all others as text. A numeric column
+        that later meets a non-numeric value is widened to text, so no value
+        is lost to the schema. Nested JSON is flattened to dotted columns;
+        arrays of objects are not exploded into child tables in this mode. ``meta.json`` is written last, so an
+        interrupted conversion is never mistaken for a complete store.
+        """
+        directory = Path(directory) if directory is not None else ColumnarStore.store_dir_for(file_path)
+        
+        flattener = None
+        if FileLoader.detect_file_type(file_path) in ('json', 'jsonl'):
+            flattener = JsonFlattener.for_file(file_path)
+        
+        def chunks():
+            for chunk, bytes_read in FileLoader.iter_file_chunks(file_path, flattener=flattener):
+                if flattener is not None:
+                    # Child tables would grow without bound; only counts are kept
+                    flattener.children.clear()
+                yield chunk, bytes_read
+        
+        yield from ColumnarStore.write_chunks(chunks(), directory, file_path)
+    
+    @staticmethod
+    def write_frame(data: pd.DataFrame, file_path: Union[str, Path], directory: Optional[Union[str, Path]] = None,
+                    extra: Optional[Dict[str, Any]] = None) -> Path:
+        """Store an already loaded DataFrame as the cached conversion of its source file.
+
+        Lets a file parsed in memory be reopened later with ``open_cached``
+        without parsing it again. ``extra`` is JSON-serializable state kept
+        in ``meta.json`` alongside the columns. Returns the store directory.
+        """
+        directory = Path(directory) if directory is not None else ColumnarStore.store_dir_for(file_path)
+        chunks = ((data.iloc[start:start + ColumnarStore.SCAN_ROWS], 0) for start in range(0, len(data), ColumnarStore.SCAN_ROWS))
+        for _ in ColumnarStore.write_chunks(chunks, directory, file_path, extra):
+            pass
+        return directory
+    
+    @staticmethod
+    def write_chunks(chunks: Iterator[Tuple[pd.DataFrame, int]], directory: Path, file_path: Union[str, Path],
+                     extra: Optional[Dict[str, Any]] = None) -> Iterator[Tuple[int, int]]:
+        """Write (chunk, bytes read) pairs as a store, yielding (rows written, bytes read).
+
+        Columns go to a ``.part`` sibling of ``directory`` that only this
+        writer uses, which is renamed to ``directory`` once ``meta.json`` is
+        written. Two writers of the same store (a background cache write and
+        an out-of-core conversion) therefore never touch each other's files;
+        the first to finish wins.
+        """
+        ColumnarStore.collect_garbage()
+        directory.parent.mkdir(parents=True, exist_ok=True)
+        partial = directory.with_name(f"{directory.name}.{os.getpid()}-{threading.get_ident()}.part")
+        shutil.rmtree(partial, ignore_errors=True)
+        partial.mkdir()
+        
+        try:
+            writers: Dict[str, ColumnWriter] = {}
+            rows = 0
+            try:
+                for chunk, bytes_read in chunks:
+                    for position, col in enumerate(chunk.columns):
+                        col = str(col)
+                        series = chunk.iloc[:, position]
+                        writer = writers.get(col)
+                        if writer is None:
+                            numeric = pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype)
+                            writer = ColumnWriter(partial, f"c{len(writers)}", 'float' if numeric else 'text')
+                            writer.append_missing(rows)
+                            writers[col] = writer
+                        elif not writer.fits(series):
+                            writer = writers[col] = writer.widen()
+                        writer.append(series)
+                    
+                    present = {str(col) for col in chunk.columns}
+                    for col, writer in writers.items():
+                        if col not in present:
+                            writer.append_missing(len(chunk))
+                    
+                    rows += len(chunk)
+                    yield rows, bytes_read
+            finally:
+                for writer in writers.values():
+                    writer.close()
+            
+            meta = {
+                'version': ColumnarStore.FORMAT_VERSION,
+                'source': os.path.abspath(file_path),
+                'rows': rows,
+                'columns': [
+                    {'name': col, 'kind': writer.kind, 'file': writer.file_id}
+                    for col, writer in writers.items()
+                ],
+                'extra': extra or {},
+            }
+            with open(partial / "meta.json", 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+            
+            size = ColumnarStore.directory_bytes(partial)
+            try:
+                os.replace(partial, directory)
+            except OSError:
+                # Another writer finished first; its store describes the same source
+                if (directory / "meta.json").exists():
+                    return
+                shutil.rmtree(directory, ignore_errors=True)
+                os.replace(partial, directory)
+            ColumnarStore.set_tracked_bytes(size, added=True)
+        finally:
+            shutil.rmtree(partial, ignore_errors=True)
+    
+    def arrays(self, col: str) -> Dict[str, Any]:
+        """Memory maps of a column's files, opened on first use."""
+        arrays = self._arrays.get(col)
+        if arrays is not None:
+            return arrays
+        
+        base = self.directory / self.file_ids[col]
+        if self.kinds[col] == 'float':
+            arrays = {'values': self.map_array(f"{base}.f8", '<f8', self.rows)}
+        else:
+            arrays = {
+                'offsets': self.map_array(f"{base}.off", '<i8', self.rows + 1),
+                'valid': self.map_array(f"{base}.valid", np.uint8, self.rows),
+                'data': self.map_bytes(f"{base}.bin"),
+            }
+        self._arrays[col] = arrays
+        return arrays
+    
+    @staticmethod
+    def map_array(path: str, dtype, length: int) -> np.ndarray:
+        """Read-only memory map of a fixed-width array file."""
+        if length == 0:
+            return np.zeros(0, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode='r', shape=(length,))
+    
+    @staticmethod
+    def map_bytes(path: str) -> Union[mmap.mmap, bytes]:
+        """Read-only memory map of a text data file."""
+        if os.path.getsize(path) == 0:
+            return b""
+        with open(path, 'rb') as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    def read_column(self, col: str, rows: Union[slice, np.ndarray]) -> pd.Series:
+        """Values of one column for a row slice or an array of row positions."""
+        arrays = self.arrays(col)
+        if isinstance(rows, slice):
+            start, stop, _ = rows.indices(self.rows)
+            rows = slice(start, stop)
+            index = pd.RangeIndex(start, stop)
+        else:
+            rows = index = np.asarray(rows, dtype=np.int64)
+        if self.kinds[col] == 'float':
+            return pd.Series(np.asarray(arrays['values'][rows]), index=index, name=col)
+        
+        offsets = arrays['offsets']
+        if isinstance(rows, slice):
+            ends = np.asarray(offsets[start + 1:stop + 1])
+            starts = np.asarray(offsets[start:stop])
+        else:
+            ends = np.asarray(offsets[rows + 1])
+            starts = np.asarray(offsets[rows])
+        valid = np.asarray(arrays['valid'][rows]).astype(bool)
+        
+        data = arrays['data']
+        values = [data[s:e].decode('utf-8') if ok else None for s, e, ok in zip(starts.tolist(), ends.tolist(), valid.tolist())]
+        return pd.Series(values, index=index, name=col, dtype=object)
+    
+    def take(self, positions: np.ndarray, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Rows at the given positions as a DataFrame indexed by position."""
+        positions = np.asarray(positions, dtype=np.int64)
+        columns = self.columns if columns is None else columns
+        return pd.DataFrame({col: self.read_column(col, positions) for col in columns}, index=positions, columns=columns)
+    
+    def iter_column(self, col: str, positions: Optional[np.ndarray] = None, chunk_rows: int = SCAN_ROWS) -> Iterator[pd.Series]:
+        """Scan one column (or the given sorted positions of it) in row groups."""
+        if positions is None:
+            for start in range(0, self.rows, chunk_rows):
+                yield self.read_column(col, slice(start, min(start + chunk_rows, self.rows)))
+        else:
+            for start in range(0, len(positions), chunk_rows):
+                yield self.read_column(col, positions[start:start + chunk_rows])
+    
+    def iter_chunks(self, columns: Optional[List[str]] = None, chunk_rows: int = SCAN_ROWS) -> Iterator[pd.DataFrame]:
+        """Scan whole rows in row groups of ``chunk_rows``, indexed by position."""
+        columns = self.columns if columns is None else columns
+        for start in range(0, self.rows, chunk_rows):
+            rows = slice(start, min(start + chunk_rows, self.rows))
+            yield pd.DataFrame({col: self.read_column(col, rows) for col in columns}, columns=columns)
+    
+    def profile(self, sample: Optional[bool] = None) -> Dict[str, Any]:
+        """Profile every column like ``DatasetProfiler.profile``, one row group at a time."""
+        if sample is None:
+            sample = self.rows > DatasetProfiler.SAMPLE_THRESHOLD
+        sampled = bool(sample) and self.rows > DatasetProfiler.SAMPLE_ROWS
+        positions = None
+        if sampled:
+            positions = DatasetProfiler.sample_positions(self.rows, DatasetProfiler.SAMPLE_ROWS)
+        
+        profiles = {}
+        for col, kind in self.kinds.items():
+            profiles[col] = DatasetProfiler.profile_chunks(
+                self.iter_column(col, positions, DatasetProfiler.CHUNK_ROWS),
+                self.dtypes[col], self.rows,
+                numeric=kind == 'float',
+                track_top=kind == 'text'
+            )
+        
+        return {
+            'rows': self.rows,
+            'sampled': sampled,
+            'sample_rows': len(positions) if sampled else self.rows,
+            'confidence': 0.95,
+            'columns': profiles,
+        }
+    
+    def value_counts(self, col: str, top: int = 20) -> pd.Series:
+        """Most frequent values of a column, scanned with a bounded summary.
+
+        Counts are exact while the column has at most ``VALUE_COUNT_CAPACITY``
+        distinct values and upper bounds (space-saving) beyond that.
+        """
+        summary = SpaceSaving(self.VALUE_COUNT_CAPACITY)
+        for chunk in self.iter_column(col):
+            summary.update(chunk.value_counts(sort=True))
+        entries = summary.top(top)
+        return pd.Series([count for _, count, _ in entries], index=[value for value, _, _ in entries], name=col)
+    
+    def histogram(self, col: str, bins: int = 30) -> Tuple[np.ndarray, np.ndarray]:
+        """Exact (counts, bin edges) of a numeric column in two scans."""
+        minimum, maximum = np.inf, -np.inf
+        for chunk in self.iter_column(col):
+            values = chunk.dropna().to_numpy()
+            if len(values):
+                minimum, maximum = min(minimum, values.min()), max(maximum, values.max())
+        if not np.isfinite(minimum):
+            return np.zeros(bins, dtype=np.int64), np.linspace(0, 1, bins + 1)
+        
+        edges = np.histogram_bin_edges([minimum, maximum], bins=bins)
+        counts = np.zeros(bins, dtype=np.int64)
+        for chunk in self.iter_column(col):
+            counts += np.histogram(chunk.dropna().to_numpy(), bins=edges)[0]
+        return counts, edges
+    
+    def sample_frame(self, columns: List[str], max_rows: int = CHART_ROWS) -> pd.DataFrame:
+        """Evenly spaced rows (in source order) of some columns, for point charts."""
+        if self.rows <= max_rows:
+            positions = np.arange(self.rows)
+        else:
+            positions = np.unique(np.linspace(0, self.rows - 1, max_rows).astype(np.int64))
+        return self.take(positions, columns)
@@ -0,0 +1,177 @@
+"""Pearson correlation of wide numeric tables via blocked matrix products."""
+
+import math
+from statistics import NormalDist
+from typing import List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+
+class CorrelationEngine:
+    """Correlation matrices, strongest pairs and clustered orderings.
+
+    The matrix is computed from column-centered values with one BLAS-backed
+    product ``Xc.T @ Xc`` per block of rows, plus the mask products that
+    give pandas' pairwise-complete semantics when values are missing. Rows
+    are processed in blocks of about ``BLOCK_ELEMENTS`` values, so memory
+    stays bounded however long the table is. Passing ``tolerance`` samples
+    just enough rows for that accuracy instead of reading every row.
+    """
+    
+    # Values converted to float64 per row block
+    BLOCK_ELEMENTS = 8_000_000
+    
+    # Columns shown in a heatmap, and the most that still get per-cell labels
+    HEATMAP_COLUMNS = 50
+    ANNOTATE_COLUMNS = 25
+    
+    # Above this many columns, ordering uses a greedy chain instead of average linkage
+    LINKAGE_COLUMNS = 400
+    
+    @staticmethod
+    def rows_for_accuracy(tolerance: float, confidence: float = 0.95) -> int:
+        """Rows needed so each coefficient is within ``tolerance`` at ``confidence``.
+
+        Uses the Fisher z standard error 1/sqrt(n - 3), which bounds the error
+        of r (largest near r = 0).
+        """
+        z = NormalDist().inv_cdf((1 + confidence) / 2)
+        return int(math.ceil((z / tolerance) ** 2)) + 3
+    
+    @staticmethod
+    def sample(data: pd.DataFrame, rows: int, seed: int = 0) -> pd.DataFrame:
+        """A uniform random sample of rows (in table order), or the table if smaller."""
+        if len(data) <= rows:
+            return data
+        positions = np.sort(np.random.default_rng(seed).choice(len(data), rows, replace=False))
+        return data.iloc[positions]
+    
+    @staticmethod
+    def matrix(data: pd.DataFrame, columns: Optional[List[str]] = None, tolerance: Optional[float] = None) -> pd.DataFrame:
+        """Pearson correlation of numeric columns, matching ``DataFrame.corr()``.
+
+        Missing values are excluded pairwise. With ``tolerance`` (e.g. 0.01)
+        the matrix is computed from a random sample of
+        ``rows_for_accuracy(tolerance)`` rows.
+        """
+        columns = list(columns) if columns is not None else list(data.columns)
+        frame = data[columns]
+        if tolerance is not None:
+            frame = CorrelationEngine.sample(frame, CorrelationEngine.rows_for_accuracy(tolerance))
+        
+        p = len(columns)
+        # Centering on the column means keeps the single-pass sums numerically stable
+        means = frame.mean(numeric_only=False).to_numpy(dtype=np.float64, na_value=np.nan)
+        means = np.nan_to_num(means)
+        
+        products = np.zeros((p, p))
+        pairs = np.zeros((p, p))
+        sums = np.zeros((p, p))
+        squares = np.zeros((p, p))
+        block_rows = max(1, CorrelationEngine.BLOCK_ELEMENTS // max(p, 1))
+        
+        for start in range(0, len(frame), block_rows):
+            block = frame.iloc[start:start + block_rows].to_numpy(dtype=np.float64, na_value=np.nan) - means
+            valid = ~np.isnan(block)
+            if valid.all():
+                products += block.T @ block
+                pairs += len(block)
+                sums += block.sum(axis=0)[:, None]
+                squares += (block * block).sum(axis=0)[:, None]
+            else:
+                block = np.where(valid, block, 0.0)
+                mask = valid.astype(np.float64)
+                products += block.T @ block
+                pairs += mask.T @ mask
+                sums += block.T @ mask
+                squares += (block * block).T @ mask
+        
+        # Entry (i, j) of sums/squares covers column i over rows where j is present
+        with np.errstate(divide='ignore', invalid='ignore'):
+            covariance = products - sums * sums.T / pairs
+            variance_i = squares - sums * sums / pairs
+            variance_j = variance_i.T
+            corr = covariance / np.sqrt(variance_i * variance_j)
+        corr[(pairs < 2) | (variance_i <= 0) | (variance_j <= 0)] = np.nan
+        corr = np.clip(corr, -1.0, 1.0)
+        # Columns with fewer than two values or no variance correlate with nothing
+        defined = (np.diag(pairs) >= 2) & (np.diag(variance_i) > 0)
+        np.fill_diagonal(corr, 1.0)
+        corr[~defined, :] = np.nan
+        corr[:, ~defined] = np.nan
+        return pd.DataFrame(corr, index=columns, columns=columns)
+    
+    @staticmethod
+    def top_pairs(corr: pd.DataFrame, k: int = 10) -> List[Tuple[str, str, float]]:
+        """The ``k`` column pairs with the largest absolute correlation, strongest first."""
+        values = corr.to_numpy()
+        rows, cols = np.triu_indices(len(values), 1)
+        strengths = np.abs(values[rows, cols])
+        strengths = np.where(np.isnan(strengths), -1.0, strengths)
+        k = min(k, len(strengths))
+        if k == 0:
+            return []
+        best = np.argpartition(-strengths, k - 1)[:k]
+        best = best[np.argsort(-strengths[best], kind='stable')]
+        names = corr.columns
+        return [(names[rows[i]], names[cols[i]], float(values[rows[i], cols[i]])) for i in best if strengths[i] >= 0]
+    
+    @staticmethod
+    def clustered_order(corr: pd.DataFrame) -> List[str]:
+        """Column order that places strongly correlated columns next to each other.
+
+        Average-linkage clustering on the distance 1 - |r|, reading the
+        merged clusters' leaves in order. Wider matrices use a greedy chain
+        (each next column is the one most correlated with the last).
+        """
+        names = list(corr.columns)
+        p = len(names)
+        if p < 3:
+            return names
+        distance = 1.0 - np.abs(np.nan_to_num(corr.to_numpy(dtype=np.float64), nan=0.0))
+        
+        if p > CorrelationEngine.LINKAGE_COLUMNS:
+            remaining = np.ones(p, dtype=bool)
+            current = int(np.argmin(distance.sum(axis=1)))
+            order = [current]
+            remaining[current] = False
+            for _ in range(p - 1):
+                candidates = np.where(remaining, distance[current], np.inf)
+                current = int(np.argmin(candidates))
+                order.append(current)
+                remaining[current] = False
+            return [names[i] for i in order]
+        
+        np.fill_diagonal(distance, np.inf)
+        sizes = np.ones(p)
+        leaves = [[i] for i in range(p)]
+        a = 0
+        for _ in range(p - 1):
+            a, b = divmod(int(np.argmin(distance)), p)
+            if a > b:
+                a, b = b, a
+            merged = (sizes[a] * distance[a] + sizes[b] * distance[b]) / (sizes[a] + sizes[b])
+            distance[a, :] = merged
+            distance[:, a] = merged
+            distance[b, :] = np.inf
+            distance[:, b] = np.inf
+            distance[a, a] = np.inf
+            leaves[a] = leaves[a] + leaves[b]
+            sizes[a] += sizes[b]
+        return [names[i] for i in leaves[a]]
+    
+    @staticmethod
+    def select_columns(corr: pd.DataFrame, max_columns: int = HEATMAP_COLUMNS) -> List[str]:
+        """The columns to draw: all if few enough, else those in the strongest pairs, clustered."""
+        if len(corr.columns) <= max_columns:
+            return CorrelationEngine.clustered_order(corr)
+        
+        selected = {}
+        for left, right, _ in CorrelationEngine.top_pairs(corr, max_columns * max_columns):
+            selected.setdefault(left, None)
+            if len(selected) < max_columns:
+                selected.setdefault(right, None)
+            if len(selected) >= max_columns:
+                break
+        subset = list(selected)
+        return CorrelationEngine.clustered_order(corr.loc[subset, subset])
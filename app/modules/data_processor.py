@@ -1,41 +1,176 @@
 """Data processing utilities for data analysis and transformation."""
 
+import importlib.util
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Tuple, Union, TYPE_CHECKING
+from app.modules.profiler import DatasetProfiler
+from app.modules.json_flattener import JsonFlattener
+from app.modules.correlation import CorrelationEngine
+from app.utils.formatting import format_bytes
+
+if TYPE_CHECKING:
+    from app.modules.columnar_store import ColumnarStore
 
 
 class DataProcessor:
     """Utility class for data processing and analysis."""
     
+    # Text columns with at most this share of distinct values become categories
+    CATEGORY_RATIO = 0.5
+    # Arrow-backed strings are used for the remaining text columns when pyarrow is installed
+    ARROW_STRINGS = importlib.util.find_spec('pyarrow') is not None
+    
+    @staticmethod
+    def get_dataframe_info(df: pd.DataFrame, sample: Optional[bool] = None) -> Dict[str, Any]:
+        """Get comprehensive information about a DataFrame.
+        
+        Statistics come from a single profiling pass per column (see
+        DatasetProfiler); large frames are sampled unless ``sample`` is False.
+        """
+        profile = DatasetProfiler.profile(df, sample=sample)
+        return DataProcessor.info_from_profile(
+            profile,
+            {col: str(dtype) for col, dtype in df.dtypes.items()},
+            DataProcessor.detect_numeric_columns(df),
+            df.select_dtypes(include=['object', 'string', 'category']).columns.tolist(),
+            df.select_dtypes(include=['datetime64']).columns.tolist()
+        )
+    
+    @staticmethod
+    def get_store_info(store: 'ColumnarStore', sample: Optional[bool] = None) -> Dict[str, Any]:
+        """Get the same information as get_dataframe_info for an out-of-core store."""
+        profile = store.profile(sample=sample)
+        return DataProcessor.info_from_profile(
+            profile,
+            store.dtypes,
+            store.numeric_columns,
+            [col for col in store.columns if col not in store.numeric_columns],
+            []
+        )
+    
     @staticmethod
-    def get_dataframe_info(df: pd.DataFrame) -> Dict[str, Any]:
-        """Get comprehensive information about a DataFrame."""
+    def info_from_profile(profile: Dict[str, Any], dtypes: Dict[str, str], numeric_columns: List[str],
+                          categorical_columns: List[str], datetime_columns: List[str]) -> Dict[str, Any]:
+        """Assemble the overview information from a profile and column type lists."""
+        columns = profile['columns']
+        
         info = {
-            'shape': df.shape,
-            'columns': df.columns.tolist(),
-            'dtypes': {col: str(dtype) for col, dtype in df.dtypes.items()},
-            'null_counts': df.isnull().sum().to_dict(),
-            'null_percentages': (df.isnull().sum() / len(df) * 100).to_dict(),
-            'numeric_columns': df.select_dtypes(include=[np.number]).columns.tolist(),
-            'categorical_columns': df.select_dtypes(include=['object']).columns.tolist(),
-            'datetime_columns': df.select_dtypes(include=['datetime64']).columns.tolist(),
+            'shape': (profile['rows'], len(dtypes)),
+            'columns': list(dtypes),
+            'dtypes': dtypes,
+            'null_counts': {col: stats['null_count'] for col, stats in columns.items()},
+            'null_percentages': {col: stats['null_percentage'] for col, stats in columns.items()},
+            'numeric_columns': numeric_columns,
+            'categorical_columns': categorical_columns,
+            'datetime_columns': datetime_columns,
+            'distinct_counts': {col: stats['distinct'] for col, stats in columns.items() if 'distinct' in stats},
+            'profile': profile,
         }
         
         # Add statistics for numeric columns
         if info['numeric_columns']:
-            info['numeric_stats'] = df[info['numeric_columns']].describe().to_dict()
+            info['numeric_stats'] = {
+                col: {key: columns[col][key] for key in ('count', 'mean', 'std', 'min', 'max') if key in columns[col]}
+                for col in info['numeric_columns']
+            }
         
         # Add value counts for categorical columns (top 10)
         info['categorical_counts'] = {}
         for col in info['categorical_columns'][:10]:  # Limit to first 10 to avoid memory issues
-            try:
-                info['categorical_counts'][col] = df[col].value_counts().head(10).to_dict()
-            except Exception:
-                pass
+            if columns[col].get('top'):
+                info['categorical_counts'][col] = {value: count for value, count, _ in columns[col]['top']}
         
         return info
     
+    @staticmethod
+    def compact_series(series: pd.Series, category_ratio: float = CATEGORY_RATIO) -> pd.Series:
+        """Return a series in the smallest dtype that holds its values exactly.
+
+        Integers are downcast, floats become integers or float32 only when no
+        value changes, and low-cardinality text becomes ``category``.
+        """
+        dtype = series.dtype
+        if pd.api.types.is_bool_dtype(dtype) or isinstance(dtype, pd.CategoricalDtype):
+            return series
+        
+        if pd.api.types.is_integer_dtype(dtype):
+            present = series.dropna()
+            if present.empty:
+                return series
+            target = DataProcessor.smallest_integer_dtype(int(present.min()), int(present.max()))
+            if series.hasnans or isinstance(dtype, pd.api.extensions.ExtensionDtype):
+                # Nullable integers keep their missing values
+                return series.astype(target.name.replace('uint', 'UInt').replace('int', 'Int'))
+            return series.astype(target)
+        
+        if pd.api.types.is_float_dtype(dtype):
+            values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+            present = values[~np.isnan(values)]
+            if len(present) == len(values) and len(values) and np.isfinite(present).all() \
+                    and np.abs(present).max() < 2 ** 53 and (present == np.round(present)).all():
+                return series.astype(DataProcessor.smallest_integer_dtype(int(present.min()), int(present.max())))
+            narrowed = present.astype(np.float32)
+            if (narrowed.astype(np.float64) == present).all():
+                return series.astype(np.float32)
+            return series
+        
+        if pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+            if pd.api.types.infer_dtype(series, skipna=True) != 'string':
+                # Mixed or nested values (lists, dicts) are left alone
+                return series
+            count = int(series.count())
+            if count and series.nunique(dropna=True) <= category_ratio * count:
+                return series.astype('category')
+            if DataProcessor.ARROW_STRINGS:
+                return series.astype('string[pyarrow]')
+        return series
+    
+    @staticmethod
+    def smallest_integer_dtype(low: int, high: int) -> np.dtype:
+        """Smallest numpy integer dtype holding every value in [low, high]."""
+        candidates = (np.uint8, np.uint16, np.uint32, np.uint64) if low >= 0 else (np.int8, np.int16, np.int32, np.int64)
+        for candidate in candidates:
+            info = np.iinfo(candidate)
+            if info.min <= low and high <= info.max:
+                return np.dtype(candidate)
+        return np.dtype(np.int64)
+    
+    @staticmethod
+    def optimize_dtypes(df: pd.DataFrame, category_ratio: float = CATEGORY_RATIO) -> Tuple[pd.DataFrame, Dict[str, Dict[str, Any]]]:
+        """Compact every column and report the memory saved per column.
+
+        Returns the optimized frame and ``{column: {'from', 'to', 'before',
+        'after', 'saved'}}`` with sizes in bytes (deep memory usage).
+        """
+        try:
+            optimized = df.copy(deep=False)
+            report = {}
+            for position, col in enumerate(df.columns):
+                series = df.iloc[:, position]
+                compacted = DataProcessor.compact_series(series, category_ratio)
+                before = int(series.memory_usage(deep=True, index=False))
+                after = int(compacted.memory_usage(deep=True, index=False)) if compacted is not series else before
+                if after < before:
+                    optimized.isetitem(position, compacted)
+                else:
+                    compacted, after = series, before
+                report[col] = {
+                    'from': str(series.dtype),
+                    'to': str(compacted.dtype),
+                    'before': before,
+                    'after': after,
+                    'saved': before - after,
+                }
+            return optimized, report
+        except Exception as e:
+            raise Exception(f"Error optimizing data types: {str(e)}")
+    
+    @staticmethod
+    def format_bytes(size: float) -> str:
+        """Human-readable byte size."""
+        return format_bytes(size)
+    
     @staticmethod
     def detect_numeric_columns(df: pd.DataFrame) -> List[str]:
         """Detect columns that contain numeric data."""
@@ -47,31 +182,39 @@ class DataProcessor:
         return df.select_dtypes(include=['object', 'category']).columns.tolist()
     
     @staticmethod
-    def detect_datetime_columns(df: pd.DataFrame) -> List[str]:
-        """Detect columns that might be datetime (will try to parse)."""
+    def detect_datetime_columns(df: pd.DataFrame, sample_rows: int = 100) -> List[str]:
+        """Detect columns that might be datetime (will try to parse a small sample)."""
         datetime_cols = []
-        for col in df.columns:
-            if df[col].dtype == 'object':
-                # Try to parse as datetime
-                try:
-                    pd.to_datetime(df[col].dropna().head(100))
-                    datetime_cols.append(col)
-                except:
-                    pass
+        for col in df.select_dtypes(include=['object', 'string']).columns:
+            # Parse a few leading non-null strings instead of scanning the column
+            sample = df[col].iloc[:sample_rows * 10].dropna().head(sample_rows)
+            if sample.empty or not all(isinstance(value, str) for value in sample):
+                continue
+            try:
+                pd.to_datetime(sample)
+                datetime_cols.append(col)
+            except (ValueError, TypeError, OverflowError):
+                pass
         return datetime_cols
     
     @staticmethod
-    def get_correlation_matrix(df: pd.DataFrame) -> pd.DataFrame:
-        """Get correlation matrix for numeric columns."""
+    def get_correlation_matrix(df: pd.DataFrame, tolerance: Optional[float] = None) -> pd.DataFrame:
+        """Get correlation matrix for numeric columns (sampled to ``tolerance`` if given)."""
         numeric_cols = DataProcessor.detect_numeric_columns(df)
         if len(numeric_cols) < 2:
             return pd.DataFrame()
-        return df[numeric_cols].corr()
+        return CorrelationEngine.matrix(df, numeric_cols, tolerance)
     
     @staticmethod
-    def convert_to_dataframe(data: Union[Dict, List[Dict]]) -> pd.DataFrame:
-        """Convert JSON/JSONL data to DataFrame."""
+    def convert_to_dataframe(data: Union[Dict, List[Dict]], flattener: Optional[JsonFlattener] = None) -> pd.DataFrame:
+        """Convert JSON/JSONL data to DataFrame.
+        
+        With a ``JsonFlattener``, nested objects become dotted columns typed
+        from its schema hints and arrays of objects go to its child tables.
+        """
         if isinstance(data, dict):
             # Single record - convert to list
             data = [data]
+        if flattener is not None:
+            return flattener.flatten_records(data)
         return pd.DataFrame(data)
@@ -0,0 +1,236 @@
+"""Keyed, partitioned diff of two versions of a data file."""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+import pandas as pd
+from app.modules.file_loader import FileLoader
+
+
+# Key columns tried, in order, when none is given
+KEY_CANDIDATES = ('_id', 'id', 'userId', 'clerkId')
+
+
+class DiffEngine:
+    """Compare an old and a new file record by record, matched on a key column.
+
+    Each record is encoded canonically (sorted keys, compact separators) and
+    hashed. Both files are streamed once into ``partitions`` temporary files
+    by a hash of the record key, so the records of one key always land in
+    the same partition. Partitions are then compared independently in a
+    process pool: each loads only its share of the old file, so memory is
+    bounded by the partition size rather than the file size. Records whose
+    hashes differ are diffed field by field (nested objects as dotted paths).
+    """
+    
+    # Target size of one partition; the partition count follows from it
+    PARTITION_BYTES = 64 * 1024 * 1024
+    
+    # Below this combined size the comparison runs in-process
+    PARALLEL_BYTES = 16 * 1024 * 1024
+    
+    @staticmethod
+    def detect_key(file_path: Union[str, Path]) -> Optional[str]:
+        """The first of KEY_CANDIDATES present in a file's first record."""
+        for record in FileLoader.iter_records(file_path):
+            for key in KEY_CANDIDATES:
+                if record.get(key) is not None:
+                    return key
+            return None
+        return None
+    
+    @staticmethod
+    def canonical(record: Dict[str, Any]) -> str:
+        """Order-independent JSON encoding of a record."""
+        return json.dumps(record, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+    
+    @staticmethod
+    def record_key(record: Dict[str, Any], key: str) -> Optional[str]:
+        """A record's key as text (dotted keys reach into nested objects), or None."""
+        value: Any = record
+        for part in key.split('.'):
+            if not isinstance(value, dict):
+                return None
+            value = value.get(part)
+        return None if value is None else str(value)
+    
+    @staticmethod
+    def flatten(record: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+        """Nested objects as dotted fields; arrays and scalars are compared whole."""
+        fields = {}
+        for name, value in record.items():
+            path = f"{prefix}{name}"
+            if isinstance(value, dict) and value:
+                fields.update(DiffEngine.flatten(value, f"{path}."))
+            else:
+                fields[path] = value
+        return fields
+    
+    @staticmethod
+    def field_changes(old: Dict[str, Any], new: Dict[str, Any]) -> List[Tuple[str, Any, Any]]:
+        """(field, old value, new value) for every field that differs."""
+        old_fields = DiffEngine.flatten(old)
+        new_fields = DiffEngine.flatten(new)
+        changes = []
+        for field in dict.fromkeys(list(old_fields) + list(new_fields)):
+            before = old_fields.get(field)
+            after = new_fields.get(field)
+            if before != after or (field in old_fields) != (field in new_fields):
+                changes.append((field, before, after))
+        return changes
+    
+    @staticmethod
+    def partition_file(file_path: Union[str, Path], key: str, directory: Path, side: str, partitions: int) -> Dict[str, int]:
+        """Stream a file into per-partition files of ``digest<TAB>canonical record`` lines."""
+        handles = [open(directory / f"{side}-{i}.tsv", 'w', encoding='utf-8') for i in range(partitions)]
+        counts = {'rows': 0, 'missing_key': 0}
+        try:
+            for record in FileLoader.iter_records(file_path):
+                record_key = DiffEngine.record_key(record, key)
+                if record_key is None:
+                    counts['missing_key'] += 1
+                    continue
+                encoded = DiffEngine.canonical(record)
+                digest = hashlib.blake2b(encoded.encode('utf-8'), digest_size=16).hexdigest()
+                # JSON escapes tabs and newlines, so one record is one line
+                handles[zlib.crc32(record_key.encode('utf-8')) % partitions].write(f"{digest}\t{encoded}\n")
+                counts['rows'] += 1
+        finally:
+            for handle in handles:
+                handle.close()
+        return counts
+    
+    @staticmethod
+    def compare_partition(old_path: str, new_path: str, key: str) -> Dict[str, Any]:
+        """Compare one partition pair (runs in a worker process).
+
+        A key repeated within a file is compared by its first record on
+        both sides; later records of that key are skipped and the key is
+        listed in 'duplicates' as (key, side).
+        """
+        old: Dict[str, Tuple[str, str]] = {}
+        duplicates: Dict[Tuple[str, str], None] = {}
+        with open(old_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                digest, encoded = line.rstrip('\n').split('\t', 1)
+                record_key = DiffEngine.record_key(json.loads(encoded), key)
+                if record_key in old:
+                    duplicates[(record_key, 'old')] = None
+                    continue
+                old[record_key] = (digest, encoded)
+        
+        result = {'added': [], 'removed': [], 'modified': [], 'unchanged': 0}
+        seen = set()
+        with open(new_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                digest, encoded = line.rstrip('\n').split('\t', 1)
+                record = json.loads(encoded)
+                record_key = DiffEngine.record_key(record, key)
+                if record_key in seen:
+                    duplicates[(record_key, 'new')] = None
+                    continue
+                seen.add(record_key)
+                previous = old.pop(record_key, None)
+                if previous is None:
+                    result['added'].append((record_key, record))
+                elif previous[0] == digest:
+                    result['unchanged'] += 1
+                else:
+                    result['modified'].append((record_key, DiffEngine.field_changes(json.loads(previous[1]), record)))
+        result['removed'] = [(record_key, json.loads(encoded)) for record_key, (_, encoded) in old.items()]
+        result['duplicates'] = list(duplicates)
+        return result
+    
+    @staticmethod
+    def iter_diff(old_path: Union[str, Path], new_path: Union[str, Path], key: Optional[str] = None,
+                  workers: Optional[int] = None) -> Iterator[Tuple[str, Any]]:
+        """Diff two files, yielding progress events and finally the result.
+
+        Yields ('partitioned', side, rows) after each file is split, then
+        ('complete', result, None). The result holds 'added' and 'removed'
+        as (key, record) lists, 'modified' as (key, [(field, old, new)])
+        lists, 'duplicates' as (key, side) for keys repeated within a file,
+        and a 'summary' of counts including per-field change counts.
+        """
+        key = key or DiffEngine.detect_key(old_path) or DiffEngine.detect_key(new_path)
+        if not key:
+            raise ValueError(f"No key column given and none of {', '.join(KEY_CANDIDATES)} found")
+        
+        total_bytes = os.path.getsize(old_path) + os.path.getsize(new_path)
+        partitions = max(1, -(-total_bytes // DiffEngine.PARTITION_BYTES))
+        if workers is None:
+            workers = 1 if total_bytes < DiffEngine.PARALLEL_BYTES else min(os.cpu_count() or 1, 8)
+        partitions = max(partitions, workers)
+        
+        directory = Path(tempfile.mkdtemp(prefix="data-explorer-diff-"))
+        try:
+            counts = {}
+            for side, path in (('old', old_path), ('new', new_path)):
+                counts[side] = DiffEngine.partition_file(path, key, directory, side, partitions)
+                yield 'partitioned', side, counts[side]['rows']
+            
+            pairs = [(str(directory / f"old-{i}.tsv"), str(directory / f"new-{i}.tsv"), key) for i in range(partitions)]
+            if workers > 1:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    parts = list(pool.map(DiffEngine.compare_partition, *zip(*pairs)))
+            else:
+                parts = [DiffEngine.compare_partition(*pair) for pair in pairs]
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+        
+        result = {'key': key, 'added': [], 'removed': [], 'modified': [], 'duplicates': []}
+        for part in parts:
+            for kind in ('added', 'removed', 'modified', 'duplicates'):
+                result[kind].extend(part[kind])
+        for kind in ('added', 'removed', 'modified', 'duplicates'):
+            result[kind].sort(key=lambda item: item[0])
+        
+        field_counts: Dict[str, int] = {}
+        for _, changes in result['modified']:
+            for field, _, _ in changes:
+                field_counts[field] = field_counts.get(field, 0) + 1
+        result['summary'] = {
+            'key': key,
+            'old_rows': counts['old']['rows'],
+            'new_rows': counts['new']['rows'],
+            'added': len(result['added']),
+            'removed': len(result['removed']),
+            'modified': len(result['modified']),
+            'unchanged': sum(part['unchanged'] for part in parts),
+            'duplicates': len({record_key for record_key, _ in result['duplicates']}),
+            'missing_key': counts['old']['missing_key'] + counts['new']['missing_key'],
+            'field_counts': dict(sorted(field_counts.items(), key=lambda item: item[1], reverse=True)),
+            'partitions': partitions,
+            'workers': workers,
+        }
+        yield 'complete', result, None
+    
+    @staticmethod
+    def diff(old_path: Union[str, Path], new_path: Union[str, Path], key: Optional[str] = None,
+             workers: Optional[int] = None) -> Dict[str, Any]:
+        """Diff two files and return the result of iter_diff."""
+        for kind, payload, _ in DiffEngine.iter_diff(old_path, new_path, key, workers):
+            if kind == 'complete':
+                return payload
+        raise RuntimeError("Diff did not complete")
+    
+    @staticmethod
+    def changes_frame(result: Dict[str, Any]) -> pd.DataFrame:
+        """One row per added/removed record and per changed field, for the table view."""
+        rows = []
+        for record_key, record in result['added']:
+            rows.append(('added', record_key, '', None, DiffEngine.canonical(record)))
+        for record_key, record in result['removed']:
+            rows.append(('removed', record_key, '', DiffEngine.canonical(record), None))
+        for record_key, changes in result['modified']:
+            for field, before, after in changes:
+                rows.append(('modified', record_key, field, before, after))
+        frame = pd.DataFrame(rows, columns=['change', 'key', 'field', 'old', 'new'], dtype=object)
+        frame['change'] = frame['change'].astype(pd.CategoricalDtype(['added', 'removed', 'modified']))
+        return frame
@@ -0,0 +1,115 @@
+"""Downsampling helpers for rendering long series at screen resolution."""
+
+from typing import Optional
+import numpy as np
+
+
+class Downsampler:
+    """Pick a screen-resolution subset of points that preserves visual extremes.
+
+    Every method returns sorted integer indices into the original arrays, so
+    callers can downsample columns of any dtype (datetimes, strings, pandas
+    objects) and keep their own x/y values.
+    """
+    
+    # Default number of output points per horizontal pixel
+    POINTS_PER_PIXEL = 2
+    
+    @staticmethod
+    def as_numeric(values) -> np.ndarray:
+        """Convert x values to float64, falling back to positions for non-numeric data."""
+        arr = np.asarray(values)
+        if np.issubdtype(arr.dtype, np.datetime64) or np.issubdtype(arr.dtype, np.timedelta64):
+            return arr.astype('int64').astype(np.float64)
+        try:
+            return arr.astype(np.float64)
+        except (TypeError, ValueError):
+            return np.arange(len(arr), dtype=np.float64)
+    
+    @staticmethod
+    def minmax_indices(y, n_buckets: int) -> np.ndarray:
+        """Keep the first, last, min and max point of each equal-count bucket."""
+        y = np.asarray(y, dtype=np.float64)
+        n = len(y)
+        if n_buckets <= 0 or n <= 4 * n_buckets:
+            return np.arange(n)
+        
+        # Equal-size buckets as rows of a padded 2D view; padding never wins min/max
+        size = -(-n // n_buckets)
+        n_buckets = -(-n // size)
+        padded = np.full(n_buckets * size, np.nan)
+        padded[:n] = y
+        grid = padded.reshape(n_buckets, size)
+        offsets = np.arange(n_buckets) * size
+        
+        mins = offsets + np.argmin(np.where(np.isnan(grid), np.inf, grid), axis=1)
+        maxs = offsets + np.argmax(np.where(np.isnan(grid), -np.inf, grid), axis=1)
+        ends = np.minimum(offsets + size, n) - 1
+        
+        return np.unique(np.concatenate([offsets, ends, mins, maxs]))
+    
+    @staticmethod
+    def lttb_indices(x, y, threshold: int) -> np.ndarray:
+        """Largest-Triangle-Three-Buckets selection of ``threshold`` points."""
+        x = Downsampler.as_numeric(x)
+        y = np.nan_to_num(np.asarray(y, dtype=np.float64))
+        n = len(y)
+        if threshold >= n or threshold < 3:
+            return np.arange(n)
+        
+        edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+        indices = np.empty(threshold, dtype=np.int64)
+        indices[0] = 0
+        indices[-1] = n - 1
+        a = 0
+        for i in range(threshold - 2):
+            start, end = edges[i], edges[i + 1]
+            next_end = edges[i + 2] if i + 2 < len(edges) else n
+            # Average of the next bucket is the third triangle vertex
+            avg_x = x[end:next_end].mean() if next_end > end else x[-1]
+            avg_y = y[end:next_end].mean() if next_end > end else y[-1]
+            
+            bx = x[start:end]
+            by = y[start:end]
+            areas = np.abs((x[a] - avg_x) * (by - y[a]) - (x[a] - bx) * (avg_y - y[a]))
+            a = start + int(np.argmax(areas))
+            indices[i + 1] = a
+        return indices
+    
+    @staticmethod
+    def pixel_indices(x, y, width: int, height: int) -> np.ndarray:
+        """Keep one point per occupied pixel cell (for scatter plots)."""
+        x = Downsampler.as_numeric(x)
+        y = np.asarray(y, dtype=np.float64)
+        valid = np.isfinite(x) & np.isfinite(y)
+        positions = np.flatnonzero(valid)
+        if len(positions) <= width * height or width <= 0 or height <= 0:
+            return positions
+        
+        xv, yv = x[valid], y[valid]
+        x_span = (xv.max() - xv.min()) or 1.0
+        y_span = (yv.max() - yv.min()) or 1.0
+        cx = ((xv - xv.min()) / x_span * (width - 1)).astype(np.int64)
+        cy = ((yv - yv.min()) / y_span * (height - 1)).astype(np.int64)
+        _, first = np.unique(cy * width + cx, return_index=True)
+        return np.sort(positions[first])
+    
+    @staticmethod
+    def line_indices(x, y, pixel_width: int, method: str = "minmax") -> Optional[np.ndarray]:
+        """Indices for a line chart ``pixel_width`` pixels wide, or None if no reduction is needed."""
+        n = len(y)
+        target = max(int(pixel_width), 1) * Downsampler.POINTS_PER_PIXEL
+        if n <= target:
+            return None
+        if method == "lttb":
+            return Downsampler.lttb_indices(x, y, target)
+        # min/max keeps up to four points per bucket
+        return Downsampler.minmax_indices(y, max(target // 4, 1))
+    
+    @staticmethod
+    def visible_slice(x, lo: float, hi: float) -> slice:
+        """Slice of a sorted x array that covers [lo, hi] plus one point on each side."""
+        x = Downsampler.as_numeric(x)
+        start = max(int(np.searchsorted(x, lo, side='left')) - 1, 0)
+        stop = min(int(np.searchsorted(x, hi, side='right')) + 1, len(x))
+        return slice(start, stop)
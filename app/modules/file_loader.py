@@ -4,13 +4,19 @@ import json
 import csv
 import os
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
-import pandas as pd
+from typing import List, Dict, Any, Optional, Union, Iterator, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from app.modules.json_flattener import JsonFlattener
 
 
 class FileLoader:
     """Utility class for loading various file formats."""
     
+    # Rows per chunk for progressive loading
+    CHUNK_ROWS = 50_000
+    
     @staticmethod
     def load_json(file_path: Union[str, Path]) -> Optional[Dict[str, Any]]:
         """Load a JSON file."""
@@ -39,8 +45,10 @@ class FileLoader:
             raise Exception(f"Error loading JSONL file {file_path}: {str(e)}")
     
     @staticmethod
-    def load_csv(file_path: Union[str, Path]) -> pd.DataFrame:
+    def load_csv(file_path: Union[str, Path]) -> 'pd.DataFrame':
         """Load a CSV file into a pandas DataFrame."""
+        # pandas is imported on first use to keep application startup fast
+        import pandas as pd
         try:
             return pd.read_csv(file_path, encoding='utf-8')
         except Exception as e:
@@ -62,7 +70,7 @@ class FileLoader:
             raise ValueError(f"Unsupported file type: {ext}")
     
     @staticmethod
-    def load_file(file_path: Union[str, Path]) -> Union[Dict[str, Any], List[Dict[str, Any]], pd.DataFrame]:
+    def load_file(file_path: Union[str, Path]) -> Union[Dict[str, Any], List[Dict[str, Any]], 'pd.DataFrame']:
         """Load a file, automatically detecting the type."""
         file_type = FileLoader.detect_file_type(file_path)
         
@@ -74,3 +82,102 @@ class FileLoader:
             return FileLoader.load_csv(file_path)
         else:
             raise ValueError(f"Unknown file type: {file_type}")
+    
+    @staticmethod
+    def iter_csv_chunks(file_path: Union[str, Path], chunk_rows: int = CHUNK_ROWS) -> Iterator[Tuple['pd.DataFrame', int]]:
+        """Read a CSV file in typed DataFrame chunks, yielding (chunk, bytes read)."""
+        import pandas as pd
+        try:
+            with open(file_path, 'rb') as f:
+                for chunk in pd.read_csv(f, encoding='utf-8', chunksize=chunk_rows):
+                    yield chunk, f.tell()
+        except Exception as e:
+            raise Exception(f"Error loading CSV file {file_path}: {str(e)}")
+    
+    @staticmethod
+    def iter_jsonl_chunks(file_path: Union[str, Path], chunk_rows: int = CHUNK_ROWS,
+                          flattener: Optional['JsonFlattener'] = None) -> Iterator[Tuple['pd.DataFrame', int]]:
+        """Read a JSONL file in DataFrame chunks, yielding (chunk, bytes read).
+        
+        Only one chunk of parsed records is alive at a time. With a flattener,
+        nested records become dotted columns and exploded arrays are collected
+        by the flattener as child tables.
+        """
+        import pandas as pd
+        to_frame = flattener.flatten_records if flattener is not None else pd.DataFrame
+        records = []
+        bytes_read = 0
+        try:
+            with open(file_path, 'rb') as f:
+                for line_num, line in enumerate(f, 1):
+                    bytes_read += len(line)
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError as e:
+                        raise Exception(f"Malformed JSON on line {line_num} of {file_path}: {str(e)}")
+                    if len(records) >= chunk_rows:
+                        yield to_frame(records), bytes_read
+                        records = []
+            if records or not bytes_read:
+                yield to_frame(records), bytes_read
+        except Exception as e:
+            raise Exception(f"Error loading JSONL file {file_path}: {str(e)}")
+    
+    @staticmethod
+    def iter_file_chunks(file_path: Union[str, Path], chunk_rows: int = CHUNK_ROWS,
+                         flattener: Optional['JsonFlattener'] = None) -> Iterator[Tuple['pd.DataFrame', int]]:
+        """Read any supported file in DataFrame chunks, yielding (chunk, bytes read).
+        
+        JSON documents cannot be streamed and arrive as a single chunk. The
+        optional flattener applies to JSON and JSONL records.
+        """
+        file_type = FileLoader.detect_file_type(file_path)
+        
+        if file_type == 'csv':
+            yield from FileLoader.iter_csv_chunks(file_path, chunk_rows)
+        elif file_type == 'jsonl':
+            yield from FileLoader.iter_jsonl_chunks(file_path, chunk_rows, flattener)
+        elif file_type == 'json':
+            import pandas as pd
+            data = FileLoader.load_json(file_path)
+            records = [data] if isinstance(data, dict) else data
+            frame = flattener.flatten_records(records) if flattener is not None else pd.DataFrame(records)
+            yield frame, os.path.getsize(file_path)
+        else:
+            raise ValueError(f"Unknown file type: {file_type}")
+    
+    @staticmethod
+    def iter_records(file_path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+        """Stream the records of any supported file as dicts, one at a time.
+        
+        CSV values are kept as stripped strings with empty cells as None, as
+        compare_users.py reads the Clerk export. JSON documents are loaded
+        whole (a single object is one record).
+        """
+        file_type = FileLoader.detect_file_type(file_path)
+        
+        if file_type == 'csv':
+            try:
+                with open(file_path, 'r', encoding='utf-8', newline='') as f:
+                    for row in csv.DictReader(f):
+                        yield {k: (v.strip() or None) if isinstance(v, str) else v for k, v in row.items()}
+            except Exception as e:
+                raise Exception(f"Error loading CSV file {file_path}: {str(e)}")
+        elif file_type == 'jsonl':
+            with open(file_path, 'rb') as f:
+                for line_num, line in enumerate(f, 1):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError as e:
+                        raise Exception(f"Malformed JSON on line {line_num} of {file_path}: {str(e)}")
+        elif file_type == 'json':
+            data = FileLoader.load_json(file_path)
+            yield from ([data] if isinstance(data, dict) else data)
+        else:
+            raise ValueError(f"Unknown file type: {file_type}")
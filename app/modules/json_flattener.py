@@ -0,0 +1,333 @@
+"""Flatten nested JSON documents into typed tables using Convex schema hints."""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+import pandas as pd
+
+
+# dtype for each scalar type name in a Convex generated schema
+SCALAR_DTYPES = {
+    'normalfloat64': 'float64',
+    'float64': 'float64',
+    'int64': 'Int64',
+    'boolean': 'boolean',
+    'string': 'string',
+    'field_name': 'string',
+    'id': 'string',
+    'bytes': None,
+    'any': None,
+}
+
+
+class ConvexSchema:
+    """Parser for Convex ``generated_schema.jsonl`` type expressions.
+
+    A schema is a union of object shapes such as
+    ``{"email": field_name, "country": "GB" | "PK", "tags": array<string>}``.
+    Types are parsed into tuples: ``('object', {field: type})``,
+    ``('union', [types])``, ``('array', item)``, ``('literal', value)`` and
+    ``('scalar', name)``.
+    """
+    
+    @staticmethod
+    def tokenize(text: str) -> List[Tuple[str, Any]]:
+        """Split a type expression into (kind, value) tokens."""
+        tokens = []
+        decoder = json.JSONDecoder()
+        i = 0
+        while i < len(text):
+            ch = text[i]
+            if ch.isspace():
+                i += 1
+            elif ch in '{}:,|<>':
+                tokens.append(('punct', ch))
+                i += 1
+            elif ch == '"':
+                value, i = decoder.raw_decode(text, i)
+                tokens.append(('string', value))
+            else:
+                start = i
+                while i < len(text) and not text[i].isspace() and text[i] not in '{}:,|<>"':
+                    i += 1
+                word = text[start:i]
+                try:
+                    tokens.append(('literal', json.loads(word)))
+                except json.JSONDecodeError:
+                    tokens.append(('name', word))
+        return tokens
+    
+    @staticmethod
+    def parse(text: str) -> tuple:
+        """Parse a type expression into nested type tuples."""
+        tokens = ConvexSchema.tokenize(text)
+        position = 0
+        
+        def peek():
+            return tokens[position] if position < len(tokens) else (None, None)
+        
+        def take(expected: Optional[str] = None):
+            nonlocal position
+            token = peek()
+            if expected is not None and token != ('punct', expected):
+                raise ValueError(f"Expected '{expected}' in schema at token {position}, got {token[1]!r}")
+            position += 1
+            return token
+        
+        def parse_union():
+            options = [parse_term()]
+            while peek() == ('punct', '|'):
+                take('|')
+                options.append(parse_term())
+            return options[0] if len(options) == 1 else ('union', options)
+        
+        def parse_term():
+            kind, value = take()
+            if (kind, value) == ('punct', '{'):
+                fields = {}
+                while peek() != ('punct', '}'):
+                    _, name = take()
+                    take(':')
+                    fields[name] = parse_union()
+                    if peek() == ('punct', ','):
+                        take(',')
+                take('}')
+                return ('object', fields)
+            if kind in ('string', 'literal'):
+                return ('literal', value)
+            if kind == 'name':
+                if peek() == ('punct', '<'):
+                    take('<')
+                    inner = parse_union() if value == 'array' else take()
+                    take('>')
+                    return ('array', inner) if value == 'array' else ('scalar', value)
+                return ('scalar', value)
+            raise ValueError(f"Unexpected {value!r} in schema")
+        
+        return parse_union()
+    
+    @staticmethod
+    def load(path: Union[str, Path]) -> Optional[tuple]:
+        """Load and parse a generated_schema.jsonl file (a JSON-encoded expression)."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                text = json.loads(f.readline())
+            return ConvexSchema.parse(text)
+        except Exception as e:
+            raise Exception(f"Error loading schema {path}: {str(e)}")
+    
+    @staticmethod
+    def find_for(data_path: Union[str, Path]) -> Optional[Path]:
+        """The generated_schema.jsonl next to a Convex documents file, if any."""
+        candidate = Path(data_path).parent / "generated_schema.jsonl"
+        return candidate if candidate.exists() else None
+    
+    @staticmethod
+    def options(schema: tuple) -> List[tuple]:
+        """Flatten a union into its options, dropping never/null."""
+        if schema[0] == 'union':
+            options = [option for member in schema[1] for option in ConvexSchema.options(member)]
+        else:
+            options = [schema]
+        return [option for option in options if option not in (('scalar', 'never'), ('scalar', 'null'), ('literal', None))]
+    
+    @staticmethod
+    def dtype_hint(schema: tuple) -> Optional[Union[str, pd.CategoricalDtype]]:
+        """Compact dtype for a scalar field type, or None to let pandas infer."""
+        options = ConvexSchema.options(schema)
+        if not options:
+            return None
+        if all(kind == 'literal' and isinstance(value, str) for kind, value in options):
+            return pd.CategoricalDtype(sorted({value for _, value in options}))
+        
+        hints = set()
+        for kind, value in options:
+            if kind == 'literal':
+                hints.add('boolean' if isinstance(value, bool) else 'string' if isinstance(value, str) else 'float64')
+            elif kind == 'scalar':
+                hints.add(SCALAR_DTYPES.get(value))
+            else:
+                return None
+        if hints == {'Int64', 'float64'}:
+            return 'float64'
+        return hints.pop() if len(hints) == 1 else None
+    
+    @staticmethod
+    def shape(schema: tuple, sep: str = ".", prefix: str = "") -> Tuple[Dict[str, Any], Dict[str, tuple]]:
+        """Dotted column dtype hints and array item types of a (union of) object shape(s).
+
+        Returns ``(hints, arrays)`` where hints maps dotted column names to a
+        dtype (or None) and arrays maps dotted array paths to their item type.
+        """
+        hints: Dict[str, Any] = {}
+        arrays: Dict[str, tuple] = {}
+        fields: Dict[str, List[tuple]] = {}
+        for option in ConvexSchema.options(schema):
+            if option[0] == 'object':
+                for name, field_type in option[1].items():
+                    fields.setdefault(name, []).append(field_type)
+        
+        for name, field_types in fields.items():
+            path = f"{prefix}{name}"
+            merged = field_types[0] if len(field_types) == 1 else ('union', field_types)
+            options = ConvexSchema.options(merged)
+            if options and all(option[0] == 'object' for option in options):
+                child_hints, child_arrays = ConvexSchema.shape(merged, sep, f"{path}{sep}")
+                hints.update(child_hints)
+                arrays.update(child_arrays)
+            elif options and all(option[0] == 'array' for option in options):
+                items = [option[1] for option in options]
+                arrays[path] = items[0] if len(items) == 1 else ('union', items)
+            else:
+                hints[path] = ConvexSchema.dtype_hint(merged)
+        return hints, arrays
+
+
+class JsonFlattener:
+    """Turn nested JSON records into a flat main table plus exploded child tables.
+
+    Nested objects become dotted columns (``pointsBreakdown.signupPoints``).
+    Arrays of objects, and any array path listed in ``explode``, are moved to
+    child tables keyed by the array path: each item becomes a row carrying
+    ``_parent_row`` (the parent's row position) and ``_item`` (its index),
+    and the parent keeps a ``<path>.count`` column. Arrays nested inside an
+    exploded item become child tables of their own, keyed by their full path,
+    whose ``_parent_row`` is the item's row in the enclosing child table.
+    Arrays of scalars stay as list cells. Columns with a schema hint are built with that dtype
+    directly; others are inferred by pandas.
+    """
+    
+    def __init__(self, schema: Optional[tuple] = None, explode: Iterable[str] = (), sep: str = "."):
+        self.sep = sep
+        self.hints: Dict[str, Any] = {}
+        self.child_hints: Dict[str, Dict[str, Any]] = {}
+        self.explode = set(explode)
+        # Array paths nested inside another exploded array, mapped to that array's path
+        self.parents: Dict[str, str] = {}
+        if schema is not None:
+            self.hints, arrays = ConvexSchema.shape(schema, sep)
+            self.register_arrays(arrays)
+        self.rows_seen = 0
+        self.child_rows_seen: Dict[str, int] = {}
+        self.children: Dict[str, List[pd.DataFrame]] = {}
+    
+    def register_arrays(self, arrays: Dict[str, tuple], parent: Optional[str] = None):
+        """Explode schema arrays of objects, including arrays nested inside their items."""
+        for path, item in arrays.items():
+            if any(option[0] == 'object' for option in ConvexSchema.options(item)):
+                self.explode.add(path)
+                if parent is not None:
+                    self.parents[path] = parent
+                hints, nested = ConvexSchema.shape(item, self.sep)
+                self.child_hints[path] = hints
+                self.register_arrays({f"{path}{self.sep}{name}": nested_item for name, nested_item in nested.items()}, path)
+    
+    @classmethod
+    def for_file(cls, file_path: Union[str, Path], explode: Iterable[str] = ()) -> 'JsonFlattener':
+        """Flattener using the schema next to a Convex export file, when present."""
+        schema_path = ConvexSchema.find_for(file_path)
+        schema = None
+        if schema_path is not None:
+            try:
+                schema = ConvexSchema.load(schema_path)
+            except Exception:
+                # A schema we cannot read only costs us the dtype hints
+                schema = None
+        return cls(schema, explode)
+    
+    def flatten_value(self, value: Any, path: str, row: Dict[str, Any], children: Dict[str, List[Dict[str, Any]]], parent_row: int, base: str = ""):
+        """Write one (possibly nested) value into a flat row.
+
+        ``path`` is always the full dotted path from the record root; inside
+        an exploded array item, ``base`` is the item's path prefix and column
+        names are relative to it.
+        """
+        column = path[len(base):]
+        if isinstance(value, dict):
+            for key, item in value.items():
+                self.flatten_value(item, f"{path}{self.sep}{key}" if path else key, row, children, parent_row, base)
+        elif isinstance(value, list) and (path in self.explode or any(isinstance(item, dict) for item in value)):
+            self.explode.add(path)
+            if base:
+                self.parents.setdefault(path, base[:-len(self.sep)])
+            rows = children.setdefault(path, [])
+            item_base = f"{path}{self.sep}"
+            for index, item in enumerate(value):
+                position = self.child_rows_seen.get(path, 0) + len(rows)
+                child = {'_parent_row': parent_row, '_item': index}
+                if isinstance(item, dict):
+                    for key, field in item.items():
+                        self.flatten_value(field, f"{item_base}{key}", child, children, position, item_base)
+                else:
+                    child['value'] = item
+                rows.append(child)
+            row[f"{column}{self.sep}count"] = len(value)
+        else:
+            row[column] = value
+    
+    def flatten_records(self, records: List[Dict[str, Any]]) -> pd.DataFrame:
+        """Flatten one chunk of records; child rows are collected in ``children``."""
+        rows = []
+        children: Dict[str, List[Dict[str, Any]]] = {}
+        for offset, record in enumerate(records):
+            row: Dict[str, Any] = {}
+            self.flatten_value(record, "", row, children, self.rows_seen + offset)
+            rows.append(row)
+        self.rows_seen += len(records)
+        
+        self.fill_counts(rows, None, "")
+        for path, child_rows in children.items():
+            self.fill_counts(child_rows, path, f"{path}{self.sep}")
+            self.child_rows_seen[path] = self.child_rows_seen.get(path, 0) + len(child_rows)
+            self.children.setdefault(path, []).append(self.build_frame(child_rows, self.child_hints.get(path, {})))
+        return self.build_frame(rows, self.hints)
+    
+    def fill_counts(self, rows: List[Dict[str, Any]], parent: Optional[str], base: str):
+        """Give rows a zero ``<path>.count`` for arrays exploded directly below them that they lack."""
+        for path in self.explode:
+            if self.parents.get(path) != parent:
+                continue
+            count_column = f"{path[len(base):]}{self.sep}count"
+            for row in rows:
+                row.setdefault(count_column, 0)
+    
+    @staticmethod
+    def build_frame(rows: List[Dict[str, Any]], hints: Dict[str, Any]) -> pd.DataFrame:
+        """Build a DataFrame column by column, using dtype hints where available."""
+        columns: Dict[str, None] = dict.fromkeys(hints)
+        for row in rows:
+            columns.update(dict.fromkeys(row))
+        
+        data = {}
+        for column in columns:
+            values = [row.get(column) for row in rows]
+            hint = hints.get(column)
+            series = None
+            if hint is not None:
+                try:
+                    series = pd.Series(values, dtype=hint)
+                    if isinstance(hint, pd.CategoricalDtype) and series.isna().sum() != sum(value is None for value in values):
+                        # A value outside the schema's literals would silently become NaN
+                        series = None
+                except (ValueError, TypeError):
+                    series = None
+            data[column] = series if series is not None else pd.Series(values, dtype=None if values else object)
+        return pd.DataFrame(data, index=pd.RangeIndex(len(rows)))
+    
+    def child_tables(self) -> Dict[str, pd.DataFrame]:
+        """Concatenate the collected child chunks into one table per array path."""
+        tables = {}
+        for path, chunks in self.children.items():
+            tables[path] = chunks[0] if len(chunks) == 1 else pd.concat(chunks, ignore_index=True)
+        return tables
+    
+    def iter_chunks(self, records: Iterable[Dict[str, Any]], chunk_rows: int = 50_000) -> Iterator[pd.DataFrame]:
+        """Flatten a stream of records in chunks of ``chunk_rows``."""
+        batch = []
+        for record in records:
+            batch.append(record)
+            if len(batch) >= chunk_rows:
+                yield self.flatten_records(batch)
+                batch = []
+        if batch:
+            yield self.flatten_records(batch)
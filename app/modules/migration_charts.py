@@ -0,0 +1,126 @@
+"""Migration Tool charts, drawn on chart hosts so they render in the app or headless."""
+
+from typing import Any, Dict, Optional, Tuple
+import numpy as np
+from matplotlib import dates as mdates
+from matplotlib.figure import Figure
+from app.modules.chart_host import ChartHost
+
+
+class MigrationCharts:
+    """Sync statistics, population dashboard and per-user points timeline.
+
+    Each chart is drawn onto a ChartHost, so the Migration Tool tab updates
+    its persistent canvases in place and the headless report renders the
+    same charts with Agg. Nothing here imports Tk.
+    """
+    
+    @staticmethod
+    def draw_stats_charts(host: ChartHost, stats: Dict[str, Any]):
+        """Draw the match status pie and users-by-source bars from a sync report."""
+        # Pie chart
+        ax1 = host.reset_axes('match_status', 121)
+        matched = stats.get('matched_users', 0)
+        unmatched = stats.get('clerk_only', 0) + stats.get('convex_only', 0)
+        if matched + unmatched > 0:
+            wedges, _, _ = ax1.pie([matched, unmatched], labels=['Matched', 'Unmatched'], autopct='%1.1f%%', startangle=90)
+            host.bind_color(ax1, wedges[0], 'SUCCESS', 'set_facecolor')
+            host.bind_color(ax1, wedges[1], 'WARNING', 'set_facecolor')
+            ax1.set_title('User Match Status', fontsize=13, fontweight='bold', pad=15)
+            host.bind_color(ax1, ax1.title, 'TEXT_PRIMARY')
+        
+        # Bar chart
+        ax2 = host.reset_axes('sources', 122)
+        clerk_total = stats.get('total_clerk_users', 0)
+        convex_total = stats.get('total_convex_users', 0)
+        bars = ax2.bar(['Clerk', 'Convex'], [clerk_total, convex_total])
+        host.bind_color(ax2, bars[0], 'PRIMARY', 'set_facecolor')
+        host.bind_color(ax2, bars[1], 'INFO', 'set_facecolor')
+        host.style_axes(ax2, 'Users by Source', ylabel='Count', label_size=10, grid=False)
+        
+        host.figure.tight_layout(pad=3.0)
+    
+    @staticmethod
+    def build_stats_charts(stats: Dict[str, Any], theme_colors: dict) -> Figure:
+        """Draw the sync statistics charts on a headless chart host."""
+        host = ChartHost(None, theme_colors)
+        MigrationCharts.draw_stats_charts(host, stats)
+        return host.figure
+    
+    @staticmethod
+    def build_population_dashboard(stats: Dict[str, Any], theme_colors: dict) -> 'Figure':
+        """Draw the population dashboard on a headless chart host (runs on the render worker)."""
+        host = ChartHost(None, theme_colors, figsize=(12, 7))
+        palette = ('PRIMARY', 'SUCCESS', 'WARNING', 'INFO', 'ERROR', 'SECONDARY_DARK', 'PRIMARY_DARK')
+        
+        # Daily points issued, one line per pointsType
+        ax = host.reset_axes('daily_points', 2, 3, (1, 2))
+        daily_points = stats['daily_points']
+        for i, points_type in enumerate(daily_points.columns):
+            line, = ax.plot(daily_points.index, daily_points[points_type], linewidth=1.8, label=str(points_type))
+            host.bind_color(ax, line, palette[i % len(palette)])
+        if len(daily_points.columns):
+            legend = ax.legend(fontsize=8, frameon=False)
+            for text in legend.get_texts():
+                host.bind_color(ax, text, 'TEXT_PRIMARY')
+        host.style_axes(ax, 'Daily Points Issued by Type', title_size=11, tick_size=8)
+        ax.tick_params(axis='x', labelrotation=30)
+        
+        # Signups over time
+        ax = host.reset_axes('signups', 2, 3, 3)
+        cumulative = stats['cumulative_signups']
+        line, = ax.plot(cumulative.index, cumulative.values, linewidth=2)
+        host.bind_color(ax, line, 'PRIMARY')
+        host.bind_color(ax, ax.fill_between(cumulative.index, cumulative.values, alpha=0.15), 'PRIMARY', 'set_facecolor')
+        host.style_axes(ax, 'Cumulative Signups', title_size=11, tick_size=8)
+        ax.tick_params(axis='x', labelrotation=30)
+        
+        # Country distribution, affiliate levels and top referrers
+        for index, (key, series, title, role, horizontal) in enumerate((
+            ('countries', stats['countries'], 'Users by Country', 'INFO', False),
+            ('affiliate_levels', stats['affiliate_levels'], 'Users by Affiliate Level', 'SUCCESS', False),
+            ('top_referrers', stats['top_referrers'].iloc[::-1], 'Top Referrers', 'WARNING', True),
+        ), start=4):
+            ax = host.reset_axes(key, 2, 3, index)
+            labels = [str(label)[:24] for label in series.index]
+            bars = ax.barh(labels, series.values) if horizontal else ax.bar(labels, series.values)
+            for bar in bars:
+                host.bind_color(ax, bar, role, 'set_facecolor')
+            host.style_axes(ax, title, title_size=11, tick_size=8)
+            if horizontal:
+                ax.tick_params(axis='y', labelsize=7)
+        
+        host.figure.tight_layout(pad=2.0)
+        return host.figure
+    
+    @staticmethod
+    def timeline_points(user: Optional[Dict[str, Any]]) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """A matched user's points history as (matplotlib dates, points) in date order, or None."""
+        points_history = (user or {}).get('pointsHistory', [])
+        if not user or 'clerkId' not in user or not points_history:
+            return None
+        
+        dates = np.array([entry.get('createdAt', entry.get('_creationTime', 0)) for entry in points_history], dtype=float)
+        points = np.array([entry.get('pointsEarned', 0) for entry in points_history], dtype=float)
+        
+        # Convex timestamps are epoch milliseconds; fall back to seconds otherwise
+        unit = 'ms' if dates[0] > 1000000000000 else 's'
+        dates = mdates.date2num(dates.astype('int64').astype(f'datetime64[{unit}]'))
+        order = np.argsort(dates, kind='stable')
+        return dates[order], points[order]
+    
+    @staticmethod
+    def timeline_axes(host: ChartHost):
+        """The points history axes of a host, styled on first use."""
+        if 'timeline' not in host.axes:
+            ax = host.get_axes('timeline')
+            ax.xaxis_date()
+            host.style_axes(ax, 'Points History Timeline', 'Date', 'Points Earned', title_size=14)
+            host.figure.autofmt_xdate()
+        return host.get_axes('timeline')
+    
+    @staticmethod
+    def draw_timeline(host: ChartHost, dates: np.ndarray, points: np.ndarray):
+        """Update the points history line in place; long histories are drawn at screen resolution."""
+        ax = MigrationCharts.timeline_axes(host)
+        host.update_line('points', ax, dates, points, downsample=True, color_role='PRIMARY', marker='o', linewidth=2.5, markersize=8)
@@ -0,0 +1,139 @@
+"""Recent load, filter and chart timings for the performance HUD and diagnostics."""
+
+import importlib.util
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class PerfMonitor:
+    """Timing history shared by every view.
+
+    Loaders, filters and chart renderers call ``record`` with a kind
+    (``'load'``, ``'filter'`` or ``'chart'``), a label and the elapsed
+    seconds. Loads also pass rows and bytes so throughput can be derived.
+    Recording is safe from worker threads and costs a lock and a deque
+    append. Only the last ``HISTORY`` events are kept. The status bar HUD
+    polls ``snapshot``, and "Copy diagnostics" serializes ``diagnostics``.
+    """
+    
+    # Events kept for diagnostics
+    HISTORY = 200
+    
+    # psutil, when installed, reports current RSS on every platform
+    PSUTIL = importlib.util.find_spec('psutil') is not None
+    
+    _instance: Optional['PerfMonitor'] = None
+    
+    def __init__(self, history: int = HISTORY):
+        self.started = time.time()
+        self._events: deque = deque(maxlen=history)
+        self._last: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def instance(cls) -> 'PerfMonitor':
+        """The application-wide monitor."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
+    def record(self, kind: str, label: str, seconds: float,
+               rows: Optional[int] = None, bytes_read: Optional[int] = None) -> Dict[str, Any]:
+        """Add a timing event; rows and bytes add rows/s and MB/s."""
+        event: Dict[str, Any] = {'kind': kind, 'label': label, 'seconds': round(seconds, 6), 'at': round(time.time(), 3)}
+        if rows is not None:
+            event['rows'] = int(rows)
+            if seconds > 0:
+                event['rows_per_second'] = round(rows / seconds, 1)
+        if bytes_read is not None:
+            event['bytes'] = int(bytes_read)
+            if seconds > 0:
+                event['mb_per_second'] = round(bytes_read / seconds / 1e6, 2)
+        with self._lock:
+            self._events.append(event)
+            self._last[kind] = event
+        return event
+    
+    @contextmanager
+    def timer(self, kind: str, label: str, **counts) -> Iterator[Dict[str, Any]]:
+        """Time a block; set ``rows``/``bytes_read`` on the yielded dict to record them."""
+        started = time.perf_counter()
+        yield counts
+        self.record(kind, label, time.perf_counter() - started, counts.get('rows'), counts.get('bytes_read'))
+    
+    def last(self, kind: str) -> Optional[Dict[str, Any]]:
+        """The most recent event of a kind."""
+        with self._lock:
+            return self._last.get(kind)
+    
+    def history(self) -> List[Dict[str, Any]]:
+        """Recorded events, oldest first."""
+        with self._lock:
+            return list(self._events)
+    
+    @staticmethod
+    def process_rss() -> Optional[int]:
+        """Resident memory of this process in bytes (the peak where only that is reported)."""
+        if PerfMonitor.PSUTIL:
+            import psutil
+            return psutil.Process().memory_info().rss
+        try:
+            with open('/proc/self/statm') as f:
+                return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+        except (OSError, ValueError, IndexError, AttributeError):
+            pass
+        try:
+            import resource
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            # Bytes on macOS, kilobytes elsewhere
+            return peak if sys.platform == 'darwin' else peak * 1024
+        except (ImportError, AttributeError):
+            return None
+    
+    @staticmethod
+    def cache_sizes() -> Dict[str, int]:
+        """Bytes held by the chart cache in memory and by columnar stores on disk."""
+        sizes = {}
+        # Only report caches that are already in use; never import them just to measure
+        chart_cache = sys.modules.get('app.modules.chart_cache')
+        if chart_cache is not None:
+            sizes['chart_cache'] = chart_cache.ChartCache.instance().total_bytes
+        columnar_store = sys.modules.get('app.modules.columnar_store')
+        if columnar_store is not None:
+            # The running total; walking the store cache is too slow for every HUD refresh
+            stores = columnar_store.ColumnarStore.tracked_cache_bytes()
+            if stores is not None:
+                sizes['columnar_stores'] = stores
+        return sizes
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Latest event of each kind plus current memory and cache sizes."""
+        with self._lock:
+            latest = dict(self._last)
+        return {
+            'load': latest.get('load'),
+            'filter': latest.get('filter'),
+            'chart': latest.get('chart'),
+            'rss_bytes': self.process_rss(),
+            'cache_bytes': self.cache_sizes(),
+        }
+    
+    def diagnostics(self) -> str:
+        """Environment, memory, caches and the timing history as JSON for bug reports."""
+        return json.dumps({
+            'generated_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'uptime_seconds': round(time.time() - self.started, 1),
+            'python': sys.version,
+            'platform': platform.platform(),
+            'pid': os.getpid(),
+            'rss_bytes': self.process_rss(),
+            'cache_bytes': self.cache_sizes(),
+            'events': self.history(),
+        }, indent=2)
@@ -0,0 +1,159 @@
+"""Population-level aggregates for the migration dashboards."""
+
+from typing import Dict, List, Any
+import numpy as np
+import pandas as pd
+
+
+class PopulationStats:
+    """Builds columnar user/points tables once and aggregates them for dashboards."""
+    
+    # Number of categories kept in the distribution and leaderboard charts
+    TOP_N = 10
+    
+    @staticmethod
+    def build_columns(linked_users: List[Dict[str, Any]]) -> Dict[str, pd.DataFrame]:
+        """Flatten linked users into columnar user and points tables in one pass."""
+        user_ids, created, countries, levels, referrals, labels = [], [], [], [], [], []
+        points_time, points_type, points_earned = [], [], []
+        
+        for user in linked_users:
+            profile = user.get('convexProfile') or {}
+            clerk_data = user.get('clerkData') or {}
+            user_ids.append(user.get('clerkId', ''))
+            created.append(profile.get('createdAt', profile.get('_creationTime')))
+            countries.append(profile.get('country'))
+            levels.append(profile.get('affiliateLevel'))
+            referrals.append(user.get('totalReferralsMade', 0))
+            labels.append(profile.get('email') or clerk_data.get('primary_email_address') or user.get('clerkId', ''))
+            
+            for entry in user.get('pointsHistory', []):
+                points_time.append(entry.get('createdAt', entry.get('_creationTime')))
+                points_type.append(entry.get('pointsType'))
+                points_earned.append(entry.get('pointsEarned', 0))
+        
+        users = pd.DataFrame({
+            'user_id': user_ids,
+            'created_at': pd.to_datetime(pd.Series(created, dtype='float64'), unit='ms', errors='coerce'),
+            'country': pd.Series(countries, dtype='category'),
+            'affiliate_level': pd.Series(levels, dtype='category'),
+            'referrals': pd.Series(referrals, dtype='int64'),
+            'label': labels,
+        })
+        points = pd.DataFrame({
+            'created_at': pd.to_datetime(pd.Series(points_time, dtype='float64'), unit='ms', errors='coerce'),
+            'points_type': pd.Series(points_type, dtype='category'),
+            'points': pd.Series(points_earned, dtype='float64'),
+        })
+        return {'users': users, 'points': points}
+    
+    @staticmethod
+    def concat_columns(parts: List[Dict[str, pd.DataFrame]]) -> Dict[str, pd.DataFrame]:
+        """Join tables built from consecutive chunks of users."""
+        if len(parts) == 1:
+            return parts[0]
+        users = pd.concat([part['users'] for part in parts], ignore_index=True)
+        points = pd.concat([part['points'] for part in parts], ignore_index=True)
+        # Chunks with different categories concatenate to object columns
+        for frame, column in ((users, 'country'), (users, 'affiliate_level'), (points, 'points_type')):
+            frame[column] = frame[column].astype('category')
+        return {'users': users, 'points': points}
+    
+    @staticmethod
+    def level_sort_key(level: Any) -> tuple:
+        """Sort affiliate levels like L1, L2, ..., L10 numerically."""
+        text = str(level)
+        digits = ''.join(ch for ch in text if ch.isdigit())
+        return (int(digits) if digits else np.inf, text)
+    
+    @staticmethod
+    def compute(columns: Dict[str, pd.DataFrame]) -> Dict[str, Any]:
+        """Aggregate the columnar tables into every dashboard series."""
+        users = columns['users']
+        points = columns['points']
+        top_n = PopulationStats.TOP_N
+        
+        daily_points = (
+            points.dropna(subset=['created_at'])
+            .groupby([points['created_at'].dt.floor('D'), 'points_type'], observed=True)['points']
+            .sum()
+            .unstack(fill_value=0)
+            .sort_index()
+        )
+        signups = users['created_at'].dropna().dt.floor('D').value_counts().sort_index()
+        # Quiet days are zeros, not gaps to interpolate across
+        if len(daily_points):
+            daily_points = daily_points.asfreq('D', fill_value=0)
+        if len(signups):
+            signups = signups.asfreq('D', fill_value=0)
+        
+        countries = users['country'].value_counts()
+        if len(countries) > top_n:
+            countries = pd.concat([countries.iloc[:top_n], pd.Series({'Other': countries.iloc[top_n:].sum()})])
+        
+        levels = users['affiliate_level'].value_counts()
+        levels = levels[levels > 0]
+        levels = levels.reindex(sorted(levels.index, key=PopulationStats.level_sort_key))
+        
+        referrers = users[users['referrals'] > 0].nlargest(top_n, 'referrals')
+        top_referrers = pd.Series(referrers['referrals'].to_numpy(), index=referrers['label'].to_numpy())
+        
+        return {
+            'daily_points': daily_points,
+            'signups': signups,
+            'cumulative_signups': signups.cumsum(),
+            'countries': countries,
+            'affiliate_levels': levels,
+            'top_referrers': top_referrers,
+            'total_points': float(points['points'].sum()),
+            'total_users': len(users),
+        }
+    
+    @staticmethod
+    def encode(stats: Dict[str, Any]) -> Dict[str, Any]:
+        """The dashboard series as plain JSON values, for the session cache."""
+        encoded: Dict[str, Any] = {}
+        for name, value in stats.items():
+            if isinstance(value, (pd.Series, pd.DataFrame)):
+                dates = isinstance(value.index, pd.DatetimeIndex)
+                item = {
+                    'index': value.index.as_unit('ns').asi8.tolist() if dates else value.index.tolist(),
+                    'dates': dates,
+                    'freq': value.index.freqstr if dates else None,
+                    'index_name': value.index.name,
+                    'values': value.to_numpy().tolist(),
+                }
+                if isinstance(value, pd.DataFrame):
+                    item['columns'] = value.columns.tolist()
+                    item['columns_name'] = value.columns.name
+                else:
+                    item['name'] = value.name
+                encoded[name] = item
+            else:
+                encoded[name] = value
+        return encoded
+    
+    @staticmethod
+    def decode(encoded: Dict[str, Any]) -> Dict[str, Any]:
+        """Rebuild the dashboard series written by ``encode``."""
+        stats: Dict[str, Any] = {}
+        for name, value in encoded.items():
+            if not isinstance(value, dict):
+                stats[name] = value
+                continue
+            if value['dates']:
+                index = pd.DatetimeIndex(np.asarray(value['index'], dtype='datetime64[ns]'), freq=value['freq'], name=value['index_name'])
+            else:
+                index = pd.Index(value['index'], name=value['index_name'])
+            if 'columns' in value:
+                values = np.asarray(value['values'], dtype=float).reshape(len(index), len(value['columns']))
+                columns = pd.Index(value['columns'], name=value['columns_name'])
+                stats[name] = pd.DataFrame(values, index=index, columns=columns)
+            else:
+                stats[name] = pd.Series(value['values'], index=index, name=value['name'], dtype=None if value['values'] else float)
+        return stats
+    
+    @staticmethod
+    def from_users(linked_users: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build columns and aggregates for a freshly loaded dataset."""
+        return PopulationStats.compute(PopulationStats.build_columns(linked_users))
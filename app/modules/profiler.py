@@ -0,0 +1,307 @@
+"""Single-pass dataset profiling with approximate distinct counts and top-k."""
+
+from typing import Dict, Iterable, List, Any, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+
+# Two-sided 95% normal quantile used for every reported error bound
+Z_95 = 1.96
+
+
+class HyperLogLog:
+    """HyperLogLog distinct-count sketch over 64-bit hashes.
+
+    Uses ``2 ** precision`` registers; the relative standard error of the
+    estimate is ``1.04 / sqrt(2 ** precision)`` (about 1.6% at precision 12).
+    """
+    
+    def __init__(self, precision: int = 12):
+        self.precision = precision
+        self.m = 1 << precision
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+    
+    def add_hashes(self, hashes: np.ndarray):
+        """Fold an array of uint64 hashes into the registers."""
+        if len(hashes) == 0:
+            return
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        p = np.uint64(self.precision)
+        index = (hashes >> np.uint64(64 - self.precision)).astype(np.int64)
+        # Rank = leading zeros + 1 of the remaining bits; the top 32 bits are
+        # converted to float exactly, which caps the rank at 33
+        rest = ((hashes << p) >> np.uint64(32)).astype(np.float64)
+        rank = np.full(len(hashes), 33, dtype=np.int64)
+        nonzero = rest > 0
+        rank[nonzero] = 32 - np.floor(np.log2(rest[nonzero])).astype(np.int64)
+        
+        # Per-register max without ufunc.at: mark (register, rank) cells and
+        # take the highest marked rank of each register
+        marks = np.zeros((self.m, 34), dtype=bool)
+        marks[index, rank] = True
+        batch_max = 33 - np.argmax(marks[:, ::-1], axis=1)
+        batch_max[~marks.any(axis=1)] = 0
+        np.maximum(self.registers, batch_max.astype(np.uint8), out=self.registers)
+    
+    def estimate(self) -> float:
+        """Estimated number of distinct hashes seen."""
+        m = self.m
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.exp2(-self.registers.astype(np.float64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            # Small-range correction (linear counting)
+            return m * np.log(m / zeros)
+        return float(raw)
+    
+    @property
+    def relative_error(self) -> float:
+        """Relative standard error of the estimate."""
+        return 1.04 / np.sqrt(self.m)
+
+
+class SpaceSaving:
+    """Mergeable space-saving summary for approximate top-k counts.
+
+    Each tracked value carries an upper-bound count and the most it may
+    overcount by, so its true count lies in ``[count - error, count]``.
+    Batches are folded in as exact per-chunk counts trimmed to the
+    ``capacity`` largest, and merged with array operations instead of per
+    item, so a high-cardinality chunk costs one ``nlargest`` rather than a
+    Python loop over every distinct value.
+    """
+    
+    def __init__(self, capacity: int = 100):
+        self.capacity = capacity
+        self.counts = pd.Series([], index=pd.Index([], dtype=object), dtype=np.int64)
+        self.errors = pd.Series([], index=pd.Index([], dtype=object), dtype=np.int64)
+        # Largest count any untracked value can have
+        self.floor = 0
+    
+    def update(self, chunk_counts: pd.Series):
+        """Fold exact value counts of one chunk into the summary."""
+        top = chunk_counts.nlargest(self.capacity + 1)
+        # Values trimmed from the chunk occur at most this often in it
+        chunk_floor = 0
+        if len(top) > self.capacity:
+            chunk_floor = int(top.iloc[-1])
+            top = top.iloc[:self.capacity]
+        
+        # Tracked values may have had up to chunk_floor uncounted occurrences
+        counts = self.counts.to_numpy(dtype=np.int64) + chunk_floor
+        errors = self.errors.to_numpy(dtype=np.int64) + chunk_floor
+        values = top.to_numpy(dtype=np.int64)
+        positions = self.counts.index.get_indexer(top.index)
+        known = positions >= 0
+        counts[positions[known]] += values[known] - chunk_floor
+        errors[positions[known]] -= chunk_floor
+        
+        added = ~known
+        index = self.counts.index.append(top.index[added])
+        counts = np.concatenate([counts, values[added] + self.floor])
+        errors = np.concatenate([errors, np.full(int(added.sum()), self.floor, dtype=np.int64)])
+        self.floor += chunk_floor
+        
+        if len(counts) > self.capacity:
+            order = np.argsort(-counts, kind='stable')
+            self.floor = max(self.floor, int(counts[order[self.capacity]]))
+            keep = order[:self.capacity]
+            index, counts, errors = index[keep], counts[keep], errors[keep]
+        
+        self.counts = pd.Series(counts, index=index)
+        self.errors = pd.Series(errors, index=index)
+    
+    def top(self, k: int) -> List[Tuple[Any, int, int]]:
+        """The k largest (value, count, error) entries."""
+        counts = self.counts.to_numpy()
+        order = np.argsort(-counts, kind='stable')[:k]
+        errors = self.errors.to_numpy()
+        return [(self.counts.index[i], int(counts[i]), int(errors[i])) for i in order]
+
+
+class DatasetProfiler:
+    """Profile every column of a DataFrame in one chunked pass.
+
+    Per column, each chunk contributes null counts, running moments and
+    min/max for numeric data, HyperLogLog registers for distinct counts and
+    space-saving counters for the most frequent values. Frames with more
+    than ``SAMPLE_THRESHOLD`` rows are profiled from a uniform sample of
+    ``SAMPLE_ROWS`` rows, with counts scaled up and 95% error bounds reported.
+    """
+    
+    # Rows processed per chunk
+    CHUNK_ROWS = 1_000_000
+    # Frames above this many rows are sampled unless sampling is disabled
+    SAMPLE_THRESHOLD = 5_000_000
+    # Rows kept in sampled mode
+    SAMPLE_ROWS = 1_000_000
+    # HyperLogLog precision (registers = 2 ** precision)
+    HLL_PRECISION = 12
+    # Most frequent values reported per column, and counters tracked for them
+    TOP_K = 10
+    TOP_K_CAPACITY = 100
+    
+    @staticmethod
+    def sample_positions(total_rows: int, sample_rows: int, seed: int = 0) -> np.ndarray:
+        """Sorted uniform sample of ``sample_rows`` distinct positions in ``range(total_rows)``.
+
+        Memory stays proportional to the sample: only small populations are
+        permuted in full (``rng.choice`` would permute every row up to 50x
+        the sample size). Larger ones draw with replacement, drop repeats and
+        top up, then trim the surplus at random.
+        """
+        rng = np.random.default_rng(seed)
+        if total_rows <= 2 * sample_rows:
+            return np.sort(rng.permutation(total_rows)[:sample_rows])
+        
+        def distinct(values: np.ndarray) -> np.ndarray:
+            values = np.sort(values)
+            return values[np.concatenate(([True], values[1:] != values[:-1]))]
+        
+        positions = distinct(rng.integers(0, total_rows, int(sample_rows * 1.1)))
+        while len(positions) < sample_rows:
+            extra = rng.integers(0, total_rows, int((sample_rows - len(positions)) * 1.1) + 1)
+            positions = distinct(np.concatenate([positions, extra]))
+        if len(positions) > sample_rows:
+            positions = np.sort(positions[rng.permutation(len(positions))[:sample_rows]])
+        return positions
+    
+    @staticmethod
+    def sample_frame(df: pd.DataFrame, sample_rows: int, seed: int = 0) -> pd.DataFrame:
+        """Uniform sample of rows without replacement, in original row order."""
+        return df.take(DatasetProfiler.sample_positions(len(df), sample_rows, seed))
+    
+    @staticmethod
+    def profile(df: pd.DataFrame, sample: Optional[bool] = None, columns: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Profile a DataFrame.
+
+        ``sample=None`` samples only frames above ``SAMPLE_THRESHOLD`` rows;
+        True or False forces the choice. Returns overall sampling details and
+        a per-column dict of statistics with their error bounds.
+        """
+        total_rows = len(df)
+        if sample is None:
+            sample = total_rows > DatasetProfiler.SAMPLE_THRESHOLD
+        sampled = bool(sample) and total_rows > DatasetProfiler.SAMPLE_ROWS
+        frame = DatasetProfiler.sample_frame(df, DatasetProfiler.SAMPLE_ROWS) if sampled else df
+        
+        numeric_columns = set(frame.select_dtypes(include=[np.number]).columns)
+        categorical_columns = set(frame.select_dtypes(include=['object', 'string', 'category']).columns)
+        
+        profiles = {}
+        for col in (columns if columns is not None else frame.columns.tolist()):
+            profiles[col] = DatasetProfiler.profile_column(
+                frame[col], total_rows,
+                numeric=col in numeric_columns,
+                track_top=col in categorical_columns
+            )
+        
+        return {
+            'rows': total_rows,
+            'sampled': sampled,
+            'sample_rows': len(frame),
+            'confidence': 0.95,
+            'columns': profiles,
+        }
+    
+    @staticmethod
+    def profile_column(series: pd.Series, total_rows: int, numeric: bool, track_top: bool) -> Dict[str, Any]:
+        """Profile one column in a single chunked pass, scaling to ``total_rows``."""
+        chunk_rows = DatasetProfiler.CHUNK_ROWS
+        chunks = (series.iloc[start:start + chunk_rows] for start in range(0, len(series), chunk_rows))
+        return DatasetProfiler.profile_chunks(chunks, str(series.dtype), total_rows, numeric, track_top)
+    
+    @staticmethod
+    def profile_chunks(chunks: Iterable[pd.Series], dtype: str, total_rows: int, numeric: bool, track_top: bool) -> Dict[str, Any]:
+        """Profile one column delivered as a stream of chunks, scaling to ``total_rows``.
+
+        Only one chunk is held at a time, so columns stored out of core can be
+        profiled with bounded memory.
+        """
+        n = 0
+        hll = HyperLogLog(DatasetProfiler.HLL_PRECISION)
+        top = SpaceSaving(DatasetProfiler.TOP_K_CAPACITY) if track_top else None
+        
+        nulls = 0
+        count, mean, m2 = 0, 0.0, 0.0
+        minimum, maximum = np.inf, -np.inf
+        
+        for chunk in chunks:
+            n += len(chunk)
+            null_mask = chunk.isna().to_numpy()
+            nulls += int(null_mask.sum())
+            present = chunk[~null_mask]
+            
+            if numeric and len(present):
+                values = present.to_numpy(dtype=np.float64)
+                # Chan et al. pairwise merge of (count, mean, M2)
+                chunk_count = len(values)
+                chunk_mean = values.mean()
+                chunk_m2 = ((values - chunk_mean) ** 2).sum()
+                delta = chunk_mean - mean
+                combined = count + chunk_count
+                mean += delta * chunk_count / combined
+                m2 += chunk_m2 + delta * delta * count * chunk_count / combined
+                count = combined
+                minimum = min(minimum, values.min())
+                maximum = max(maximum, values.max())
+            
+            if hll is not None:
+                try:
+                    hll.add_hashes(pd.util.hash_pandas_object(present, index=False).to_numpy())
+                except TypeError:
+                    hll = None
+            
+            if top is not None:
+                try:
+                    counts = present.value_counts(sort=False)
+                    # Categorical columns report unused categories with a zero count
+                    top.update(counts[counts > 0])
+                except TypeError:
+                    # Unhashable values (nested JSON) have no meaningful top-k
+                    top = None
+        
+        scale = total_rows / n if n else 1.0
+        sampled = n < total_rows
+        # Finite population correction for sampling without replacement
+        fpc = np.sqrt(1 - n / total_rows) if sampled and total_rows > 1 else 0.0
+        
+        null_fraction = nulls / n if n else 0.0
+        profile = {
+            'dtype': dtype,
+            'null_count': int(round(nulls * scale)),
+            'null_count_error': int(np.ceil(Z_95 * np.sqrt(null_fraction * (1 - null_fraction) / n) * fpc * total_rows)) if n else 0,
+            'null_percentage': null_fraction * 100,
+            'count': int(round((n - nulls) * scale)),
+        }
+        
+        if hll is not None:
+            estimate = hll.estimate()
+            profile['distinct'] = int(round(estimate))
+            profile['distinct_error'] = int(np.ceil(Z_95 * hll.relative_error * estimate))
+            # A sample can only show a subset of the distinct values
+            profile['distinct_is_lower_bound'] = sampled
+        
+        if numeric:
+            # All-null numeric columns report NaN statistics, like describe()
+            if not count:
+                mean = minimum = maximum = np.nan
+            std = np.sqrt(m2 / (count - 1)) if count > 1 else np.nan
+            profile.update({
+                'mean': float(mean),
+                'std': float(std),
+                'min': float(minimum),
+                'max': float(maximum),
+                'mean_error': float(Z_95 * std / np.sqrt(count) * fpc) if count else np.nan,
+                'min_max_exact': not sampled,
+            })
+        
+        if top is not None:
+            entries = []
+            for value, upper, error in top.top(DatasetProfiler.TOP_K):
+                fraction = min(upper / n, 1.0)
+                sampling_error = Z_95 * np.sqrt(fraction * (1 - fraction) / n) * fpc * total_rows
+                entries.append((value, int(round(upper * scale)), int(np.ceil(error * scale + sampling_error))))
+            profile['top'] = entries
+        
+        return profile
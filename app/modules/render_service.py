@@ -0,0 +1,157 @@
+"""Build and rasterize matplotlib figures off the Tk thread."""
+
+import queue
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from app.modules.perf_monitor import PerfMonitor
+
+
+class RenderedImage:
+    """A rasterized figure: an RGBA buffer owned by the figure's Agg renderer."""
+    
+    def __init__(self, key: str, figure: Figure, buffer: memoryview, width: int, height: int):
+        self.key = key
+        # The buffer points into the renderer, so the figure must outlive it
+        self.figure = figure
+        self.buffer = buffer
+        self.width = width
+        self.height = height
+    
+    def to_photo(self):
+        """Wrap the buffer as a PIL image without copying and hand it to Tk."""
+        from PIL import Image, ImageTk
+        image = Image.frombuffer('RGBA', (self.width, self.height), self.buffer, 'raw', 'RGBA', 0, 1)
+        return ImageTk.PhotoImage(image)
+
+
+class RenderService:
+    """One worker thread that builds figures and rasterizes them with Agg.
+
+    Requests are keyed by the view they are drawn into. Submitting a new
+    request for a key supersedes the previous one: a request that has not
+    started is replaced (coalescing), and one that is already building or
+    drawing is abandoned at the next stage and its result dropped
+    (cancellation). Results are delivered on the Tk thread by a
+    ``widget.after`` poll that only runs while work is outstanding.
+
+    A single worker serializes all matplotlib work, which keeps figure
+    construction off the Tk thread without running two renders at once.
+    """
+    
+    # Interval between result polls on the Tk thread
+    POLL_MS = 30
+    
+    _instance: Optional['RenderService'] = None
+    
+    def __init__(self, widget):
+        self.widget = widget
+        self._condition = threading.Condition()
+        self._pending: "OrderedDict[str, tuple]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._callbacks: Dict[str, tuple] = {}
+        self._results: queue.Queue = queue.Queue()
+        self._outstanding = 0
+        self._polling = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    @classmethod
+    def instance(cls, widget) -> 'RenderService':
+        """The application-wide service, polled from the widget's toplevel."""
+        if cls._instance is None:
+            cls._instance = cls(widget.winfo_toplevel())
+        return cls._instance
+    
+    def submit(self, key: str, build: Callable[[], Figure],
+               on_ready: Callable[[RenderedImage], None],
+               on_error: Optional[Callable[[Exception], None]] = None) -> int:
+        """Render ``build()`` for a view, superseding earlier requests for that key."""
+        with self._condition:
+            generation = self._generations.get(key, 0) + 1
+            self._generations[key] = generation
+            if key not in self._pending:
+                self._outstanding += 1
+            self._pending[key] = (generation, build)
+            self._pending.move_to_end(key)
+            self._callbacks[key] = (generation, on_ready, on_error)
+            self._condition.notify()
+        self._ensure_polling()
+        return generation
+    
+    def cancel(self, key: str):
+        """Drop any queued or running render for a key."""
+        with self._condition:
+            self._generations[key] = self._generations.get(key, 0) + 1
+            if self._pending.pop(key, None) is not None:
+                self._outstanding -= 1
+            self._callbacks.pop(key, None)
+    
+    def is_current(self, key: str, generation: int) -> bool:
+        """Whether a render is still the latest request for its key."""
+        return self._generations.get(key) == generation
+    
+    def _run(self):
+        """Worker loop: render the oldest pending request, skipping stale ones."""
+        while True:
+            with self._condition:
+                while not self._pending:
+                    self._condition.wait()
+                key, (generation, build) = self._pending.popitem(last=False)
+            
+            try:
+                started = time.perf_counter()
+                figure = build()
+                if not self.is_current(key, generation):
+                    self._results.put(('stale', key, generation, None))
+                    continue
+                canvas = figure.canvas if isinstance(figure.canvas, FigureCanvasAgg) else FigureCanvasAgg(figure)
+                canvas.draw()
+                if not self.is_current(key, generation):
+                    self._results.put(('stale', key, generation, None))
+                    continue
+                width, height = canvas.get_width_height(physical=True)
+                result = RenderedImage(key, figure, canvas.buffer_rgba(), width, height)
+                PerfMonitor.instance().record('chart', key, time.perf_counter() - started)
+                self._results.put(('ready', key, generation, result))
+            except Exception as e:
+                self._results.put(('error', key, generation, e))
+    
+    def _ensure_polling(self):
+        """Start the Tk-side poll if it is not already running."""
+        if not self._polling:
+            self._polling = True
+            self.widget.after(self.POLL_MS, self._poll)
+    
+    def _poll(self):
+        """Deliver finished renders that are still current, on the Tk thread."""
+        while True:
+            try:
+                kind, key, generation, payload = self._results.get_nowait()
+            except queue.Empty:
+                break
+            
+            with self._condition:
+                self._outstanding -= 1
+                callbacks = self._callbacks.get(key)
+                current = callbacks is not None and callbacks[0] == generation
+                if current:
+                    del self._callbacks[key]
+            if not current:
+                continue
+            
+            _, on_ready, on_error = callbacks
+            if kind == 'ready':
+                on_ready(payload)
+            elif kind == 'error' and on_error:
+                on_error(payload)
+        
+        with self._condition:
+            busy = self._outstanding > 0
+        if busy:
+            self.widget.after(self.POLL_MS, self._poll)
+        else:
+            self._polling = False
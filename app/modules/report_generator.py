@@ -0,0 +1,290 @@
+"""Headless Migration Tool report: charts rendered with Agg in a process pool."""
+
+import html
+import io
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from app.modules.file_loader import FileLoader
+from app.modules.theme import Theme
+
+
+# Output formats a chart can be written in
+RENDER_FORMATS = ('png', 'svg', 'html')
+
+
+class ReportGenerator:
+    """Render the Migration Tool charts to files and write a static HTML report.
+
+    Reads ``linked_users.jsonl``, ``unmatched_users.jsonl`` and
+    ``sync_report.json`` from a data directory and renders the sync
+    statistics, the population dashboard and a points timeline per selected
+    user, using the same drawing code as the app on headless Agg canvases.
+
+    Charts are rendered in a process pool. Each worker keeps one timeline
+    figure and updates its line in place per user, so a timeline costs a
+    rasterization rather than a figure build. Timelines are sent as
+    compact (dates, points) arrays, not whole user records.
+    """
+    
+    # Timelines handed to a worker per task
+    CHUNK_SIZE = 64
+    
+    # Resolution of raster output
+    DPI = 100
+    
+    # zlib level for PNG output: level 1 encodes several times faster than the default 6
+    PNG_COMPRESSION = 1
+    
+    # Per-worker render settings and the reused timeline host, set by init_worker
+    _worker: Dict[str, Any] = {}
+    
+    def __init__(self, data_dir: Union[str, Path] = "output", report_dir: Union[str, Path] = "report",
+                 formats: Iterable[str] = ('png',), theme: str = "light", workers: Optional[int] = None):
+        self.data_dir = Path(data_dir)
+        self.report_dir = Path(report_dir)
+        self.formats = tuple(formats)
+        unknown = [fmt for fmt in self.formats if fmt not in RENDER_FORMATS]
+        if unknown or not self.formats:
+            raise ValueError(f"Unsupported format(s): {', '.join(unknown) or 'none given'}; use {', '.join(RENDER_FORMATS)}")
+        self.theme = theme
+        self.theme_colors = Theme.get_dark_theme() if theme == "dark" else Theme.get_light_theme()
+        self.workers = workers or min(os.cpu_count() or 1, 8)
+        
+        self.linked_users: List[Dict[str, Any]] = []
+        self.unmatched_users: List[Dict[str, Any]] = []
+        self.sync_report: Optional[Dict[str, Any]] = None
+    
+    def load(self):
+        """Load the comparer's output files (missing files are treated as empty)."""
+        linked = self.data_dir / "linked_users.jsonl"
+        unmatched = self.data_dir / "unmatched_users.jsonl"
+        report = self.data_dir / "sync_report.json"
+        self.linked_users = FileLoader.load_jsonl(linked) if linked.exists() else []
+        self.unmatched_users = FileLoader.load_jsonl(unmatched) if unmatched.exists() else []
+        self.sync_report = FileLoader.load_json(report) if report.exists() else None
+        if not self.linked_users and self.sync_report is None:
+            raise FileNotFoundError(f"No linked_users.jsonl or sync_report.json in {self.data_dir}")
+    
+    def select_users(self, user_ids: Optional[Iterable[str]] = None, top: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Matched users to chart: the given Clerk ids or emails, else the ``top`` by points (all if None)."""
+        users = [user for user in self.linked_users if user.get('pointsHistory')]
+        if user_ids is not None:
+            wanted = set(user_ids)
+            return [user for user in users if user.get('clerkId') in wanted or self.user_email(user) in wanted]
+        users.sort(key=lambda user: user.get('totalPointsEarned', 0) or 0, reverse=True)
+        return users if top is None else users[:top]
+    
+    @staticmethod
+    def user_email(user: Dict[str, Any]) -> str:
+        """A matched user's email, from Clerk or else Convex."""
+        return (user.get('clerkData') or {}).get('primary_email_address') or (user.get('convexProfile') or {}).get('email') or ''
+    
+    @staticmethod
+    def file_stem(text: str) -> str:
+        """A file-system-safe name for a chart."""
+        return re.sub(r'[^A-Za-z0-9_.-]', '_', text)[:120]
+    
+    def build_jobs(self, users: List[Dict[str, Any]]) -> Tuple[List[tuple], List[tuple]]:
+        """(summary chart jobs, timeline jobs) as picklable (kind, name, payload) tuples."""
+        from app.modules.migration_charts import MigrationCharts
+        from app.modules.population_stats import PopulationStats
+        
+        charts = []
+        if self.sync_report:
+            charts.append(('stats', 'sync_stats', self.sync_report))
+        if self.linked_users:
+            charts.append(('dashboard', 'population_dashboard', PopulationStats.from_users(self.linked_users)))
+        
+        timelines = []
+        for user in users:
+            points = MigrationCharts.timeline_points(user)
+            if points is None:
+                continue
+            label = self.user_email(user) or user.get('clerkId', '')
+            timelines.append(('timeline', f"timeline_{self.file_stem(user.get('clerkId', ''))}", (label, *points)))
+        return charts, timelines
+    
+    @staticmethod
+    def init_worker(directory: str, formats: Tuple[str, ...], theme_colors: dict):
+        """Pool initializer: force the Agg backend and remember the render settings."""
+        import matplotlib
+        matplotlib.use('Agg')
+        ReportGenerator._worker = {'directory': Path(directory), 'formats': formats, 'theme_colors': theme_colors, 'timeline': None}
+    
+    @staticmethod
+    def render_job(job: tuple) -> Tuple[str, str, List[str], float]:
+        """Render one chart in a worker; returns (kind, name, files written, seconds)."""
+        from app.modules.chart_host import ChartHost
+        from app.modules.migration_charts import MigrationCharts
+        
+        started = time.perf_counter()
+        kind, name, payload = job
+        settings = ReportGenerator._worker
+        theme_colors = settings['theme_colors']
+        if kind == 'stats':
+            figure = MigrationCharts.build_stats_charts(payload, theme_colors)
+        elif kind == 'dashboard':
+            figure = MigrationCharts.build_population_dashboard(payload, theme_colors)
+        elif kind == 'timeline':
+            # One timeline figure per worker, updated in place for every user
+            host = settings['timeline']
+            if host is None:
+                host = settings['timeline'] = ChartHost(None, theme_colors)
+            label, dates, points = payload
+            MigrationCharts.draw_timeline(host, dates, points)
+            MigrationCharts.timeline_axes(host).title.set_text(f"Points History Timeline - {label}")
+            figure = host.figure
+        else:
+            raise ValueError(f"Unknown chart kind: {kind}")
+        
+        files = ReportGenerator.save_figure(figure, settings['directory'], name, settings['formats'], title=name)
+        return kind, name, files, time.perf_counter() - started
+    
+    @staticmethod
+    def save_figure(figure, directory: Path, name: str, formats: Tuple[str, ...], title: str = "") -> List[str]:
+        """Write a figure in each format; HTML pages embed the chart as inline SVG."""
+        files = []
+        svg = None
+        for fmt in formats:
+            if fmt == 'png':
+                figure.savefig(directory / f"{name}.png", format='png', dpi=ReportGenerator.DPI,
+                               pil_kwargs={'compress_level': ReportGenerator.PNG_COMPRESSION})
+                files.append(f"{name}.png")
+                continue
+            if svg is None:
+                buffer = io.StringIO()
+                figure.savefig(buffer, format='svg')
+                svg = buffer.getvalue()
+            if fmt == 'svg':
+                (directory / f"{name}.svg").write_text(svg, encoding='utf-8')
+            else:
+                # Drop the XML prolog; the SVG element is embedded in the page
+                body = svg[svg.index('<svg'):]
+                page = f"<!DOCTYPE html>\n<html>\n<head><meta charset=\"utf-8\"><title>{html.escape(title)}</title></head>\n<body>\n{body}\n</body>\n</html>\n"
+                (directory / f"{name}.html").write_text(page, encoding='utf-8')
+            files.append(f"{name}.{fmt}")
+        return files
+    
+    def render(self, jobs: List[tuple], progress=None) -> List[Tuple[str, str, List[str], float]]:
+        """Render jobs in the process pool (in-process with one worker), in order."""
+        directory = str(self.report_dir / "charts")
+        if self.workers <= 1 or len(jobs) <= 1:
+            ReportGenerator.init_worker(directory, self.formats, self.theme_colors)
+            results = []
+            for job in jobs:
+                results.append(ReportGenerator.render_job(job))
+                if progress:
+                    progress(len(results), len(jobs))
+            return results
+        
+        chunk_size = max(1, min(self.CHUNK_SIZE, len(jobs) // (self.workers * 4) or 1))
+        results = []
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=ReportGenerator.init_worker,
+                                 initargs=(directory, self.formats, self.theme_colors)) as pool:
+            for result in pool.map(ReportGenerator.render_job, jobs, chunksize=chunk_size):
+                results.append(result)
+                if progress:
+                    progress(len(results), len(jobs))
+        return results
+    
+    def run(self, user_ids: Optional[Iterable[str]] = None, top: Optional[int] = None, progress=None) -> Dict[str, Any]:
+        """Render every chart and write ``index.html`` and ``report.json``; returns the timing summary."""
+        started = time.perf_counter()
+        (self.report_dir / "charts").mkdir(parents=True, exist_ok=True)
+        users = self.select_users(user_ids, top)
+        charts, timelines = self.build_jobs(users)
+        prepared = time.perf_counter()
+        
+        chart_results = self.render(charts)
+        charts_done = time.perf_counter()
+        timeline_results = self.render(timelines, progress)
+        timelines_done = time.perf_counter()
+        
+        timeline_seconds = timelines_done - charts_done
+        summary = {
+            'data_dir': str(self.data_dir),
+            'formats': list(self.formats),
+            'theme': self.theme,
+            'workers': self.workers,
+            'charts': len(chart_results),
+            'timelines': len(timeline_results),
+            'prepare_seconds': round(prepared - started, 3),
+            'chart_seconds': round(charts_done - prepared, 3),
+            'timeline_seconds': round(timeline_seconds, 3),
+            'timelines_per_second': round(len(timeline_results) / timeline_seconds, 1) if timeline_seconds > 0 else None,
+            # Worker time per timeline, excluding pool start-up and transfer
+            'mean_timeline_ms': round(sum(result[3] for result in timeline_results) / len(timeline_results) * 1000, 2) if timeline_results else None,
+        }
+        self.write_index(users, chart_results, timeline_results, summary)
+        summary['total_seconds'] = round(time.perf_counter() - started, 3)
+        with open(self.report_dir / "report.json", 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+        return summary
+    
+    def write_index(self, users: List[Dict[str, Any]], chart_results: List[tuple], timeline_results: List[tuple], summary: Dict[str, Any]):
+        """Write the static ``index.html`` linking every rendered chart."""
+        def chart_link(files: List[str], embed: bool) -> str:
+            images = [file for file in files if file.endswith(('.png', '.svg'))]
+            if embed and images:
+                return f'<img src="charts/{html.escape(images[0])}" loading="lazy">'
+            return " ".join(f'<a href="charts/{html.escape(file)}">{html.escape(file.rsplit(".", 1)[1])}</a>' for file in files)
+        
+        stats = self.sync_report or {}
+        rows = "".join(
+            f"<tr><th>{html.escape(label)}</th><td>{value}</td></tr>"
+            for label, value in (
+                ("Total Clerk Users", f"{stats.get('total_clerk_users', 0):,}"),
+                ("Total Convex Users", f"{stats.get('total_convex_users', 0):,}"),
+                ("Matched Users", f"{stats.get('matched_users', 0):,}"),
+                ("Clerk Only", f"{stats.get('clerk_only', 0):,}"),
+                ("Convex Only", f"{stats.get('convex_only', 0):,}"),
+                ("Match Rate", f"{stats.get('match_rate_percent', 0):.2f}%"),
+                ("Unmatched Records", f"{len(self.unmatched_users):,}"),
+            )
+        )
+        charts = "".join(f"<section><h2>{html.escape(name.replace('_', ' ').title())}</h2>{chart_link(files, True)}</section>"
+                         for _, name, files, _ in chart_results)
+        
+        by_name = {f"timeline_{self.file_stem(user.get('clerkId', ''))}": user for user in users}
+        timeline_rows = []
+        for _, name, files, _ in timeline_results:
+            user = by_name.get(name, {})
+            timeline_rows.append(
+                f"<tr><td>{html.escape(user.get('clerkId', ''))}</td><td>{html.escape(self.user_email(user))}</td>"
+                f"<td>{(user.get('totalPointsEarned', 0) or 0):,.0f}</td><td>{len(user.get('pointsHistory', [])):,}</td>"
+                f"<td>{chart_link(files, False)}</td></tr>"
+            )
+        
+        colors = self.theme_colors
+        page = f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Migration Report</title>
+<style>
+body {{ font-family: sans-serif; margin: 24px; background: {colors['BG_SECONDARY']}; color: {colors['TEXT_PRIMARY']}; }}
+table {{ border-collapse: collapse; margin-bottom: 24px; }}
+th, td {{ text-align: left; padding: 4px 12px; border-bottom: 1px solid {colors['BORDER']}; }}
+img {{ max-width: 100%; }}
+a {{ color: {colors['PRIMARY']}; }}
+</style>
+</head>
+<body>
+<h1>Migration Report</h1>
+<p>{summary['charts']} charts and {summary['timelines']:,} timelines rendered in {summary['chart_seconds'] + summary['timeline_seconds']:.1f}s on {summary['workers']} worker{'s' if summary['workers'] != 1 else ''}.</p>
+<table>{rows}</table>
+{charts}
+<h2>Points History Timelines</h2>
+<table>
+<tr><th>Clerk ID</th><th>Email</th><th>Points</th><th>History Entries</th><th>Chart</th></tr>
+{"".join(timeline_rows)}
+</table>
+</body>
+</html>
+"""
+        (self.report_dir / "index.html").write_text(page, encoding='utf-8')
@@ -0,0 +1,60 @@
+"""Session Manager for restoring the previous workspace on startup."""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+class SessionManager:
+    """Persists session state (open files, filters, selection) between runs.
+
+    State is kept as one dict per section (``'window'``, ``'explorer'``,
+    ``'migration'``) in ``~/.data_explorer_session.json``, next to the theme
+    preference. Each tab reads its section on construction and writes it
+    back after a load and when the window closes. Datasets themselves are
+    not stored here: the explorer and the Migration Tool reopen them from
+    the columnar cache.
+    """
+    
+    def __init__(self, config_file: Optional[str] = None):
+        self.config_file = Path(config_file) if config_file else Path.home() / ".data_explorer_session.json"
+        self.state: Dict[str, Dict[str, Any]] = {}
+        
+        # Load saved session
+        self.load_session()
+    
+    def load_session(self):
+        """Load session state from config file."""
+        try:
+            if self.config_file.exists():
+                with open(self.config_file, 'r') as f:
+                    state = json.load(f)
+                if isinstance(state, dict):
+                    self.state = {section: values for section, values in state.items() if isinstance(values, dict)}
+        except Exception:
+            pass  # Start a fresh session if loading fails
+    
+    def save_session(self):
+        """Save session state to config file."""
+        try:
+            # Write under a temporary name so a crash never leaves a truncated file
+            partial = self.config_file.with_suffix(".tmp")
+            with open(partial, 'w') as f:
+                json.dump(self.state, f, indent=2)
+            partial.replace(self.config_file)
+        except Exception:
+            pass  # Continue if saving fails
+    
+    def get(self, section: str) -> Dict[str, Any]:
+        """The saved state of a section (empty if none)."""
+        return dict(self.state.get(section, {}))
+    
+    def update(self, section: str, **values):
+        """Replace values in a section and save."""
+        self.state.setdefault(section, {}).update(values)
+        self.save_session()
+    
+    def clear(self, section: str):
+        """Forget a section and save."""
+        if self.state.pop(section, None) is not None:
+            self.save_session()
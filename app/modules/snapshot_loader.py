@@ -0,0 +1,199 @@
+"""Open a Convex snapshot export as a set of lazily loaded, joinable tables."""
+
+import json
+import threading
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, List, Set, Union
+import numpy as np
+import pandas as pd
+from app.modules.file_loader import FileLoader
+from app.modules.json_flattener import JsonFlattener
+from app.modules.data_processor import DataProcessor
+
+
+class SnapshotLoader:
+    """The tables of a Convex snapshot directory, parsed on first access.
+
+    Tables are registered from ``_tables/documents.jsonl`` (falling back to
+    every ``<table>/documents.jsonl``) without reading them. ``table`` parses
+    one through the JSON flattener and dtype compaction the first time it is
+    asked for; nested arrays become child tables named ``<table>.<path>``.
+
+    ``infer_joins`` proposes foreign keys by value containment over the
+    first ``SAMPLE_RECORDS`` records of each table, and ``join`` executes one
+    as a hash join on factorized key codes.
+    """
+    
+    # Records read per table when inferring join keys
+    SAMPLE_RECORDS = 5000
+    
+    # Share of a field's distinct values that must be keys of the other table
+    MIN_CONTAINMENT = 0.5
+    
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+        self.paths: Dict[str, Path] = {}
+        self._tables: Dict[str, pd.DataFrame] = {}
+        self._memory: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        
+        names = []
+        catalog = self.directory / "_tables" / "documents.jsonl"
+        if catalog.exists():
+            names = [entry['name'] for entry in FileLoader.load_jsonl(catalog) if entry.get('name')]
+        else:
+            names = sorted(path.parent.name for path in self.directory.glob("*/documents.jsonl") if not path.parent.name.startswith('_'))
+        for name in names:
+            path = self.directory / name / "documents.jsonl"
+            if path.exists():
+                self.paths[name] = path
+    
+    @staticmethod
+    def is_snapshot(path: Union[str, Path]) -> bool:
+        """Whether a path is an unzipped Convex snapshot export directory."""
+        path = Path(path)
+        return path.is_dir() and ((path / "_tables" / "documents.jsonl").exists() or any(path.glob("*/documents.jsonl")))
+    
+    @property
+    def table_names(self) -> List[str]:
+        """Registered tables, non-empty ones first."""
+        return sorted(self.paths, key=lambda name: (self.paths[name].stat().st_size == 0, name))
+    
+    def is_loaded(self, name: str) -> bool:
+        """Whether a table (or child table) has been parsed already."""
+        return name in self._tables
+    
+    def memory_report(self, name: str) -> Dict[str, Dict[str, Any]]:
+        """The dtype compaction report of a loaded table."""
+        return self._memory.get(name, {})
+    
+    def table(self, name: str) -> pd.DataFrame:
+        """A table as a DataFrame, parsing it (and its child tables) on first access."""
+        with self._lock:
+            if name in self._tables:
+                return self._tables[name]
+            
+            base = name if name in self.paths else name.split('.', 1)[0]
+            if base not in self.paths:
+                raise KeyError(f"No table named {name!r} in snapshot {self.directory}")
+            
+            path = self.paths[base]
+            flattener = JsonFlattener.for_file(path)
+            chunks = [chunk for chunk, _ in FileLoader.iter_file_chunks(path, flattener=flattener)]
+            if chunks:
+                data = chunks[0] if len(chunks) == 1 else pd.concat(chunks, ignore_index=True)
+            else:
+                data = JsonFlattener.build_frame([], flattener.hints)
+            self._tables[base], self._memory[base] = DataProcessor.optimize_dtypes(data)
+            for path_name, child in flattener.child_tables().items():
+                child_name = f"{base}.{path_name}"
+                self._tables[child_name], self._memory[child_name] = DataProcessor.optimize_dtypes(child)
+            
+            if name not in self._tables:
+                raise KeyError(f"No table named {name!r} in snapshot {self.directory}")
+            return self._tables[name]
+    
+    def child_tables(self, name: str) -> List[str]:
+        """Child tables exploded from a loaded table's nested arrays."""
+        return [child for child in self._tables if child.startswith(f"{name}.")]
+    
+    def sample_strings(self, name: str) -> Dict[str, List[str]]:
+        """Top-level string field values of a table's first records, read without flattening."""
+        values: Dict[str, List[str]] = {}
+        with open(self.paths[name], 'r', encoding='utf-8') as f:
+            for line in islice(f, self.SAMPLE_RECORDS):
+                line = line.strip()
+                if not line:
+                    continue
+                for field, value in json.loads(line).items():
+                    if isinstance(value, str):
+                        values.setdefault(field, []).append(value)
+        return values
+    
+    def infer_joins(self) -> List[Dict[str, Any]]:
+        """Likely foreign keys between tables, strongest first.
+
+        A field whose sampled values are all distinct is a key candidate.
+        Any other string field referencing it, with at least
+        ``MIN_CONTAINMENT`` of its distinct values found among the key's
+        values, is reported as ``{'left': key table, 'left_on': key,
+        'right': referencing table, 'right_on': field, 'containment': share,
+        'matched': distinct values found}``.
+        """
+        samples = {name: self.sample_strings(name) for name in self.paths if self.paths[name].stat().st_size > 0}
+        keys: Dict[tuple, Set[str]] = {}
+        fields: Dict[tuple, Set[str]] = {}
+        for table, columns in samples.items():
+            for field, values in columns.items():
+                distinct = set(values)
+                fields[(table, field)] = distinct
+                if len(distinct) == len(values):
+                    keys[(table, field)] = distinct
+        
+        joins = []
+        for (table, field), distinct in fields.items():
+            for (key_table, key), key_values in keys.items():
+                if (key_table, key) == (table, field):
+                    continue
+                matched = len(distinct & key_values)
+                containment = matched / len(distinct)
+                if matched and containment >= self.MIN_CONTAINMENT:
+                    joins.append({
+                        'left': key_table, 'left_on': key,
+                        'right': table, 'right_on': field,
+                        'containment': containment, 'matched': matched,
+                    })
+        joins.sort(key=lambda join: (-join['containment'], -join['matched'], join['left'], join['right']))
+        return joins
+    
+    def join(self, left: str, left_on: str, right: str, right_on: str, how: str = 'left') -> pd.DataFrame:
+        """Join two tables; right-hand columns are prefixed with ``<right>.``."""
+        return SnapshotLoader.hash_join(self.table(left), left_on, self.table(right), right_on, how, prefix=f"{right}.")
+    
+    @staticmethod
+    def key_codes(keys: pd.Series, uniques: pd.Index) -> np.ndarray:
+        """Positions of each key in ``uniques`` (-1 if absent), hashing categories not rows."""
+        if isinstance(keys.dtype, pd.CategoricalDtype):
+            category_codes = uniques.get_indexer(keys.cat.categories)
+            codes = keys.cat.codes.to_numpy()
+            return np.where(codes >= 0, category_codes[codes], -1)
+        return uniques.get_indexer(keys)
+    
+    @staticmethod
+    def hash_join(left: pd.DataFrame, left_on: str, right: pd.DataFrame, right_on: str,
+                  how: str = 'left', prefix: str = "right.") -> pd.DataFrame:
+        """Left or inner hash join on integer key codes.
+
+        The right keys are factorized into codes; left keys are mapped onto
+        the same codes (once per category for categorical columns). Right
+        rows are grouped by code with one stable sort, so every left row
+        expands to its matches (or one unmatched row for a left join) with
+        vectorized repeats rather than per-row lookups.
+        """
+        if how not in ('left', 'inner'):
+            raise ValueError(f"Unsupported join type: {how}")
+        
+        right_codes, uniques = pd.factorize(right[right_on])
+        left_codes = SnapshotLoader.key_codes(left[left_on], pd.Index(uniques))
+        
+        # Right rows grouped by key code
+        order = np.argsort(right_codes, kind='stable')
+        counts = np.bincount(right_codes[right_codes >= 0], minlength=len(uniques))
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1])) + int((right_codes < 0).sum())
+        
+        matched = left_codes >= 0
+        matches = np.where(matched, counts[np.where(matched, left_codes, 0)] if len(counts) else 0, 0)
+        repeats = np.maximum(matches, 1) if how == 'left' else matches
+        total = int(repeats.sum())
+        
+        left_rows = np.repeat(np.arange(len(left)), repeats)
+        offsets = np.arange(total) - np.repeat(np.cumsum(repeats) - repeats, repeats)
+        first = np.repeat(np.where(matched, starts[np.where(matched, left_codes, 0)] if len(starts) else 0, 0), repeats)
+        has_match = np.repeat(matches > 0, repeats)
+        right_rows = np.where(has_match, order[np.minimum(first + offsets, len(order) - 1)] if len(order) else -1, -1)
+        
+        result = left.iloc[left_rows].reset_index(drop=True)
+        right_part = right.reset_index(drop=True).reindex(right_rows).reset_index(drop=True)
+        right_part.columns = [f"{prefix}{col}" for col in right_part.columns]
+        return pd.concat([result, right_part], axis=1)
@@ -0,0 +1,141 @@
+"""Indexed search over DataFrame columns for the explorer table."""
+
+import shlex
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+import numpy as np
+import pandas as pd
+
+
+# A parsed query term: (column or None for any column, lowered term, prefix only)
+SearchTerm = Tuple[Optional[str], str, bool]
+
+
+class TableSearchIndex:
+    """Lowered per-column string indexes evaluated as vectorized masks.
+
+    Each column is lowered and UTF-8 encoded into a fixed-width bytes array
+    the first time it is needed (or ahead of time via ``build_all`` on a
+    worker thread), so substring and prefix matches run through
+    ``np.char.find``/``np.char.startswith`` instead of a per-row Python
+    scan. Columns whose longest value exceeds ``MAX_FIXED_WIDTH`` bytes are
+    kept as a lowered object Series to avoid padding every row to that width.
+
+    Queries are whitespace-separated terms that must all match:
+
+    - ``gmail``        substring of any column
+    - ``^john``        prefix of any column
+    - ``email:gmail``  substring of one column (``email:^john`` for a prefix)
+
+    Results are sorted row positions. When a query only narrows the previous
+    one (e.g. typing another character), it is evaluated on the previous
+    matches instead of the whole frame.
+    """
+    
+    # Longest encoded value stored in a fixed-width bytes array
+    MAX_FIXED_WIDTH = 256
+    
+    def __init__(self, data: pd.DataFrame):
+        self.data = data
+        self.column_names = {str(col).lower(): i for i, col in enumerate(data.columns)}
+        self._indexes: Dict[int, Union[np.ndarray, pd.Series]] = {}
+        self._lock = threading.Lock()
+        self._last_terms: Optional[List[SearchTerm]] = None
+        self._last_positions: Optional[np.ndarray] = None
+    
+    @property
+    def ready(self) -> bool:
+        """Whether every column has been indexed."""
+        return len(self._indexes) == self.data.shape[1]
+    
+    def build_column(self, column: int) -> Union[np.ndarray, pd.Series]:
+        """Build (or fetch) the lowered index of a column by position."""
+        with self._lock:
+            index = self._indexes.get(column)
+            if index is not None:
+                return index
+            
+            series = self.data.iloc[:, column]
+            lowered = series.astype(str).str.lower().where(series.notna().to_numpy(), "")
+            encoded = lowered.str.encode('utf-8')
+            width = int(encoded.str.len().max()) if len(encoded) else 0
+            if width <= self.MAX_FIXED_WIDTH:
+                index = np.array(encoded.tolist(), dtype=f'S{max(width, 1)}')
+            else:
+                index = lowered.astype(object).reset_index(drop=True)
+            self._indexes[column] = index
+            return index
+    
+    def build_all(self) -> Iterator[str]:
+        """Index every column, yielding each column name once built (for a worker thread)."""
+        for column in range(self.data.shape[1]):
+            self.build_column(column)
+            yield str(self.data.columns[column])
+    
+    def parse_query(self, query: str) -> List[SearchTerm]:
+        """Split a query into (column, term, prefix) terms."""
+        try:
+            tokens = shlex.split(query)
+        except ValueError:
+            # Unbalanced quotes while typing
+            tokens = query.split()
+        
+        terms = []
+        for token in tokens:
+            column = None
+            name, sep, rest = token.partition(':')
+            if sep and name.lower() in self.column_names:
+                column, token = name.lower(), rest
+            prefix = token.startswith('^')
+            term = token[1:] if prefix else token
+            if term:
+                terms.append((column, term.lower(), prefix))
+        return terms
+    
+    @staticmethod
+    def narrows(terms: List[SearchTerm], previous: Optional[List[SearchTerm]]) -> bool:
+        """Whether every row matching ``terms`` must also match ``previous``."""
+        if previous is None or len(terms) < len(previous):
+            return False
+        for (column, term, prefix), (old_column, old_term, old_prefix) in zip(terms, previous):
+            if column != old_column or prefix != old_prefix or not term.startswith(old_term):
+                return False
+        return True
+    
+    def match_column(self, column: int, term: str, prefix: bool, rows: Optional[np.ndarray]) -> np.ndarray:
+        """Boolean mask of a term over one column, optionally restricted to rows."""
+        index = self.build_column(column)
+        if isinstance(index, np.ndarray):
+            values = index if rows is None else index[rows]
+            needle = term.encode('utf-8')
+            if prefix:
+                return np.char.startswith(values, needle)
+            return np.char.find(values, needle) >= 0
+        
+        values = index if rows is None else index.iloc[rows]
+        if prefix:
+            return values.str.startswith(term).to_numpy(dtype=bool)
+        return values.str.contains(term, regex=False).to_numpy(dtype=bool)
+    
+    def search(self, query: str) -> Optional[np.ndarray]:
+        """Sorted row positions matching a query, or None for an empty query."""
+        terms = self.parse_query(query)
+        if not terms:
+            self._last_terms = self._last_positions = None
+            return None
+        
+        # Refine the previous result when the new query can only narrow it
+        rows = self._last_positions if self.narrows(terms, self._last_terms) else None
+        
+        for column, term, prefix in terms:
+            columns = [self.column_names[column]] if column else range(self.data.shape[1])
+            mask = np.zeros(len(self.data) if rows is None else len(rows), dtype=bool)
+            for position in columns:
+                mask |= self.match_column(position, term, prefix, rows)
+            rows = np.flatnonzero(mask) if rows is None else rows[mask]
+            if not len(rows):
+                break
+        
+        self._last_terms = terms
+        self._last_positions = rows
+        return rows
@@ -93,120 +93,151 @@ class Theme:
             'TEXT_MUTED': Theme.DARK_TEXT_MUTED,
         }
     
+    # Whether the shared matplotlib style has been applied
+    _matplotlib_styled = False
+    
+    @staticmethod
+    def apply_matplotlib_style():
+        """Apply the shared matplotlib style once, on the first chart module import."""
+        if Theme._matplotlib_styled:
+            return
+        from matplotlib import style as mpl_style
+        try:
+            mpl_style.use('seaborn-v0_8-darkgrid')
+        except:
+            try:
+                mpl_style.use('seaborn-darkgrid')
+            except:
+                mpl_style.use('default')
+        Theme._matplotlib_styled = True
+    
+    # Style specs per theme, built once and reused on every toggle
+    _style_cache: dict = {}
+    
+    @staticmethod
+    def build_style_specs(theme_colors: dict) -> list:
+        """Build the (style name, configure options, map options) specs for a theme."""
+        return [
+            # Frames and cards
+            ('TFrame', {'background': theme_colors['BG_SECONDARY']}, None),
+            ('TLabelFrame', {'background': theme_colors['BG_SECONDARY'], 'borderwidth': 2, 'relief': 'flat'}, None),
+            ('TLabelFrame.Label', {'background': theme_colors['BG_SECONDARY'], 'foreground': theme_colors['TEXT_PRIMARY'], 'font': ('SF Pro Display', 11, 'bold')}, None),
+            ('Card.TFrame', {'background': theme_colors['BG_PRIMARY'], 'relief': 'flat', 'borderwidth': 1}, None),
+            ('StatCard.TFrame', {'background': theme_colors['BG_PRIMARY'], 'relief': 'flat'}, None),
+            
+            # Buttons
+            ('TButton', {
+                'background': theme_colors['PRIMARY'],
+                'foreground': 'white',
+                'borderwidth': 0,
+                'focuscolor': 'none',
+                'padding': (15, 8),
+                'font': ('SF Pro Display', 10),
+            }, {'background': [('active', theme_colors['PRIMARY_DARK']), ('pressed', theme_colors['PRIMARY_DARK'])]}),
+            ('Primary.TButton', {
+                'background': theme_colors['PRIMARY'],
+                'foreground': 'white',
+                'font': ('SF Pro Display', 10, 'bold'),
+            }, {'background': [('active', theme_colors['PRIMARY_DARK'])]}),
+            ('Secondary.TButton', {
+                'background': theme_colors['BG_TERTIARY'],
+                'foreground': theme_colors['TEXT_PRIMARY'],
+                'font': ('SF Pro Display', 10),
+            }, {'background': [('active', theme_colors['BORDER'])]}),
+            ('Success.TButton', {
+                'background': theme_colors['SUCCESS'],
+                'foreground': 'white',
+            }, {'background': [('active', theme_colors['SECONDARY_DARK'])]}),
+            
+            # Entry
+            ('TEntry', {
+                'fieldbackground': theme_colors['BG_PRIMARY'],
+                'borderwidth': 2,
+                'relief': 'solid',
+                'padding': 8,
+                'font': ('SF Pro Display', 10),
+                'foreground': theme_colors['TEXT_PRIMARY'],
+            }, {'bordercolor': [('focus', theme_colors['PRIMARY'])]}),
+            
+            # Notebook
+            ('TNotebook', {'background': theme_colors['BG_SECONDARY'], 'borderwidth': 0}, None),
+            ('TNotebook.Tab', {
+                'background': theme_colors['BG_TERTIARY'],
+                'foreground': theme_colors['TEXT_SECONDARY'],
+                'padding': (20, 12),
+                'font': ('SF Pro Display', 11),
+            }, {
+                'background': [('selected', theme_colors['BG_PRIMARY'])],
+                'foreground': [('selected', theme_colors['PRIMARY'])],
+                'expand': [('selected', [1, 1, 1, 0])],
+            }),
+            
+            # Label
+            ('TLabel', {'background': theme_colors['BG_SECONDARY'], 'foreground': theme_colors['TEXT_PRIMARY'], 'font': ('SF Pro Display', 10)}, None),
+            ('Heading.TLabel', {'font': ('SF Pro Display', 12, 'bold'), 'foreground': theme_colors['TEXT_PRIMARY']}, None),
+            ('Subheading.TLabel', {'font': ('SF Pro Display', 10), 'foreground': theme_colors['TEXT_SECONDARY']}, None),
+            
+            # Treeview
+            ('Treeview', {
+                'background': theme_colors['BG_PRIMARY'],
+                'foreground': theme_colors['TEXT_PRIMARY'],
+                'fieldbackground': theme_colors['BG_PRIMARY'],
+                'borderwidth': 1,
+                'font': ('SF Pro Display', 10),
+            }, {
+                'background': [('selected', theme_colors['PRIMARY_LIGHT'])],
+                'foreground': [('selected', 'white')],
+            }),
+            ('Treeview.Heading', {
+                'background': theme_colors['BG_TERTIARY'],
+                'foreground': theme_colors['TEXT_PRIMARY'],
+                'font': ('SF Pro Display', 10, 'bold'),
+                'borderwidth': 1,
+                'relief': 'flat',
+            }, None),
+            
+            # Scrollbar
+            ('TScrollbar', {
+                'background': theme_colors['BORDER'],
+                'troughcolor': theme_colors['BG_TERTIARY'],
+                'borderwidth': 0,
+                'arrowcolor': theme_colors['TEXT_SECONDARY'],
+                'darkcolor': theme_colors['BORDER'],
+                'lightcolor': theme_colors['BORDER'],
+            }, {'background': [('active', theme_colors['TEXT_MUTED'])]}),
+            
+            # Radiobutton
+            ('TRadiobutton', {
+                'background': theme_colors['BG_SECONDARY'],
+                'foreground': theme_colors['TEXT_PRIMARY'],
+                'font': ('SF Pro Display', 10),
+            }, None),
+            
+            # Combobox
+            ('TCombobox', {
+                'fieldbackground': theme_colors['BG_PRIMARY'],
+                'borderwidth': 2,
+                'padding': 8,
+                'font': ('SF Pro Display', 10),
+                'foreground': theme_colors['TEXT_PRIMARY'],
+            }, None),
+        ]
+    
     @staticmethod
     def configure_theme(style: ttk.Style, theme_colors: dict):
         """Configure ttk style with given theme colors."""
-        # Use a modern theme as base
-        style.theme_use('clam')
-        
-        # Configure colors
-        style.configure('TFrame', background=theme_colors['BG_SECONDARY'])
-        style.configure('TLabelFrame', background=theme_colors['BG_SECONDARY'], borderwidth=2, relief='flat')
-        style.configure('TLabelFrame.Label', background=theme_colors['BG_SECONDARY'], foreground=theme_colors['TEXT_PRIMARY'], font=('SF Pro Display', 11, 'bold'))
-        
-        # Buttons
-        style.configure('TButton', 
-                       background=theme_colors['PRIMARY'],
-                       foreground='white',
-                       borderwidth=0,
-                       focuscolor='none',
-                       padding=(15, 8),
-                       font=('SF Pro Display', 10))
-        style.map('TButton',
-                 background=[('active', theme_colors['PRIMARY_DARK']),
-                           ('pressed', theme_colors['PRIMARY_DARK'])])
-        
-        # Primary button variant
-        style.configure('Primary.TButton',
-                       background=theme_colors['PRIMARY'],
-                       foreground='white',
-                       font=('SF Pro Display', 10, 'bold'))
-        style.map('Primary.TButton',
-                 background=[('active', theme_colors['PRIMARY_DARK'])])
-        
-        # Secondary button
-        style.configure('Secondary.TButton',
-                       background=theme_colors['BG_TERTIARY'],
-                       foreground=theme_colors['TEXT_PRIMARY'],
-                       font=('SF Pro Display', 10))
-        style.map('Secondary.TButton',
-                 background=[('active', theme_colors['BORDER'])])
-        
-        # Success button
-        style.configure('Success.TButton',
-                       background=theme_colors['SUCCESS'],
-                       foreground='white')
-        style.map('Success.TButton',
-                 background=[('active', theme_colors['SECONDARY_DARK'])])
-        
-        # Entry
-        style.configure('TEntry',
-                       fieldbackground=theme_colors['BG_PRIMARY'],
-                       borderwidth=2,
-                       relief='solid',
-                       padding=8,
-                       font=('SF Pro Display', 10),
-                       foreground=theme_colors['TEXT_PRIMARY'])
-        style.map('TEntry',
-                 bordercolor=[('focus', theme_colors['PRIMARY'])])
-        
-        # Notebook
-        style.configure('TNotebook', background=theme_colors['BG_SECONDARY'], borderwidth=0)
-        style.configure('TNotebook.Tab',
-                       background=theme_colors['BG_TERTIARY'],
-                       foreground=theme_colors['TEXT_SECONDARY'],
-                       padding=(20, 12),
-                       font=('SF Pro Display', 11))
-        style.map('TNotebook.Tab',
-                 background=[('selected', theme_colors['BG_PRIMARY'])],
-                 foreground=[('selected', theme_colors['PRIMARY'])],
-                 expand=[('selected', [1, 1, 1, 0])])
-        
-        # Label
-        style.configure('TLabel', background=theme_colors['BG_SECONDARY'], foreground=theme_colors['TEXT_PRIMARY'], font=('SF Pro Display', 10))
-        style.configure('Heading.TLabel', font=('SF Pro Display', 12, 'bold'), foreground=theme_colors['TEXT_PRIMARY'])
-        style.configure('Subheading.TLabel', font=('SF Pro Display', 10), foreground=theme_colors['TEXT_SECONDARY'])
-        
-        # Treeview
-        style.configure('Treeview',
-                       background=theme_colors['BG_PRIMARY'],
-                       foreground=theme_colors['TEXT_PRIMARY'],
-                       fieldbackground=theme_colors['BG_PRIMARY'],
-                       borderwidth=1,
-                       font=('SF Pro Display', 10))
-        style.configure('Treeview.Heading',
-                       background=theme_colors['BG_TERTIARY'],
-                       foreground=theme_colors['TEXT_PRIMARY'],
-                       font=('SF Pro Display', 10, 'bold'),
-                       borderwidth=1,
-                       relief='flat')
-        style.map('Treeview',
-                 background=[('selected', theme_colors['PRIMARY_LIGHT'])],
-                 foreground=[('selected', 'white')])
-        
-        # Scrollbar
-        style.configure('TScrollbar',
-                       background=theme_colors['BORDER'],
-                       troughcolor=theme_colors['BG_TERTIARY'],
-                       borderwidth=0,
-                       arrowcolor=theme_colors['TEXT_SECONDARY'],
-                       darkcolor=theme_colors['BORDER'],
-                       lightcolor=theme_colors['BORDER'])
-        style.map('TScrollbar',
-                 background=[('active', theme_colors['TEXT_MUTED'])])
+        key = tuple(sorted(theme_colors.items()))
+        specs = Theme._style_cache.get(key)
+        if specs is None:
+            specs = Theme._style_cache[key] = Theme.build_style_specs(theme_colors)
         
-        # Radiobutton
-        style.configure('TRadiobutton',
-                       background=theme_colors['BG_SECONDARY'],
-                       foreground=theme_colors['TEXT_PRIMARY'],
-                       font=('SF Pro Display', 10))
+        # Switching the base theme restyles every widget; only do it once
+        if style.theme_use() != 'clam':
+            style.theme_use('clam')
         
-        # Combobox
-        style.configure('TCombobox',
-                       fieldbackground=theme_colors['BG_PRIMARY'],
-                       borderwidth=2,
-                       padding=8,
-                       font=('SF Pro Display', 10),
-                       foreground=theme_colors['TEXT_PRIMARY'])
+        for name, options, mapping in specs:
+            style.configure(name, **options)
+            if mapping:
+                style.map(name, **mapping)
         
         return style
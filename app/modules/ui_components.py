@@ -3,6 +3,7 @@
 import tkinter as tk
 from tkinter import ttk
 from typing import Optional, Callable
+from app.utils.formatting import format_bytes
 
 
 class Card(ttk.Frame):
@@ -97,7 +98,17 @@ class LoadingIndicator:
 
 
 class StatusBar:
-    """A status bar widget for displaying status messages."""
+    """A status bar widget for displaying status messages.
+    
+    With ``enable_hud`` it also shows a performance HUD on the right: the
+    last load's duration and throughput, the last filter and chart times,
+    process RSS and cache sizes, read from a ``PerfMonitor``, plus a "Copy
+    diagnostics" action that puts the monitor's timing history on the
+    clipboard as JSON.
+    """
+    
+    # Interval between HUD refreshes while it is shown
+    HUD_REFRESH_MS = 2000
     
     def __init__(self, parent, theme_colors=None):
         if theme_colors is None:
@@ -126,7 +137,13 @@ class StatusBar:
             foreground=theme_colors['TEXT_SECONDARY'],
             font=('SF Pro Display', 9)
         )
-        self.status_label.pack(fill=tk.X)
+        self.status_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        
+        # Performance HUD (created the first time it is enabled)
+        self.monitor = None
+        self.hud_job = None
+        self.hud_label: Optional[tk.Label] = None
+        self.copy_label: Optional[tk.Label] = None
     
     def pack(self, **kwargs):
         """Pack the status bar."""
@@ -149,6 +166,87 @@ class StatusBar:
                 background=theme_colors['BG_TERTIARY'],
                 foreground=theme_colors['TEXT_SECONDARY']
             )
+        if self.hud_label is not None:
+            self.hud_label.config(background=theme_colors['BG_TERTIARY'], foreground=theme_colors['TEXT_SECONDARY'])
+            self.copy_label.config(background=theme_colors['BG_TERTIARY'], foreground=theme_colors['PRIMARY'])
+    
+    @property
+    def hud_enabled(self) -> bool:
+        return self.monitor is not None
+    
+    def enable_hud(self, monitor):
+        """Show the performance HUD for a ``PerfMonitor`` and keep it refreshed."""
+        self.monitor = monitor
+        if self.hud_label is None:
+            self.copy_label = tk.Label(
+                self.inner_frame,
+                text="Copy diagnostics",
+                cursor="hand2",
+                background=self.theme_colors['BG_TERTIARY'],
+                foreground=self.theme_colors['PRIMARY'],
+                font=('SF Pro Display', 9, 'underline')
+            )
+            self.copy_label.bind("<Button-1>", lambda event: self.copy_diagnostics())
+            self.hud_label = tk.Label(
+                self.inner_frame,
+                anchor=tk.E,
+                background=self.theme_colors['BG_TERTIARY'],
+                foreground=self.theme_colors['TEXT_SECONDARY'],
+                font=('SF Pro Display', 9)
+            )
+        self.copy_label.pack(side=tk.RIGHT, padx=(10, 0), before=self.status_label)
+        self.hud_label.pack(side=tk.RIGHT, before=self.status_label)
+        self.refresh_hud()
+    
+    def disable_hud(self):
+        """Hide the performance HUD and stop refreshing it."""
+        self.monitor = None
+        if self.hud_job is not None:
+            self.frame.after_cancel(self.hud_job)
+            self.hud_job = None
+        if self.hud_label is not None:
+            self.hud_label.pack_forget()
+            self.copy_label.pack_forget()
+    
+    def refresh_hud(self):
+        """Redraw the HUD from the monitor and schedule the next refresh."""
+        self.hud_job = None
+        if self.monitor is None:
+            return
+        self.hud_label.config(text=self.format_hud(self.monitor.snapshot()))
+        self.hud_job = self.frame.after(self.HUD_REFRESH_MS, self.refresh_hud)
+    
+    @staticmethod
+    def format_hud(snapshot: dict) -> str:
+        """One-line summary of a ``PerfMonitor.snapshot``."""
+        def duration(event) -> str:
+            if event is None:
+                return "–"
+            seconds = event['seconds']
+            return f"{seconds * 1000:,.0f} ms" if seconds < 1 else f"{seconds:,.2f} s"
+        
+        load = snapshot.get('load')
+        parts = [f"Load {duration(load)}"]
+        if load is not None and 'mb_per_second' in load:
+            parts[0] += f" · {load['mb_per_second']:,.1f} MB/s"
+        if load is not None and 'rows_per_second' in load:
+            parts[0] += f" · {load['rows_per_second']:,.0f} rows/s"
+        parts.append(f"Filter {duration(snapshot.get('filter'))}")
+        parts.append(f"Chart {duration(snapshot.get('chart'))}")
+        if snapshot.get('rss_bytes') is not None:
+            parts.append(f"RSS {format_bytes(snapshot['rss_bytes'])}")
+        caches = snapshot.get('cache_bytes') or {}
+        if caches:
+            parts.append(f"Cache {format_bytes(sum(caches.values()))}")
+        return "  │  ".join(parts)
+    
+    def copy_diagnostics(self):
+        """Copy the monitor's diagnostics JSON to the clipboard."""
+        if self.monitor is None:
+            return
+        self.frame.clipboard_clear()
+        self.frame.clipboard_append(self.monitor.diagnostics())
+        self.set_status(f"✓ Diagnostics copied to the clipboard ({len(self.monitor.history())} timings)", self.theme_colors['SUCCESS'])
     
     def clear(self):
         """Clear the status message."""
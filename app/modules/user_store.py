@@ -0,0 +1,462 @@
+"""Matched and unmatched users: loading, columnar summaries, indexes, filtering and details."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+import numpy as np
+import pandas as pd
+from app.modules.columnar_store import ColumnarStore
+from app.modules.file_loader import FileLoader
+from app.modules.perf_monitor import PerfMonitor
+from app.modules.population_stats import PopulationStats
+
+
+# Browser filter values
+FILTERS = ("all", "matched", "unmatched")
+
+
+class UserStore:
+    """The comparer's users, held as columns with full records fetched on demand.
+
+    Loading streams ``linked_users.jsonl`` and ``unmatched_users.jsonl`` once.
+    Each record is reduced to its browser summary (id, email, name, points,
+    history and referral counts) in numpy columns, and the population
+    dashboard tables are built chunk by chunk. Unless ``keep_records`` is
+    set, the parsed records are then dropped; ``detail`` re-reads one record
+    by its byte offset (with a small LRU cache), so memory holds summaries,
+    not every user's points history.
+
+    Rows are numbered matched users first, then unmatched users, in file
+    order. Ids and lower-cased emails are indexed; ``filter_rows`` combines
+    the type filter, a substring search and a cached sort permutation.
+    Typing that extends the previous search term only re-checks the rows
+    that matched it.
+
+    ``save_cache`` writes the summaries, record offsets and dashboard
+    series to the columnar cache, keyed by both files' paths, sizes and
+    mtimes; ``iter_load(use_cache=True)`` reopens them from there without
+    parsing the JSONL files again.
+    """
+    
+    # Records parsed per chunk (bounds memory when records are not kept)
+    CHUNK_RECORDS = 5000
+    
+    # Full records kept after being fetched by detail()
+    DETAIL_CACHE = 64
+    
+    # Sortable summary columns
+    SORT_COLUMNS = ("email", "name", "points")
+    
+    # Bump when the cached columns change so stale caches are ignored
+    CACHE_VERSION = 1
+    
+    def __init__(self, keep_records: bool = False):
+        self.keep_records = keep_records
+        self.paths: Tuple[str, str, str] = ("", "", "")
+        self.sync_report: Optional[Dict[str, Any]] = None
+        self.population_stats: Optional[Dict[str, Any]] = None
+        
+        # Per-row summaries and record locations
+        self.summaries: List[Tuple[str, str, str, Optional[float]]] = []
+        self.columns: Dict[str, np.ndarray] = {}
+        self.matched: np.ndarray = np.empty(0, dtype=bool)
+        self.sources: np.ndarray = np.empty(0, dtype=np.uint8)
+        self.offsets: np.ndarray = np.empty(0, dtype=np.int64)
+        self.records: Optional[List[Dict[str, Any]]] = None
+        self.matched_count = 0
+        
+        # Indexes
+        self.id_index: Dict[str, int] = {}
+        self.email_index: Dict[str, int] = {}
+        
+        self._sort_permutations: Dict[str, np.ndarray] = {}
+        self._last_search: Tuple[str, Optional[np.ndarray]] = ("", None)
+        self._details: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        self._file_stats: Dict[int, Tuple[int, int]] = {}
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self.summaries)
+    
+    @property
+    def unmatched_count(self) -> int:
+        return len(self.summaries) - self.matched_count
+    
+    # Loading
+    
+    @staticmethod
+    def summarize_user(user_type: str, user: Dict[str, Any]) -> tuple:
+        """Extract the (user_id, email, name, points) summary shown in the browser."""
+        if user_type == "matched":
+            clerk_data = user.get('clerkData') or {}
+            convex_profile = user.get('convexProfile') or {}
+            user_id = user.get('clerkId', '')
+            email = clerk_data.get('primary_email_address', '') or convex_profile.get('email', '')
+            name = convex_profile.get('name', '') or f"{clerk_data.get('first_name', '')} {clerk_data.get('last_name', '')}"
+            points = user.get('totalPointsEarned', 0)
+        else:
+            user_data = user.get('data') or {}
+            user_id = user.get('id', '')
+            email = user_data.get('primary_email_address', '')
+            name = f"{user_data.get('first_name', '')} {user_data.get('last_name', '')}"
+            points = None
+        return user_id or '', email or '', name or '', points
+    
+    @staticmethod
+    def iter_lines(file_path: Union[str, Path]) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """(byte offset, record) for each non-blank line of a JSONL file."""
+        offset = 0
+        with open(file_path, 'rb') as f:
+            for line_num, line in enumerate(f, 1):
+                start = offset
+                offset += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    yield start, json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise Exception(f"Malformed JSON on line {line_num} of {file_path}: {str(e)}")
+    
+    @staticmethod
+    def iter_load(linked_path: str = "", unmatched_path: str = "", sync_report_path: str = "",
+                  keep_records: bool = False, use_cache: bool = False) -> Iterator[Tuple[str, Any, Any]]:
+        """Load users, yielding ('progress', rows, bytes read) per chunk and then ('complete', store, None).
+
+        Missing or empty paths are treated as empty files. With
+        ``use_cache``, a current ``save_cache`` of the same files is opened
+        instead of parsing them (records are then never kept).
+        """
+        started = time.perf_counter()
+        if use_cache:
+            store = UserStore.open_cache(linked_path, unmatched_path, sync_report_path)
+            if store is not None:
+                PerfMonitor.instance().record('load', "migration users (cached)", time.perf_counter() - started, len(store), 0)
+                yield 'complete', store, None
+                return
+        
+        store = UserStore(keep_records)
+        store.paths = (linked_path or "", unmatched_path or "", sync_report_path or "")
+        if sync_report_path and os.path.exists(sync_report_path):
+            store.sync_report = FileLoader.load_json(sync_report_path)
+        
+        records: List[Dict[str, Any]] = []
+        sources: List[int] = []
+        offsets: List[int] = []
+        extras: List[Tuple[int, int]] = []
+        population_parts = []
+        bytes_read = 0
+        
+        for source, (user_type, path) in enumerate((("matched", linked_path), ("unmatched", unmatched_path))):
+            if not path or not os.path.exists(path):
+                continue
+            stat = os.stat(path)
+            store._file_stats[source] = (stat.st_size, stat.st_mtime_ns)
+            
+            chunk: List[Dict[str, Any]] = []
+            for offset, record in UserStore.iter_lines(path):
+                row = len(store.summaries)
+                summary = UserStore.summarize_user(user_type, record)
+                store.summaries.append(summary)
+                store.id_index.setdefault(summary[0], row)
+                if summary[1]:
+                    store.email_index.setdefault(summary[1].lower(), row)
+                sources.append(source)
+                offsets.append(offset)
+                extras.append((len(record.get('pointsHistory') or ()), record.get('totalReferralsMade', 0) or 0))
+                if keep_records:
+                    records.append(record)
+                chunk.append(record)
+                
+                if len(chunk) >= UserStore.CHUNK_RECORDS:
+                    if user_type == "matched":
+                        population_parts.append(PopulationStats.build_columns(chunk))
+                    chunk = []
+                    yield 'progress', len(store.summaries), bytes_read + offset
+            
+            if chunk and user_type == "matched":
+                population_parts.append(PopulationStats.build_columns(chunk))
+            if user_type == "matched":
+                store.matched_count = len(store.summaries)
+            bytes_read += stat.st_size
+            yield 'progress', len(store.summaries), bytes_read
+        
+        if population_parts:
+            store.population_stats = PopulationStats.compute(PopulationStats.concat_columns(population_parts))
+        store.records = records if keep_records else None
+        store.sources = np.array(sources, dtype=np.uint8)
+        store.offsets = np.array(offsets, dtype=np.int64)
+        store.build_columns(np.array(extras, dtype=np.int64).reshape(-1, 2))
+        PerfMonitor.instance().record('load', "migration users", time.perf_counter() - started, len(store), bytes_read)
+        yield 'complete', store, None
+    
+    @staticmethod
+    def cache_dir(linked_path: str = "", unmatched_path: str = "") -> Path:
+        """Columnar cache directory for a pair of user files, keyed by their paths, sizes and mtimes."""
+        parts = []
+        for path in (linked_path, unmatched_path):
+            if path and os.path.exists(path):
+                stat = os.stat(path)
+                parts.append(f"{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}")
+            else:
+                parts.append("")
+        key = f"{'|'.join(parts)}|{ColumnarStore.FORMAT_VERSION}|{UserStore.CACHE_VERSION}"
+        return ColumnarStore.cache_root() / f"users-{hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]}"
+    
+    def save_cache(self) -> Optional[Path]:
+        """Write the summaries, offsets and dashboard series to the columnar cache.
+
+        Returns the cache directory, or None for an empty store. Safe to run
+        on a worker while the store is in use; it only reads the store.
+        """
+        if not len(self):
+            return None
+        directory = UserStore.cache_dir(self.paths[0], self.paths[1])
+        if ColumnarStore.open_directory(directory) is not None:
+            return directory
+        
+        frame = pd.DataFrame({
+            'id': pd.Series([summary[0] for summary in self.summaries], dtype=object),
+            'email': pd.Series([summary[1] for summary in self.summaries], dtype=object),
+            'name': pd.Series([summary[2] for summary in self.summaries], dtype=object),
+            'points': np.array([np.nan if summary[3] is None else summary[3] for summary in self.summaries], dtype=float),
+            'source': self.sources.astype(np.float64),
+            'offset': self.offsets.astype(np.float64),
+            'history_entries': self.columns['history_entries'].astype(np.float64),
+            'referrals': self.columns['referrals'].astype(np.float64),
+        })
+        extra = {
+            'matched_count': self.matched_count,
+            'population_stats': PopulationStats.encode(self.population_stats) if self.population_stats is not None else None,
+        }
+        return ColumnarStore.write_frame(frame, self.paths[0] or self.paths[1], directory, extra)
+    
+    @staticmethod
+    def open_cache(linked_path: str = "", unmatched_path: str = "", sync_report_path: str = "") -> Optional['UserStore']:
+        """A store rebuilt from ``save_cache`` of the same, unchanged files, or None."""
+        table = ColumnarStore.open_directory(UserStore.cache_dir(linked_path, unmatched_path))
+        if table is None:
+            return None
+        try:
+            rows = slice(0, len(table))
+            ids = table.read_column('id', rows).fillna('').tolist()
+            emails = table.read_column('email', rows).fillna('').tolist()
+            names = table.read_column('name', rows).fillna('').tolist()
+            points = table.read_column('points', rows).to_numpy()
+            sources = table.read_column('source', rows).to_numpy().astype(np.uint8)
+            offsets = table.read_column('offset', rows).to_numpy().astype(np.int64)
+            extras = np.column_stack([
+                table.read_column('history_entries', rows).to_numpy(),
+                table.read_column('referrals', rows).to_numpy(),
+            ]).astype(np.int64)
+        except KeyError:
+            return None  # Not a user cache
+        
+        store = UserStore()
+        store.paths = (linked_path or "", unmatched_path or "", sync_report_path or "")
+        if sync_report_path and os.path.exists(sync_report_path):
+            store.sync_report = FileLoader.load_json(sync_report_path)
+        for source, path in enumerate((linked_path, unmatched_path)):
+            if path and os.path.exists(path):
+                stat = os.stat(path)
+                store._file_stats[source] = (stat.st_size, stat.st_mtime_ns)
+        
+        extra = table.meta.get('extra', {})
+        store.matched_count = int(extra.get('matched_count', 0))
+        if extra.get('population_stats') is not None:
+            store.population_stats = PopulationStats.decode(extra['population_stats'])
+        
+        for row, summary in enumerate(zip(ids, emails, names, [None if np.isnan(value) else value for value in points.tolist()])):
+            store.summaries.append(summary)
+            store.id_index.setdefault(summary[0], row)
+            if summary[1]:
+                store.email_index.setdefault(summary[1].lower(), row)
+        store.sources = sources
+        store.offsets = offsets
+        store.build_columns(extras)
+        return store
+    
+    @staticmethod
+    def load(linked_path: str = "", unmatched_path: str = "", sync_report_path: str = "",
+             keep_records: bool = False, use_cache: bool = False) -> 'UserStore':
+        """Load users on the calling thread."""
+        for kind, store, _ in UserStore.iter_load(linked_path, unmatched_path, sync_report_path, keep_records, use_cache):
+            if kind == 'complete':
+                return store
+        raise RuntimeError("User loading did not complete")
+    
+    @staticmethod
+    def load_async(widget, linked_path: str, unmatched_path: str, sync_report_path: str,
+                   on_done: Callable[['UserStore'], None],
+                   on_progress: Optional[Callable[[int, int], None]] = None,
+                   on_error: Optional[Callable[[Exception], None]] = None,
+                   keep_records: bool = False, use_cache: bool = False):
+        """Load users on a worker thread; callbacks run on the Tk thread. Returns the BackgroundTask."""
+        from app.modules.background_task import BackgroundTask
+        
+        def on_item(item):
+            kind, payload, extra = item
+            if kind == 'complete':
+                on_done(payload)
+            elif on_progress:
+                on_progress(payload, extra)
+        
+        return BackgroundTask(
+            widget,
+            lambda: UserStore.iter_load(linked_path, unmatched_path, sync_report_path, keep_records, use_cache),
+            on_item,
+            on_error=on_error
+        ).start()
+    
+    def build_columns(self, extras: np.ndarray):
+        """Build the numpy summary columns used for filtering, sorting and aggregates."""
+        summaries = self.summaries
+        self.columns = {
+            'id': np.array([summary[0] for summary in summaries], dtype=object),
+            'email': np.array([summary[1].lower() for summary in summaries], dtype=str),
+            'name': np.array([summary[2].strip().lower() for summary in summaries], dtype=str),
+            # Unmatched users have no points (NaN); filter_rows keeps them last in either direction
+            'points': np.array([np.nan if summary[3] is None else summary[3] for summary in summaries], dtype=float),
+            'search': np.array([f"{summary[0]} {summary[1]} {summary[2]}".lower() for summary in summaries], dtype=str),
+            'history_entries': extras[:, 0] if len(extras) else np.empty(0, dtype=np.int64),
+            'referrals': extras[:, 1] if len(extras) else np.empty(0, dtype=np.int64),
+        }
+        self.matched = np.arange(len(summaries)) < self.matched_count
+        self._sort_permutations = {}
+        self._last_search = ("", None)
+    
+    # Indexes and details
+    
+    def user_type(self, row: int) -> str:
+        return "matched" if row < self.matched_count else "unmatched"
+    
+    def find(self, key: str) -> Optional[int]:
+        """Row of a user by id, or by email (case-insensitive)."""
+        row = self.id_index.get(key)
+        if row is None and key:
+            row = self.email_index.get(key.lower())
+        return row
+    
+    def detail(self, row: int) -> Dict[str, Any]:
+        """The full record of a row, read from its file if records are not kept."""
+        if self.records is not None:
+            return self.records[row]
+        
+        with self._lock:
+            record = self._details.get(row)
+            if record is not None:
+                self._details.move_to_end(row)
+                return record
+        
+        source = int(self.sources[row])
+        path = self.paths[source]
+        stat = os.stat(path)
+        if (stat.st_size, stat.st_mtime_ns) != self._file_stats.get(source):
+            raise Exception(f"{path} changed on disk since it was loaded; load the data again")
+        with open(path, 'rb') as f:
+            f.seek(int(self.offsets[row]))
+            record = json.loads(f.readline())
+        
+        with self._lock:
+            self._details[row] = record
+            while len(self._details) > self.DETAIL_CACHE:
+                self._details.popitem(last=False)
+        return record
+    
+    def iter_details(self, rows: Optional[np.ndarray] = None) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """(row, record) for many rows, reading each file sequentially once."""
+        rows = np.arange(len(self)) if rows is None else np.asarray(rows)
+        if self.records is not None:
+            for row in rows:
+                yield int(row), self.records[row]
+            return
+        
+        order = rows[np.lexsort((self.offsets[rows], self.sources[rows]))]
+        handles: Dict[int, Any] = {}
+        try:
+            for row in order:
+                source = int(self.sources[row])
+                if source not in handles:
+                    handles[source] = open(self.paths[source], 'rb')
+                handles[source].seek(int(self.offsets[row]))
+                yield int(row), json.loads(handles[source].readline())
+        finally:
+            for handle in handles.values():
+                handle.close()
+    
+    # Filtering and sorting
+    
+    def sort_permutation(self, column: str) -> np.ndarray:
+        """The cached ascending sort permutation of a summary column."""
+        perm = self._sort_permutations.get(column)
+        if perm is None:
+            perm = np.argsort(self.columns[column], kind='stable')
+            self._sort_permutations[column] = perm
+        return perm
+    
+    def search_mask(self, term: str) -> np.ndarray:
+        """Rows whose id, email or name contains ``term`` (case-insensitive)."""
+        term = term.lower()
+        mask = np.ones(len(self), dtype=bool)
+        if not term or not len(mask):
+            return mask
+        
+        last_term, last_rows = self._last_search
+        if last_rows is not None and last_term and last_term in term:
+            # A longer term can only match rows the shorter one matched
+            candidates = last_rows
+        else:
+            candidates = np.arange(len(self))
+        hits = candidates[np.char.find(self.columns['search'][candidates], term) >= 0]
+        self._last_search = (term, hits)
+        mask[:] = False
+        mask[hits] = True
+        return mask
+    
+    def filter_mask(self, search: str = "", filter_type: str = "all") -> np.ndarray:
+        """Boolean row mask for a search term and a type filter."""
+        mask = self.search_mask(search)
+        if filter_type == "matched":
+            mask &= self.matched
+        elif filter_type == "unmatched":
+            mask &= ~self.matched
+        return mask
+    
+    def filter_rows(self, search: str = "", filter_type: str = "all", sort_column: Optional[str] = None,
+                    descending: bool = False, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """Rows passing the filters, in sort order (file order when unsorted).
+
+        Rows without a value (unmatched users' points) come last whichever
+        way the column is sorted.
+        """
+        mask = self.filter_mask(search, filter_type) if mask is None else mask
+        if sort_column:
+            perm = self.sort_permutation(sort_column)
+            rows = perm[mask[perm]]
+            if not descending:
+                return rows
+            values = self.columns[sort_column][rows]
+            # argsort puts NaN last; reverse only the rows that have a value
+            present = len(rows) - int(np.count_nonzero(np.isnan(values))) if values.dtype.kind == 'f' else len(rows)
+            return np.concatenate([rows[:present][::-1], rows[present:]])
+        return np.flatnonzero(mask)
+    
+    def selection_summary(self, rows) -> Dict[str, Any]:
+        """Aggregates of a set of rows, from the summary columns."""
+        rows = np.asarray(rows, dtype=np.int64)
+        points = self.columns['points'][rows]
+        matched = int(self.matched[rows].sum())
+        total_points = float(np.nansum(points))
+        return {
+            'users': len(rows),
+            'matched': matched,
+            'unmatched': len(rows) - matched,
+            'total_points': total_points,
+            'average_points': total_points / matched if matched else 0.0,
+            'history_entries': int(self.columns['history_entries'][rows].sum()),
+            'referrals': int(self.columns['referrals'][rows].sum()),
+        }
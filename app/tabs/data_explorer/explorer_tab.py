@@ -4,38 +4,94 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
+import numpy as np
 import pandas as pd
 
 from app.utils.scrollable_frame import ScrollableFrame
+from app.utils.virtual_table import VirtualTable
+from app.utils.rendered_chart import RenderedChart
 from app.modules.file_loader import FileLoader
 from app.modules.data_processor import DataProcessor
+from app.modules.json_flattener import JsonFlattener
+from app.modules.snapshot_loader import SnapshotLoader
+from app.modules.columnar_store import ColumnarStore
 from app.modules.chart_engine import ChartEngine
+from app.modules.chart_output import ChartServer
+from app.modules.chart_cache import ChartCache
+from app.modules.correlation import CorrelationEngine
+from app.modules.background_task import BackgroundTask
+from app.modules.diff_engine import DiffEngine, KEY_CANDIDATES
+from app.modules.table_search import TableSearchIndex
+from app.modules.perf_monitor import PerfMonitor
+from app.modules.session_manager import SessionManager
 from app.modules.ui_components import Card, StatCard
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import plotly.graph_objects as go
-from plotly.offline import plot
-import webbrowser
-import tempfile
+import time
 import os
 
 
 class DataExplorerTab:
     """Tab for general purpose data exploration."""
     
-    def __init__(self, parent, theme_manager):
+    # Accuracy of the sampled correlations listed in the overview, and how many pairs
+    CORRELATION_TOLERANCE = 0.01
+    CORRELATION_PAIRS = 10
+    # Duplicated diff keys listed in the diff summary
+    DIFF_DUPLICATES_SHOWN = 20
+    
+    def __init__(self, parent, theme_manager, session_manager: Optional[SessionManager] = None):
         self.parent = parent
         self.theme_manager = theme_manager
+        self.session_manager = session_manager
         self.theme_colors = theme_manager.get_current_theme()
         self.frame = ttk.Frame(parent, padding=20)
         
         # Data storage
-        self.data: Optional[Union[pd.DataFrame, List[Dict], Dict]] = None
+        # A DataFrame, or a ColumnarStore for files loaded out of core
+        self.data: Optional[Union[pd.DataFrame, ColumnarStore]] = None
         self.data_info: Optional[Dict[str, Any]] = None
         self.file_path: str = ""
         self.file_type: Optional[str] = None
+        # Main table plus child tables exploded from nested JSON arrays
+        self.tables: Dict[str, pd.DataFrame] = {}
+        # Per-table dtype compaction reports (bytes saved per column)
+        self.memory_reports: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        # An opened Convex snapshot (tables parsed on first selection) and its inferred joins
+        self.snapshot: Optional[SnapshotLoader] = None
+        self.joins: List[Dict[str, Any]] = []
+        self.table_task: Optional[BackgroundTask] = None
+        
+        # Progressive loading state
+        self.load_task: Optional[BackgroundTask] = None
+        self.loaded_rows = 0
+        self.load_started = 0.0
+        self.load_file_size = 0
+        
+        # Table search (index is built on a worker after each load)
+        self.search_index: Optional[TableSearchIndex] = None
+        self.search_task: Optional[BackgroundTask] = None
+        self.search_job = None
+        
+        # Matplotlib chart card waiting for the render worker
+        self.pending_chart_card = None
+        
+        # Chart cache keys of the current data and of every table shown since the last load
+        self.data_fingerprint: Optional[str] = None
+        self.chart_fingerprints: set = set()
+        
+        # Keyed diff of two file versions (runs on a worker)
+        self.diff_task: Optional[BackgroundTask] = None
+        self.diff_result: Optional[Dict[str, Any]] = None
+        
+        # Writes in-memory loads to the columnar cache so the next session reopens them
+        self.cache_task: Optional[BackgroundTask] = None
+        # Session state still to apply once the restored data arrives
+        self.pending_session: Optional[Dict[str, Any]] = None
         
         # Build UI
         self.create_widgets()
+        
+        # Reopen the previous session's file once the tab is on screen
+        self.frame.after_idle(self.restore_session)
     
     def update_theme(self, theme_colors: dict):
         """Update theme colors for all components."""
@@ -44,6 +100,8 @@ class DataExplorerTab:
         # Update text widget colors
         if hasattr(self, 'overview_text'):
             self.overview_text.config(bg=theme_colors['BG_PRIMARY'], fg=theme_colors['TEXT_PRIMARY'])
+        if hasattr(self, 'diff_text'):
+            self.diff_text.config(bg=theme_colors['BG_PRIMARY'], fg=theme_colors['TEXT_PRIMARY'])
         
         # Update status label
         if hasattr(self, 'status_label'):
@@ -69,14 +127,31 @@ class DataExplorerTab:
         self.file_entry = ttk.Entry(file_row, width=60)
         self.file_entry.pack(side='left', fill="x", expand=True, padx=(0, 10))
         ttk.Button(file_row, text="Browse", command=self.browse_file, style='Secondary.TButton').pack(side='left')
+        ttk.Button(file_row, text="Snapshot", command=self.browse_snapshot, style='Secondary.TButton').pack(side='left', padx=(10, 0))
         
         # Load button and status
         button_row = ttk.Frame(upload_card.content_frame)
         button_row.pack(fill="x")
         ttk.Button(button_row, text="Load Data", command=self.load_data, style='Primary.TButton').pack(side='left')
+        # Files too large for memory switch this on automatically
+        self.out_of_core_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(button_row, text="Out-of-core", variable=self.out_of_core_var).pack(side='left', padx=(15, 0))
         self.status_label = ttk.Label(button_row, text="No data loaded", style='Subheading.TLabel')
         self.status_label.pack(side='left', padx=(20, 0))
         
+        # Switch between the main table and child tables of nested arrays
+        self.table_selector = ttk.Combobox(button_row, state='disabled', width=30)
+        self.table_selector.pack(side='right')
+        self.table_selector.bind('<<ComboboxSelected>>', self.on_table_selected)
+        ttk.Label(button_row, text="Table").pack(side='right', padx=(0, 10))
+        
+        # Joins inferred between snapshot tables (shown once a snapshot is open)
+        self.join_row = ttk.Frame(upload_card.content_frame)
+        ttk.Label(self.join_row, text="Join", width=15, anchor='w').pack(side='left', padx=(0, 10))
+        self.join_selector = ttk.Combobox(self.join_row, state='readonly', width=70)
+        self.join_selector.pack(side='left', fill="x", expand=True, padx=(0, 10))
+        ttk.Button(self.join_row, text="Run Join", command=self.run_join, style='Secondary.TButton').pack(side='left')
+        
         # Main content area with notebook
         self.content_notebook = ttk.Notebook(self.frame)
         self.content_notebook.pack(fill="both", expand=True)
@@ -95,6 +170,11 @@ class DataExplorerTab:
         table_frame = ttk.Frame(self.content_notebook, padding=15)
         self.content_notebook.add(table_frame, text="  Data Table  ")
         self.create_table_panel(table_frame)
+        
+        # Diff tab
+        diff_frame = ttk.Frame(self.content_notebook, padding=15)
+        self.content_notebook.add(diff_frame, text="  Diff  ")
+        self.create_diff_panel(diff_frame)
     
     def create_overview_panel(self, parent):
         """Create overview panel with data statistics."""
@@ -204,24 +284,150 @@ class DataExplorerTab:
         self.table_search_entry.pack(side='left', fill="x", expand=True)
         self.table_search_entry.bind("<KeyRelease>", self.on_table_search)
         
-        # Table frame with scrollbars
-        table_frame = ttk.Frame(table_card.content_frame)
-        table_frame.pack(fill="both", expand=True)
+        # Jump to row
+        ttk.Label(search_frame, text="Go to row", width=10).pack(side='left', padx=(20, 10))
+        self.goto_row_entry = ttk.Entry(search_frame, width=12)
+        self.goto_row_entry.pack(side='left')
+        self.goto_row_entry.bind("<Return>", self.on_goto_row)
+        self.table_count_label = ttk.Label(search_frame, text="", style='Subheading.TLabel')
+        self.table_count_label.pack(side='left', padx=(20, 0))
+        
+        # Virtual table: pages through every row without inserting them all
+        self.data_table = VirtualTable(table_card.content_frame)
+        self.data_table.pack(fill="both", expand=True)
+    
+    def create_diff_panel(self, parent):
+        """Create the panel comparing two versions of a file by key."""
+        controls_card = Card(parent, title="Compare File Versions", padding=20, theme_colors=self.theme_colors)
+        controls_card.pack(fill="x", pady=(0, 20))
+        
+        self.diff_entries = {}
+        for side, label in (('old', "Old File"), ('new', "New File")):
+            row = ttk.Frame(controls_card.content_frame)
+            row.pack(fill="x", pady=(0, 15))
+            ttk.Label(row, text=label, width=15, anchor='w').pack(side='left', padx=(0, 10))
+            entry = ttk.Entry(row, width=60)
+            entry.pack(side='left', fill="x", expand=True, padx=(0, 10))
+            ttk.Button(row, text="Browse", command=lambda e=entry: self.browse_diff_file(e), style='Secondary.TButton').pack(side='left')
+            self.diff_entries[side] = entry
+        
+        button_row = ttk.Frame(controls_card.content_frame)
+        button_row.pack(fill="x")
+        ttk.Label(button_row, text="Key Column", width=15, anchor='w').pack(side='left', padx=(0, 10))
+        # Left blank, the key is detected from the first record
+        self.diff_key_combo = ttk.Combobox(button_row, values=KEY_CANDIDATES, width=20)
+        self.diff_key_combo.pack(side='left', padx=(0, 20))
+        ttk.Button(button_row, text="Compare", command=self.run_diff, style='Primary.TButton').pack(side='left')
+        self.diff_status_label = ttk.Label(button_row, text="", style='Subheading.TLabel')
+        self.diff_status_label.pack(side='left', padx=(20, 0))
+        
+        results = ttk.PanedWindow(parent, orient='vertical')
+        results.pack(fill="both", expand=True)
+        
+        summary_card = Card(results, title="Summary", padding=15, theme_colors=self.theme_colors)
+        self.diff_text = tk.Text(
+            summary_card.content_frame,
+            wrap="word",
+            height=10,
+            font=("SF Mono", 11),
+            bg=self.theme_colors['BG_PRIMARY'],
+            fg=self.theme_colors['TEXT_PRIMARY'],
+            relief='flat',
+            padx=15,
+            pady=15,
+            borderwidth=0
+        )
+        self.diff_text.pack(fill="both", expand=True)
+        results.add(summary_card, weight=1)
+        
+        changes_card = Card(results, title="Changes", padding=15, theme_colors=self.theme_colors)
+        self.diff_table = VirtualTable(changes_card.content_frame)
+        self.diff_table.pack(fill="both", expand=True)
+        results.add(changes_card, weight=3)
+    
+    def browse_diff_file(self, entry: ttk.Entry):
+        """Browse for one side of the diff."""
+        filename = filedialog.askopenfilename(
+            title="Select File Version",
+            filetypes=[
+                ("JSONL files", "*.jsonl"),
+                ("CSV files", "*.csv"),
+                ("JSON files", "*.json"),
+                ("All files", "*.*")
+            ]
+        )
+        if filename:
+            entry.delete(0, tk.END)
+            entry.insert(0, filename)
+    
+    def run_diff(self):
+        """Diff the two selected files on a worker (partitions compare in a process pool)."""
+        old_path = self.diff_entries['old'].get().strip()
+        new_path = self.diff_entries['new'].get().strip()
+        if not (os.path.isfile(old_path) and os.path.isfile(new_path)):
+            messagebox.showerror("Error", "Please select two valid files")
+            return
+        
+        if self.diff_task is not None:
+            self.diff_task.cancel()
+        key = self.diff_key_combo.get().strip() or None
+        self.diff_status_label.config(text="Comparing...", foreground=self.theme_colors['TEXT_SECONDARY'])
+        self.diff_task = BackgroundTask(
+            self.frame,
+            lambda: DiffEngine.iter_diff(old_path, new_path, key),
+            self.on_diff_progress,
+            on_error=self.on_diff_failed
+        ).start()
+    
+    def on_diff_progress(self, item):
+        """Report partitioning progress, then show the summary and change table."""
+        kind, payload, extra = item
+        if kind == 'partitioned':
+            self.diff_status_label.config(text=f"Partitioned {payload} file: {extra:,} records", foreground=self.theme_colors['TEXT_SECONDARY'])
+            return
         
-        self.data_tree = ttk.Treeview(table_frame, show="headings", height=35)
+        self.diff_result = payload
+        summary = payload['summary']
+        self.diff_key_combo.set(summary['key'])
+        self.diff_table.set_data(DiffEngine.changes_frame(payload))
         
-        # Scrollbars
-        v_scrollbar_table = ttk.Scrollbar(table_frame, orient="vertical", command=self.data_tree.yview)
-        self.data_tree.configure(yscrollcommand=v_scrollbar_table.set)
-        h_scrollbar_table = ttk.Scrollbar(table_frame, orient="horizontal", command=self.data_tree.xview)
-        self.data_tree.configure(xscrollcommand=h_scrollbar_table.set)
+        text = f"""DIFF SUMMARY (key: {summary['key']})
+{'='*70}
+
+Old records: {summary['old_rows']:,}
+New records: {summary['new_rows']:,}
+
+Added:     {summary['added']:,}
+Removed:   {summary['removed']:,}
+Modified:  {summary['modified']:,}
+Unchanged: {summary['unchanged']:,}
+"""
+        if summary['duplicates'] or summary['missing_key']:
+            text += f"\nDuplicate keys: {summary['duplicates']:,} · Records without a key: {summary['missing_key']:,}\n"
+            if payload['duplicates']:
+                text += "Compared by the first record of each duplicated key:\n"
+                for record_key, side in payload['duplicates'][:self.DIFF_DUPLICATES_SHOWN]:
+                    text += f"  {record_key} ({side} file)\n"
+                hidden = len(payload['duplicates']) - self.DIFF_DUPLICATES_SHOWN
+                if hidden > 0:
+                    text += f"  ... and {hidden:,} more\n"
+        if summary['field_counts']:
+            text += "\nCHANGED FIELDS:\n"
+            for field, count in summary['field_counts'].items():
+                text += f"  {field}: {count:,}\n"
+        self.diff_text.delete(1.0, tk.END)
+        self.diff_text.insert(1.0, text)
         
-        # Grid layout
-        self.data_tree.grid(row=0, column=0, sticky="nsew")
-        v_scrollbar_table.grid(row=0, column=1, sticky="ns")
-        h_scrollbar_table.grid(row=1, column=0, sticky="ew")
-        table_frame.grid_rowconfigure(0, weight=1)
-        table_frame.grid_columnconfigure(0, weight=1)
+        changed = summary['added'] + summary['removed'] + summary['modified']
+        self.diff_status_label.config(
+            text=f"✓ {changed:,} changed records ({summary['partitions']} partitions, {summary['workers']} workers)",
+            foreground=self.theme_colors['SUCCESS']
+        )
+    
+    def on_diff_failed(self, error: Exception):
+        """Report a failed diff."""
+        messagebox.showerror("Error", f"Failed to compare files: {str(error)}")
+        self.diff_status_label.config(text="✗ Comparison failed", foreground=self.theme_colors['ERROR'])
     
     def browse_file(self):
         """Browse for data file."""
@@ -239,34 +445,404 @@ class DataExplorerTab:
             self.file_entry.insert(0, filename)
             self.file_path = filename
     
-    def load_data(self):
-        """Load data from selected file."""
+    def browse_snapshot(self):
+        """Browse for an unzipped Convex snapshot directory."""
+        directory = filedialog.askdirectory(title="Select Convex Snapshot Folder")
+        if directory:
+            self.file_entry.delete(0, tk.END)
+            self.file_entry.insert(0, directory)
+            self.file_path = directory
+    
+    def load_data(self, restore: bool = False):
+        """Start loading the selected file in chunks on a background worker.
+        
+        With ``restore``, a file with a current columnar cache is reopened
+        from it instead of being parsed again.
+        """
         try:
             if not self.file_path or not os.path.exists(self.file_path):
                 messagebox.showerror("Error", "Please select a valid file")
                 return
             
-            self.file_type = FileLoader.detect_file_type(self.file_path)
-            raw_data = FileLoader.load_file(self.file_path)
-            
-            if isinstance(raw_data, (dict, list)):
-                self.data = DataProcessor.convert_to_dataframe(raw_data)
-            else:
-                self.data = raw_data
-            
-            self.data_info = DataProcessor.get_dataframe_info(self.data)
-            
-            self.update_overview()
-            self.update_chart_controls()
-            self.update_table()
-            self.status_label.config(
-                text=f"✓ Loaded: {len(self.data):,} rows, {len(self.data.columns)} columns",
-                foreground=self.theme_colors['SUCCESS']
-            )
-            
+            is_snapshot = SnapshotLoader.is_snapshot(self.file_path)
+            self.file_type = 'snapshot' if is_snapshot else FileLoader.detect_file_type(self.file_path)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load data: {str(e)}")
             self.status_label.config(text="✗ Error loading data", foreground=self.theme_colors['ERROR'])
+            return
+        
+        # A new load supersedes any load still streaming in
+        if self.load_task is not None:
+            self.load_task.cancel()
+        if self.search_task is not None:
+            self.search_task.cancel()
+        if self.table_task is not None:
+            self.table_task.cancel()
+        if self.cache_task is not None:
+            self.cache_task.cancel()
+        self.search_index = None
+        if not restore:
+            self.pending_session = None
+        
+        # Cached charts and aggregates of the previous load are stale now
+        ChartCache.instance().invalidate(*self.chart_fingerprints)
+        self.chart_fingerprints = set()
+        self.data_fingerprint = None
+        
+        self.data = None
+        self.data_info = None
+        self.tables = {}
+        self.memory_reports = {}
+        self.table_selector.config(values=[], state='disabled')
+        self.table_selector.set("")
+        self.snapshot = None
+        self.joins = []
+        self.join_row.pack_forget()
+        self.loaded_rows = 0
+        self.load_started = time.perf_counter()
+        self.load_file_size = max(os.path.getsize(self.file_path), 1)
+        self.status_label.config(text="Loading...", foreground=self.theme_colors['TEXT_SECONDARY'])
+        
+        file_path = self.file_path
+        if is_snapshot:
+            self.snapshot = SnapshotLoader(file_path)
+            snapshot = self.snapshot
+            table = (self.pending_session or {}).get('table')
+            self.load_task = BackgroundTask(
+                self.frame,
+                lambda: self.stream_snapshot(snapshot, table),
+                self.on_load_progress,
+                on_error=self.on_load_failed
+            ).start()
+            return
+        
+        if not self.out_of_core_var.get() and ColumnarStore.should_use(file_path):
+            self.out_of_core_var.set(True)
+        cached = restore and ColumnarStore.open_cached(file_path) is not None
+        producer = self.stream_store if self.out_of_core_var.get() or cached else self.stream_file
+        self.load_task = BackgroundTask(
+            self.frame,
+            lambda: producer(file_path),
+            self.on_load_progress,
+            on_error=self.on_load_failed
+        ).start()
+    
+    @staticmethod
+    def stream_file(file_path: str):
+        """Worker-side generator: yield each chunk, then the concatenated result.
+        
+        Yields ('chunk', DataFrame, bytes read) per chunk, then
+        ('tables', child tables, memory reports) for JSON sources and finally
+        ('complete', DataFrame, info) with the full frame, compacted to its
+        smallest dtypes, and its summary (including the memory report), so
+        flattening, concatenation and statistics stay off the Tk thread.
+        """
+        flattener = None
+        if FileLoader.detect_file_type(file_path) in ('json', 'jsonl'):
+            flattener = JsonFlattener.for_file(file_path)
+        
+        chunks = []
+        for chunk, bytes_read in FileLoader.iter_file_chunks(file_path, flattener=flattener):
+            chunks.append(chunk)
+            yield 'chunk', chunk, bytes_read
+        
+        data = chunks[0] if len(chunks) == 1 else pd.concat(chunks, ignore_index=True)
+        chunks.clear()
+        data, memory = DataProcessor.optimize_dtypes(data)
+        
+        if flattener is not None:
+            tables, reports = {}, {}
+            for name, table in flattener.child_tables().items():
+                tables[name], reports[name] = DataProcessor.optimize_dtypes(table)
+            yield 'tables', tables, reports
+        
+        info = DataProcessor.get_dataframe_info(data)
+        info['memory'] = memory
+        if len(info['numeric_columns']) >= 2:
+            corr = DataProcessor.get_correlation_matrix(data, DataExplorerTab.CORRELATION_TOLERANCE)
+            info['top_correlations'] = CorrelationEngine.top_pairs(corr, DataExplorerTab.CORRELATION_PAIRS)
+        yield 'complete', data, info
+    
+    @staticmethod
+    def stream_store(file_path: str):
+        """Worker-side generator for out-of-core loads.
+        
+        Converts the file into a memory-mapped ColumnarStore once (reusing a
+        current conversion), yielding ('converting', rows, bytes read), then
+        ('store', ColumnarStore, info) with a profile computed by scanning.
+        """
+        store = ColumnarStore.open_cached(file_path)
+        if store is None:
+            for rows, bytes_read in ColumnarStore.convert(file_path):
+                yield 'converting', rows, bytes_read
+            store = ColumnarStore.open_cached(file_path)
+        
+        info = DataProcessor.get_store_info(store)
+        info['store_path'] = str(store.directory)
+        yield 'store', store, info
+    
+    @staticmethod
+    def stream_snapshot(snapshot: SnapshotLoader, table: Optional[str] = None):
+        """Worker-side generator for snapshots: the inferred joins, then one table.
+        
+        Yields ('joins', joins, None) and then ('snapshot_table', name,
+        (DataFrame, info)) for ``table`` (when given and present) or the
+        largest table; other tables are parsed when first selected.
+        """
+        yield 'joins', snapshot.infer_joins(), None
+        names = snapshot.table_names
+        if table is not None and table.split('.', 1)[0] in snapshot.paths:
+            yield DataExplorerTab.load_snapshot_table(snapshot, table)
+        elif names:
+            largest = max(names, key=lambda name: snapshot.paths[name].stat().st_size)
+            yield DataExplorerTab.load_snapshot_table(snapshot, largest)
+    
+    @staticmethod
+    def load_snapshot_table(snapshot: SnapshotLoader, name: str) -> tuple:
+        """Parse (or fetch) one snapshot table and summarize it (runs on a worker)."""
+        data = snapshot.table(name)
+        info = DataProcessor.get_dataframe_info(data)
+        info['memory'] = snapshot.memory_report(name)
+        return 'snapshot_table', name, (data, info)
+    
+    @staticmethod
+    def join_label(join: Dict[str, Any]) -> str:
+        """How an inferred join is listed in the join selector."""
+        return f"{join['left']} ⟕ {join['right']}  on {join['left_on']} = {join['right_on']}  ({join['containment']:.0%} of {join['matched']:,} values match)"
+    
+    def show_table(self, name: str, data: pd.DataFrame, info: Dict[str, Any]):
+        """Make a loaded table (snapshot table, child table or join result) current."""
+        self.tables[name] = data
+        self.memory_reports[name] = info.get('memory', {})
+        names = list(self.tables)
+        if self.snapshot is not None:
+            children = [child for table in self.snapshot.table_names for child in self.snapshot.child_tables(table)]
+            names = list(dict.fromkeys(self.snapshot.table_names + children + names))
+        self.table_selector.config(values=names, state='readonly' if len(names) > 1 else 'disabled')
+        self.table_selector.set(name)
+        self.data = data
+        self.data_info = info
+        self.refresh_views()
+        self.start_search_index()
+        self.status_label.config(
+            text=f"✓ Showing {name}: {len(data):,} rows, {len(data.columns)} columns",
+            foreground=self.theme_colors['SUCCESS']
+        )
+    
+    def run_join(self):
+        """Execute the selected snapshot join as a hash join on a worker."""
+        index = self.join_selector.current()
+        if self.snapshot is None or index < 0:
+            messagebox.showerror("Error", "Please open a snapshot and select a join")
+            return
+        
+        join = self.joins[index]
+        name = f"{join['left']} ⟕ {join['right']} ({join['right_on']})"
+        snapshot = self.snapshot
+        
+        def produce():
+            data = snapshot.join(join['left'], join['left_on'], join['right'], join['right_on'])
+            data, memory = DataProcessor.optimize_dtypes(data)
+            info = DataProcessor.get_dataframe_info(data)
+            info['memory'] = memory
+            yield 'snapshot_table', name, (data, info)
+        
+        self.start_table_task(produce, f"Joining {join['left']} and {join['right']}...")
+    
+    def start_table_task(self, produce, message: str):
+        """Run a snapshot table load or join on a worker, superseding the previous one."""
+        if self.table_task is not None:
+            self.table_task.cancel()
+        self.status_label.config(text=message, foreground=self.theme_colors['TEXT_SECONDARY'])
+        self.table_task = BackgroundTask(self.frame, produce, self.on_load_progress, on_error=self.on_load_failed).start()
+    
+    def on_load_progress(self, item):
+        """Show the first chunk immediately and report progress for the rest."""
+        kind, data, extra = item
+        
+        if kind == 'joins':
+            self.joins = data
+            self.join_selector.config(values=[self.join_label(join) for join in data])
+            if data:
+                self.join_selector.current(0)
+            self.join_row.pack(fill="x", pady=(15, 0))
+            return
+        
+        if kind == 'snapshot_table':
+            self.show_table(data, *extra)
+            self.pending_session = None
+            self.save_session()
+            return
+        
+        if kind == 'tables':
+            self.tables = data
+            self.memory_reports = extra
+            return
+        
+        if kind == 'store':
+            self.data = data
+            self.data_info = extra
+            self.refresh_views()
+            self.start_search_index()
+            elapsed = time.perf_counter() - self.load_started
+            PerfMonitor.instance().record('load', Path(self.file_path).name, elapsed, len(data), self.load_file_size)
+            source = "Restored from cache" if self.pending_session is not None else "Loaded out of core"
+            self.status_label.config(
+                text=f"✓ {source}: {len(data):,} rows, {len(data.columns)} columns in {elapsed:.1f}s",
+                foreground=self.theme_colors['SUCCESS']
+            )
+            self.pending_session = None
+            self.save_session()
+            return
+        
+        if kind == 'converting':
+            elapsed = time.perf_counter() - self.load_started
+            rate = data / elapsed if elapsed > 0 else 0
+            percent = min(extra / self.load_file_size * 100, 100)
+            self.status_label.config(
+                text=f"Converting... {data:,} rows ({percent:.0f}%) · {rate:,.0f} rows/s",
+                foreground=self.theme_colors['TEXT_SECONDARY']
+            )
+            return
+        
+        if kind == 'complete':
+            self.data = data
+            self.data_info = extra
+            self.tables = {Path(self.file_path).stem: data, **self.tables}
+            self.memory_reports[Path(self.file_path).stem] = extra.get('memory', {})
+            names = list(self.tables)
+            self.table_selector.config(values=names, state='readonly' if len(names) > 1 else 'disabled')
+            self.table_selector.set(names[0])
+            self.refresh_views()
+            self.start_search_index()
+            elapsed = time.perf_counter() - self.load_started
+            PerfMonitor.instance().record('load', Path(self.file_path).name, elapsed, len(data), self.load_file_size)
+            rate = len(data) / elapsed if elapsed > 0 else 0
+            self.status_label.config(
+                text=f"✓ Loaded: {len(data):,} rows, {len(data.columns)} columns in {elapsed:.1f}s ({rate:,.0f} rows/s)",
+                foreground=self.theme_colors['SUCCESS']
+            )
+            table = (self.pending_session or {}).get('table')
+            self.pending_session = None
+            if table in self.tables and table != names[0]:
+                self.table_selector.set(table)
+                self.on_table_selected()
+            self.save_session()
+            self.start_store_cache(self.file_path, data)
+            return
+        
+        self.loaded_rows += len(data)
+        if self.data is None:
+            # Preview from the first chunk while the rest streams in
+            self.data = data
+            self.data_info = DataProcessor.get_dataframe_info(data)
+            self.refresh_views()
+        
+        elapsed = time.perf_counter() - self.load_started
+        rate = self.loaded_rows / elapsed if elapsed > 0 else 0
+        percent = min(extra / self.load_file_size * 100, 100)
+        self.status_label.config(
+            text=f"Loading... {self.loaded_rows:,} rows ({percent:.0f}%) · {rate:,.0f} rows/s",
+            foreground=self.theme_colors['TEXT_SECONDARY']
+        )
+    
+    def on_table_selected(self, event=None):
+        """Show the main table or one of the child tables exploded from nested arrays."""
+        name = self.table_selector.get()
+        data = self.tables.get(name)
+        if data is None and self.snapshot is not None:
+            # Snapshot tables are parsed the first time they are selected
+            snapshot = self.snapshot
+            self.start_table_task(lambda: [self.load_snapshot_table(snapshot, name)], f"Loading {name}...")
+            return
+        if data is None or data is self.data:
+            return
+        self.data = data
+        self.data_info = DataProcessor.get_dataframe_info(data)
+        self.data_info['memory'] = self.memory_reports.get(self.table_selector.get(), {})
+        self.refresh_views()
+        self.start_search_index()
+        self.status_label.config(
+            text=f"✓ Showing {self.table_selector.get()}: {len(data):,} rows, {len(data.columns)} columns",
+            foreground=self.theme_colors['SUCCESS']
+        )
+    
+    def on_load_failed(self, error: Exception):
+        """Report a failed background load."""
+        if self.pending_session is not None:
+            # A file that no longer loads is dropped from the session quietly
+            self.pending_session = None
+            if self.session_manager is not None:
+                self.session_manager.clear('explorer')
+            self.status_label.config(text="No data loaded", foreground=self.theme_colors['TEXT_SECONDARY'])
+            return
+        messagebox.showerror("Error", f"Failed to load data: {str(error)}")
+        self.status_label.config(text="✗ Error loading data", foreground=self.theme_colors['ERROR'])
+    
+    def start_store_cache(self, file_path: str, data: pd.DataFrame):
+        """Write an in-memory load to the columnar cache on a worker, unless it is current.
+
+        The write cannot be stopped once started, but it goes to its own
+        temporary directory, so an out-of-core reload of the same file can
+        convert it at the same time without either corrupting the store.
+        """
+        def produce():
+            if ColumnarStore.open_cached(file_path) is None:
+                ColumnarStore.write_frame(data, file_path)
+            return ()
+        
+        self.cache_task = BackgroundTask(self.frame, produce, lambda item: None, on_error=lambda e: None).start()
+    
+    def restore_session(self):
+        """Reopen the file, table, chart columns and search of the previous session."""
+        if self.session_manager is None:
+            return
+        state = self.session_manager.get('explorer')
+        file_path = state.get('file_path')
+        if not file_path or not os.path.exists(file_path):
+            return
+        
+        self.file_entry.delete(0, tk.END)
+        self.file_entry.insert(0, file_path)
+        self.file_path = file_path
+        self.out_of_core_var.set(bool(state.get('out_of_core')))
+        
+        # Chart controls and the search box keep these once the columns exist
+        for var, key in ((self.chart_type_var, 'chart_type'), (self.library_var, 'library'),
+                         (self.x_column_var, 'x_column'), (self.y_column_var, 'y_column')):
+            if state.get(key):
+                var.set(state[key])
+        self.table_search_entry.delete(0, tk.END)
+        self.table_search_entry.insert(0, state.get('search', ''))
+        
+        self.pending_session = state
+        self.load_data(restore=True)
+    
+    def save_session(self):
+        """Record the open file, table, chart columns and search for the next session."""
+        if self.session_manager is None or not self.has_data():
+            return
+        self.session_manager.update(
+            'explorer',
+            file_path=self.file_path,
+            file_type=self.file_type,
+            table=self.table_selector.get(),
+            out_of_core=self.out_of_core_var.get(),
+            chart_type=self.chart_type_var.get(),
+            library=self.library_var.get(),
+            x_column=self.x_column_var.get(),
+            y_column=self.y_column_var.get(),
+            search=self.table_search_entry.get(),
+        )
+    
+    def refresh_views(self):
+        """Refresh the overview, chart controls and table for the current data."""
+        self.data_fingerprint = ChartCache.fingerprint(self.data) if self.has_data() else None
+        if self.data_fingerprint is not None:
+            self.chart_fingerprints.add(self.data_fingerprint)
+        self.update_overview()
+        self.update_chart_controls()
+        self.update_table()
     
     def update_overview(self):
         """Update overview panel with data information."""
@@ -304,6 +880,30 @@ DATA TYPES:
         for col, dtype in info['dtypes'].items():
             text += f"  {col}: {dtype}\n"
         
+        if info.get('store_path'):
+            text += f"\nOUT-OF-CORE: columns memory-mapped from {info['store_path']}\n"
+        
+        memory = info.get('memory')
+        if memory:
+            before = sum(column['before'] for column in memory.values())
+            after = sum(column['after'] for column in memory.values())
+            ratio = before / after if after else 1.0
+            text += f"\nMEMORY: {DataProcessor.format_bytes(before)} → {DataProcessor.format_bytes(after)} ({ratio:.1f}x smaller)\n"
+            for col, column in sorted(memory.items(), key=lambda item: item[1]['saved'], reverse=True):
+                if column['saved'] > 0:
+                    text += f"  {col}: {column['from']} → {column['to']}, saved {DataProcessor.format_bytes(column['saved'])}\n"
+        
+        profile = info.get('profile', {})
+        if profile.get('sampled'):
+            text += f"\nSAMPLED: statistics from {profile['sample_rows']:,} of {profile['rows']:,} rows (± = 95% bounds)\n"
+        
+        if info.get('distinct_counts'):
+            text += f"\nDISTINCT VALUES (approx.):\n"
+            for col, distinct in info['distinct_counts'].items():
+                stats = profile['columns'][col]
+                bound = "≥ " if stats.get('distinct_is_lower_bound') else "≈ "
+                text += f"  {col}: {bound}{distinct:,} (± {stats['distinct_error']:,})\n"
+        
         text += f"\nNULL VALUES:\n"
         for col, count in info['null_counts'].items():
             pct = info['null_percentages'][col]
@@ -320,6 +920,11 @@ DATA TYPES:
                 text += f"    Min: {stats.get('min', 'N/A'):.2f}\n"
                 text += f"    Max: {stats.get('max', 'N/A'):.2f}\n"
         
+        if info.get('top_correlations'):
+            text += f"\nSTRONGEST CORRELATIONS (± {self.CORRELATION_TOLERANCE}):\n"
+            for left, right, value in info['top_correlations']:
+                text += f"  {left} ~ {right}: {value:+.3f}\n"
+        
         if info.get('categorical_counts'):
             text += f"\nCATEGORICAL VALUE COUNTS (Top 10):\n"
             for col, counts in info['categorical_counts'].items():
@@ -329,25 +934,68 @@ DATA TYPES:
         
         self.overview_text.insert(1.0, text)
     
+    def has_data(self) -> bool:
+        """Whether a DataFrame or an out-of-core store is loaded."""
+        return isinstance(self.data, (pd.DataFrame, ColumnarStore))
+    
+    @staticmethod
+    def numeric_columns(data: Union[pd.DataFrame, ColumnarStore]) -> List[str]:
+        """Numeric columns of the loaded data."""
+        if isinstance(data, ColumnarStore):
+            return data.numeric_columns
+        return DataProcessor.detect_numeric_columns(data)
+    
+    @staticmethod
+    def chart_frame(data: Union[pd.DataFrame, ColumnarStore], columns: List[str], fingerprint: Optional[str] = None) -> pd.DataFrame:
+        """Columns for point charts; out-of-core stores give an evenly spaced row sample."""
+        columns = list(dict.fromkeys(columns))
+        if isinstance(data, ColumnarStore):
+            # Samples are read from disk, so they are worth keeping
+            return ChartCache.instance().aggregate(fingerprint, ('sample', tuple(columns)), lambda: data.sample_frame(columns))
+        return data[columns]
+    
+    @staticmethod
+    def value_counts(data: Union[pd.DataFrame, ColumnarStore], col: str, top: int, fingerprint: Optional[str] = None) -> pd.Series:
+        """Most frequent values of a column, scanned in row groups when out of core."""
+        if isinstance(data, ColumnarStore):
+            compute = lambda: data.value_counts(col, top)
+        else:
+            compute = lambda: data[col].value_counts().head(top)
+        return ChartCache.instance().aggregate(fingerprint, ('value_counts', col, top), compute)
+    
+    @staticmethod
+    def store_histogram(store: ColumnarStore, col: str, fingerprint: Optional[str] = None) -> tuple:
+        """Bin counts and edges of an out-of-core column (two scans, so cached)."""
+        return ChartCache.instance().aggregate(fingerprint, ('histogram', col), lambda: store.histogram(col))
+    
+    @staticmethod
+    def chart_columns(chart_type: str, x_col: str, y_col: str) -> tuple:
+        """The columns a chart type actually reads, for its cache key."""
+        if chart_type in ("line", "scatter"):
+            return (x_col, y_col)
+        if chart_type == "heatmap":
+            return ()
+        return (y_col,)
+    
     def update_chart_controls(self):
         """Update chart control options based on loaded data."""
-        if not isinstance(self.data, pd.DataFrame):
+        if not self.has_data():
             return
         
-        columns = self.data.columns.tolist()
+        columns = list(self.data.columns)
         self.x_column_combo['values'] = columns
         self.y_column_combo['values'] = columns
         
         if columns:
             if self.x_column_var.get() not in columns:
                 self.x_column_var.set(columns[0])
-            numeric_cols = DataProcessor.detect_numeric_columns(self.data)
+            numeric_cols = self.numeric_columns(self.data)
             if numeric_cols and self.y_column_var.get() not in columns:
                 self.y_column_var.set(numeric_cols[0])
     
     def generate_chart(self):
         """Generate chart based on selected options."""
-        if not isinstance(self.data, pd.DataFrame):
+        if not self.has_data():
             messagebox.showerror("Error", "Please load data first")
             return
         
@@ -365,7 +1013,15 @@ DATA TYPES:
             messagebox.showerror("Error", f"Failed to generate chart: {str(e)}")
     
     def generate_matplotlib_chart(self, chart_type: str, x_col: str, y_col: str):
-        """Generate matplotlib chart."""
+        """Generate matplotlib chart; the figure is built and rasterized off the Tk thread."""
+        if chart_type not in ("line", "bar", "pie", "histogram", "scatter"):
+            messagebox.showerror("Error", "Chart type not supported with matplotlib")
+            return
+        
+        # A chart still rendering is superseded by the new request
+        if self.pending_chart_card is not None and self.pending_chart_card.winfo_exists():
+            self.pending_chart_card.destroy()
+        
         # Clear previous charts (keep last 3)
         widgets = self.charts_container.winfo_children()
         if len(widgets) > 3:
@@ -374,87 +1030,198 @@ DATA TYPES:
         
         chart_card = Card(self.charts_container, title=f"{chart_type.title()} Chart", padding=15, theme_colors=self.theme_colors)
         chart_card.pack(fill="x", pady=(0, 15))
+        view = RenderedChart(chart_card.content_frame)
+        view.pack(fill="both", expand=True)
+        self.pending_chart_card = chart_card
         
-        try:
-            if chart_type == "line":
-                fig = ChartEngine.create_line_chart_matplotlib(self.data, x_col, y_col, f"Line Chart: {y_col} over {x_col}")
-            elif chart_type == "bar":
-                value_counts = self.data[y_col].value_counts().head(20)
-                fig = ChartEngine.create_bar_chart_matplotlib(value_counts, f"Bar Chart: {y_col}")
-            elif chart_type == "pie":
-                value_counts = self.data[y_col].value_counts().head(10)
-                fig = ChartEngine.create_pie_chart_matplotlib(value_counts, f"Pie Chart: {y_col}")
-            elif chart_type == "histogram":
-                fig = ChartEngine.create_histogram_matplotlib(self.data[y_col], f"Histogram: {y_col}")
-            elif chart_type == "scatter":
-                fig = ChartEngine.create_scatter_plot_matplotlib(self.data, x_col, y_col, f"Scatter Plot: {y_col} vs {x_col}")
-            else:
-                messagebox.showerror("Error", "Chart type not supported with matplotlib")
-                chart_card.destroy()
-                return
-            
-            canvas = FigureCanvasTkAgg(fig, chart_card.content_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill="both", expand=True)
-        except Exception as e:
-            messagebox.showerror("Error", f"Chart generation failed: {str(e)}")
+        def on_ready(result):
+            self.pending_chart_card = None
+        
+        def on_error(error: Exception):
+            messagebox.showerror("Error", f"Chart generation failed: {str(error)}")
             chart_card.destroy()
+            self.pending_chart_card = None
+        
+        # The same chart of the same data is shown from the cache without rendering
+        data = self.data
+        fingerprint = self.data_fingerprint
+        cache_key = ChartCache.chart_key(fingerprint, chart_type, self.chart_columns(chart_type, x_col, y_col), "matplotlib", self.theme_colors)
+        view.render(lambda: self.build_matplotlib_chart(data, chart_type, x_col, y_col, fingerprint), on_error, on_ready=on_ready, key="explorer-chart", cache_key=cache_key)
+    
+    @staticmethod
+    def build_matplotlib_chart(data: Union[pd.DataFrame, ColumnarStore], chart_type: str, x_col: str, y_col: str, fingerprint: Optional[str] = None):
+        """Build a matplotlib figure for the chart controls (runs on the render worker)."""
+        if chart_type == "line":
+            return ChartEngine.create_line_chart_matplotlib(DataExplorerTab.chart_frame(data, [x_col, y_col], fingerprint), x_col, y_col, f"Line Chart: {y_col} over {x_col}")
+        if chart_type == "bar":
+            return ChartEngine.create_bar_chart_matplotlib(DataExplorerTab.value_counts(data, y_col, 20, fingerprint), f"Bar Chart: {y_col}")
+        if chart_type == "pie":
+            return ChartEngine.create_pie_chart_matplotlib(DataExplorerTab.value_counts(data, y_col, 10, fingerprint), f"Pie Chart: {y_col}")
+        if chart_type == "histogram" and isinstance(data, ColumnarStore):
+            counts, edges = DataExplorerTab.store_histogram(data, y_col, fingerprint)
+            return ChartEngine.create_binned_histogram_matplotlib(counts, edges, y_col, f"Histogram: {y_col}")
+        if chart_type == "histogram":
+            return ChartEngine.create_histogram_matplotlib(data[y_col], f"Histogram: {y_col}")
+        return ChartEngine.create_scatter_plot_matplotlib(DataExplorerTab.chart_frame(data, [x_col, y_col], fingerprint), x_col, y_col, f"Scatter Plot: {y_col} vs {x_col}")
     
     def generate_plotly_chart(self, chart_type: str, x_col: str, y_col: str):
         """Generate plotly chart and open in browser."""
         try:
-            if chart_type == "line":
-                fig = ChartEngine.create_line_chart_plotly(self.data, x_col, y_col, f"Line Chart: {y_col} over {x_col}")
-            elif chart_type == "bar":
-                value_counts = self.data[y_col].value_counts().head(20)
-                fig = ChartEngine.create_bar_chart_plotly(value_counts, f"Bar Chart: {y_col}")
-            elif chart_type == "pie":
-                value_counts = self.data[y_col].value_counts().head(10)
-                fig = ChartEngine.create_pie_chart_plotly(value_counts, f"Pie Chart: {y_col}")
-            elif chart_type == "histogram":
-                fig = ChartEngine.create_histogram_plotly(self.data[y_col], f"Histogram: {y_col}")
-            elif chart_type == "scatter":
-                fig = ChartEngine.create_scatter_plot_plotly(self.data, x_col, y_col, f"Scatter Plot: {y_col} vs {x_col}")
-            elif chart_type == "heatmap":
-                numeric_cols = DataProcessor.detect_numeric_columns(self.data)
-                if len(numeric_cols) < 2:
-                    messagebox.showerror("Error", "Need at least 2 numeric columns for heatmap")
+            cache = ChartCache.instance()
+            fingerprint = self.data_fingerprint
+            key = ChartCache.chart_key(fingerprint, chart_type, self.chart_columns(chart_type, x_col, y_col), "plotly", self.theme_colors)
+            figure_json = cache.get(key)
+            if figure_json is None:
+                started = time.perf_counter()
+                fig = self.build_plotly_chart(self.data, chart_type, x_col, y_col, fingerprint)
+                if fig is None:
                     return
-                fig = ChartEngine.create_heatmap_plotly(self.data[numeric_cols], "Correlation Heatmap")
-            else:
-                messagebox.showerror("Error", "Chart type not supported")
-                return
+                figure_json = fig.to_json()
+                PerfMonitor.instance().record('chart', f"{chart_type} (plotly)", time.perf_counter() - started)
+                cache.put(key, figure_json)
             
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.html')
-            temp_file.close()
-            fig.write_html(temp_file.name)
-            webbrowser.open(f'file://{temp_file.name}')
-            messagebox.showinfo("Chart Generated", "Interactive chart opened in your browser")
+            if ChartServer.publish(figure_json) == "updated":
+                messagebox.showinfo("Chart Generated", "Interactive chart updated in your open browser tab")
+            else:
+                messagebox.showinfo("Chart Generated", "Interactive chart opened in your browser")
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to generate plotly chart: {str(e)}")
     
+    @staticmethod
+    def build_plotly_chart(data: Union[pd.DataFrame, ColumnarStore], chart_type: str, x_col: str, y_col: str, fingerprint: Optional[str] = None):
+        """Build a plotly figure for the chart controls; None (after reporting why) if it cannot be drawn."""
+        if chart_type == "line":
+            return ChartEngine.create_line_chart_plotly(DataExplorerTab.chart_frame(data, [x_col, y_col], fingerprint), x_col, y_col, f"Line Chart: {y_col} over {x_col}")
+        if chart_type == "bar":
+            return ChartEngine.create_bar_chart_plotly(DataExplorerTab.value_counts(data, y_col, 20, fingerprint), f"Bar Chart: {y_col}")
+        if chart_type == "pie":
+            return ChartEngine.create_pie_chart_plotly(DataExplorerTab.value_counts(data, y_col, 10, fingerprint), f"Pie Chart: {y_col}")
+        if chart_type == "histogram" and isinstance(data, ColumnarStore):
+            counts, edges = DataExplorerTab.store_histogram(data, y_col, fingerprint)
+            return ChartEngine.create_binned_histogram_plotly(counts, edges, y_col, f"Histogram: {y_col}")
+        if chart_type == "histogram":
+            return ChartEngine.create_histogram_plotly(data[y_col], f"Histogram: {y_col}")
+        if chart_type == "scatter":
+            return ChartEngine.create_scatter_plot_plotly(DataExplorerTab.chart_frame(data, [x_col, y_col], fingerprint), x_col, y_col, f"Scatter Plot: {y_col} vs {x_col}")
+        if chart_type == "heatmap":
+            numeric_cols = DataExplorerTab.numeric_columns(data)
+            if len(numeric_cols) < 2:
+                messagebox.showerror("Error", "Need at least 2 numeric columns for heatmap")
+                return None
+            corr = ChartCache.instance().aggregate(
+                fingerprint, ('correlation', tuple(numeric_cols)),
+                lambda: CorrelationEngine.matrix(DataExplorerTab.chart_frame(data, numeric_cols, fingerprint), numeric_cols)
+            )
+            return ChartEngine.create_correlation_heatmap_plotly(corr, "Correlation Heatmap")
+        messagebox.showerror("Error", "Chart type not supported")
+        return None
+    
     def update_table(self):
         """Update data table view."""
-        for item in self.data_tree.get_children():
-            self.data_tree.delete(item)
-        
-        if not isinstance(self.data, pd.DataFrame):
+        if not self.has_data():
+            self.data_table.set_data(None)
+            self.table_count_label.config(text="")
             return
         
-        columns = self.data.columns.tolist()
-        self.data_tree['columns'] = columns
+        self.data_table.set_data(self.data)
+        self.table_count_label.config(text=f"{len(self.data):,} rows")
+    
+    def on_goto_row(self, event=None):
+        """Scroll the table to the row number typed in the jump box."""
+        try:
+            row = int(self.goto_row_entry.get().replace(",", "").strip())
+        except ValueError:
+            return
+        if not self.data_table.jump_to_row(row):
+            messagebox.showinfo("Go to row", f"Row {row:,} is not in the current view")
+    
+    def on_table_search(self, event=None):
+        """Debounce keystrokes in the table search box."""
+        if self.search_job is not None:
+            self.frame.after_cancel(self.search_job)
+        self.search_job = self.frame.after(150, self.run_table_search)
+    
+    def start_search_index(self):
+        """Index the loaded data for table search on a background worker."""
+        if self.search_task is not None:
+            self.search_task.cancel()
+        if isinstance(self.data, ColumnarStore):
+            # Out-of-core data is searched by scanning row groups instead
+            self.search_index = None
+            return
+        self.search_index = TableSearchIndex(self.data)
+        self.search_task = BackgroundTask(
+            self.frame,
+            self.search_index.build_all,
+            lambda column: None,
+            on_done=self.run_table_search,
+            on_error=lambda e: None  # columns are indexed on demand instead
+        ).start()
+        self.run_table_search()
+    
+    def run_table_search(self):
+        """Show only the rows matching the search box (all rows when empty)."""
+        self.search_job = None
+        if isinstance(self.data, ColumnarStore):
+            self.run_store_search()
+            return
+        if self.search_index is None or self.search_index.data is not self.data:
+            return
         
-        for col in columns:
-            self.data_tree.heading(col, text=col)
-            self.data_tree.column(col, width=120, anchor='w')
+        query = self.table_search_entry.get()
+        if not query.strip() and self.data_table.positions is None:
+            return
         
-        # Limit to first 1000 rows for performance
-        display_data = self.data.head(1000)
-        for idx, row in display_data.iterrows():
-            values = [str(val)[:50] if pd.notna(val) else "" for val in row]
-            self.data_tree.insert("", "end", values=values)
+        with PerfMonitor.instance().timer('filter', "table search") as counts:
+            positions = self.search_index.search(query)
+            self.data_table.set_positions(positions)
+            counts['rows'] = len(self.data) if positions is None else len(positions)
+        if positions is None:
+            self.table_count_label.config(text=f"{len(self.data):,} rows")
+        else:
+            self.table_count_label.config(text=f"{len(positions):,} of {len(self.data):,} rows")
     
-    def on_table_search(self, event=None):
-        """Handle table search - placeholder for future implementation."""
-        pass
+    @staticmethod
+    def scan_store(store: ColumnarStore, query: str):
+        """Worker-side generator: matching row positions of each scanned row group."""
+        for chunk in store.iter_chunks():
+            positions = TableSearchIndex(chunk).search(query)
+            if positions is not None and len(positions):
+                yield positions + chunk.index[0]
+    
+    def run_store_search(self):
+        """Search an out-of-core store on a worker, showing matches when the scan ends."""
+        if self.search_task is not None:
+            self.search_task.cancel()
+        
+        store = self.data
+        query = self.table_search_entry.get()
+        if not query.strip():
+            if self.data_table.positions is not None:
+                self.data_table.set_positions(None)
+            self.table_count_label.config(text=f"{len(store):,} rows")
+            return
+        
+        matches = []
+        started = time.perf_counter()
+        
+        def on_matches(positions):
+            matches.append(positions)
+            found = sum(len(part) for part in matches)
+            self.table_count_label.config(text=f"Searching... {found:,} matches")
+        
+        def on_done():
+            positions = np.concatenate(matches) if matches else np.zeros(0, dtype=np.int64)
+            self.data_table.set_positions(positions)
+            PerfMonitor.instance().record('filter', "table search (out of core)", time.perf_counter() - started, len(positions))
+            self.table_count_label.config(text=f"{len(positions):,} of {len(store):,} rows")
+        
+        self.table_count_label.config(text="Searching...")
+        self.search_task = BackgroundTask(
+            self.frame,
+            lambda: self.scan_store(store, query),
+            on_matches,
+            on_done=on_done,
+            on_error=lambda e: self.table_count_label.config(text=f"✗ Search failed: {str(e)}")
+        ).start()
@@ -3,56 +3,77 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, TYPE_CHECKING
 import json
 import os
-import datetime
+import numpy as np
 
 from app.utils.scrollable_frame import ScrollableFrame
-from app.modules.file_loader import FileLoader
+from app.utils.rendered_chart import RenderedChart
+from app.modules.background_task import BackgroundTask
+from app.modules.chart_cache import ChartCache
+from app.modules.perf_monitor import PerfMonitor
+from app.modules.session_manager import SessionManager
 from app.modules.theme import Theme
+from app.modules.user_store import UserStore, FILTERS
 from app.modules.ui_components import Card, StatCard
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-from matplotlib import style as mpl_style
 
-# Use a modern matplotlib style
-try:
-    mpl_style.use('seaborn-v0_8-darkgrid')
-except:
-    try:
-        mpl_style.use('seaborn-darkgrid')
-    except:
-        mpl_style.use('default')
+if TYPE_CHECKING:
+    from app.modules.chart_host import ChartHost
 
 
 class MigrationToolTab:
     """Tab for migration tool functionality."""
     
-    def __init__(self, parent, theme_manager):
+    # Sortable browser columns and their heading labels
+    SORT_HEADINGS = {"email": "Email", "name": "Name", "points": "Points"}
+    
+    def __init__(self, parent, theme_manager, session_manager: Optional[SessionManager] = None):
         self.parent = parent
         self.theme_manager = theme_manager
+        self.session_manager = session_manager
         self.theme_colors = theme_manager.get_current_theme()
         self.frame = ttk.Frame(parent, padding=20)
         
-        # Data storage
-        self.linked_users: List[Dict[str, Any]] = []
-        self.unmatched_users: List[Dict[str, Any]] = []
-        self.sync_report: Optional[Dict[str, Any]] = None
+        # Loaded users, summaries and dashboard aggregates (row index == tree iid)
+        self.store: Optional[UserStore] = None
+        self.load_task: Optional[BackgroundTask] = None
+        self.cache_task: Optional[BackgroundTask] = None
+        # Whether the load in progress may reopen the columnar cache
+        self.restoring = False
         
         # File paths
         self.linked_users_path = ""
         self.unmatched_users_path = ""
         self.sync_report_path = ""
         
-        # Selected user
+        # Browser state (filtering and sort permutations live in the store)
+        self.row_iids: np.ndarray = np.empty(0, dtype=object)
+        self.sort_column: Optional[str] = None
+        self.sort_descending = False
+        self.visible_rows: Optional[np.ndarray] = None
+        self.visible_mask: Optional[np.ndarray] = None
+        
+        # Selected user (the id is kept so the selection survives a reload)
         self.selected_user: Optional[Dict[str, Any]] = None
+        self.selected_user_id: Optional[str] = None
+        
+        # Persistent chart canvases (created on first use, then updated in place)
+        self.stats_chart_host: Optional['ChartHost'] = None
+        self.timeline_host: Optional['ChartHost'] = None
+        # The dashboard is built and rasterized on the render worker
+        self.dashboard_view: Optional[RenderedChart] = None
+        # Chart cache key of the loaded files
+        self.data_fingerprint: Optional[str] = None
         
         # Build UI
         self.create_widgets()
         
         # Load default files if they exist
         self.load_default_files()
+        
+        # The previous session's files, filters and selection take precedence
+        self.restore_session()
     
     def update_theme(self, theme_colors: dict):
         """Update theme colors for all components."""
@@ -74,16 +95,16 @@ class MigrationToolTab:
             else:
                 self.status_label.config(foreground=theme_colors['TEXT_SECONDARY'])
         
-        # Recreate charts with new theme if data is loaded
-        if self.sync_report:
-            for widget in self.stats_charts_frame.winfo_children():
-                widget.destroy()
-            self.create_stats_charts()
+        if hasattr(self, 'user_tree'):
+            self.user_tree.tag_configure("matched", foreground=theme_colors['SUCCESS'])
+            self.user_tree.tag_configure("unmatched", foreground=theme_colors['WARNING'])
         
-        if self.selected_user and 'clerkId' in self.selected_user:
-            for widget in self.detail_charts_frame.winfo_children():
-                widget.destroy()
-            self.create_user_charts(self.selected_user)
+        # Recolor existing chart artists in place (one redraw per canvas)
+        for host in (self.stats_chart_host, self.timeline_host):
+            if host is not None:
+                host.apply_theme(theme_colors)
+        if self.dashboard_view is not None:
+            self.render_population_dashboard()
     
     def create_widgets(self):
         """Create all UI widgets for the migration tool tab."""
@@ -177,10 +198,17 @@ class MigrationToolTab:
         self.stats_text.pack(side="left", fill="both", expand=True)
         stats_scrollbar.pack(side="right", fill="y")
         
-        # Charts (right side)
-        charts_frame = ttk.Frame(summary_container)
-        charts_frame.pack(side='left', fill="both", expand=True)
+        # Charts (right side): sync report charts and population dashboard
+        charts_notebook = ttk.Notebook(summary_container)
+        charts_notebook.pack(side='left', fill="both", expand=True)
+        
+        charts_frame = ttk.Frame(charts_notebook)
+        charts_notebook.add(charts_frame, text="  Sync Status  ")
         self.stats_charts_frame = charts_frame
+        
+        dashboard_frame = ttk.Frame(charts_notebook)
+        charts_notebook.add(dashboard_frame, text="  Population  ")
+        self.dashboard_frame = dashboard_frame
     
     def create_user_browser(self, parent):
         """Create user browser with modern design."""
@@ -225,9 +253,8 @@ class MigrationToolTab:
             height=35
         )
         self.user_tree.heading("#0", text="User ID")
-        self.user_tree.heading("email", text="Email")
-        self.user_tree.heading("name", text="Name")
-        self.user_tree.heading("points", text="Points")
+        for column, heading in self.SORT_HEADINGS.items():
+            self.user_tree.heading(column, text=heading, command=lambda c=column: self.on_sort(c))
         self.user_tree.column("#0", width=250, anchor='w')
         self.user_tree.column("email", width=300, anchor='w')
         self.user_tree.column("name", width=220, anchor='w')
@@ -338,32 +365,118 @@ class MigrationToolTab:
                     else:
                         self.sync_report_path = str(file_path)
     
-    def load_data(self):
-        """Load data from selected files."""
-        try:
-            self.linked_users = []
-            if self.linked_users_path and os.path.exists(self.linked_users_path):
-                self.linked_users = FileLoader.load_jsonl(self.linked_users_path)
-            
-            self.unmatched_users = []
-            if self.unmatched_users_path and os.path.exists(self.unmatched_users_path):
-                self.unmatched_users = FileLoader.load_jsonl(self.unmatched_users_path)
-            
-            self.sync_report = None
-            if self.sync_report_path and os.path.exists(self.sync_report_path):
-                self.sync_report = FileLoader.load_json(self.sync_report_path)
-            
-            self.update_stats_cards()
-            self.update_summary_and_charts()
-            self.update_user_browser()
-            self.status_label.config(
-                text=f"✓ Loaded: {len(self.linked_users)} linked, {len(self.unmatched_users)} unmatched",
-                foreground=self.theme_colors['SUCCESS']
-            )
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load data: {str(e)}")
-            self.status_label.config(text="✗ Error loading data", foreground=self.theme_colors['ERROR'])
+    def restore_session(self):
+        """Restore the previous session's files, search, filter, sort and selected user.
+        
+        If data was loaded when the app closed, it is reopened from the
+        columnar cache (or parsed again if the files changed) once the tab
+        is on screen, and the saved user is selected.
+        """
+        if self.session_manager is None:
+            return
+        state = self.session_manager.get('migration')
+        if not state:
+            return
+        
+        for key, entry in (('linked_users_path', self.linked_users_entry),
+                           ('unmatched_users_path', self.unmatched_users_entry),
+                           ('sync_report_path', self.sync_report_entry)):
+            path = state.get(key)
+            if path and os.path.exists(path):
+                entry.delete(0, tk.END)
+                entry.insert(0, path)
+                setattr(self, key, path)
+        
+        self.search_entry.insert(0, state.get('search', ''))
+        if state.get('filter') in FILTERS:
+            self.filter_var.set(state['filter'])
+        if state.get('sort_column') in self.SORT_HEADINGS:
+            self.sort_column = state['sort_column']
+            self.sort_descending = bool(state.get('sort_descending'))
+            self.update_sort_headings()
+        self.selected_user_id = state.get('selected_user_id')
+        
+        if state.get('loaded'):
+            self.frame.after_idle(lambda: self.load_data(restore=True))
+    
+    def save_session(self, loaded: Optional[bool] = None):
+        """Record the files, search, filter, sort and selected user for the next session."""
+        if self.session_manager is None:
+            return
+        values = {
+            'linked_users_path': self.linked_users_path,
+            'unmatched_users_path': self.unmatched_users_path,
+            'sync_report_path': self.sync_report_path,
+            'search': self.search_entry.get(),
+            'filter': self.filter_var.get(),
+            'sort_column': self.sort_column,
+            'sort_descending': self.sort_descending,
+            'selected_user_id': self.selected_user_id,
+        }
+        if loaded is not None:
+            values['loaded'] = loaded
+        self.session_manager.update('migration', **values)
+    
+    def load_data(self, restore: bool = False):
+        """Load data from selected files on a worker thread.
+
+        With ``restore``, files unchanged since the last session are
+        reopened from the columnar cache instead of being parsed.
+        """
+        if self.load_task is not None:
+            self.load_task.cancel()
+        self.restoring = restore
+        self.status_label.config(text="Loading...", foreground=self.theme_colors['TEXT_SECONDARY'])
+        self.load_task = UserStore.load_async(
+            self.frame,
+            self.linked_users_path,
+            self.unmatched_users_path,
+            self.sync_report_path,
+            on_done=self.on_store_loaded,
+            on_progress=self.on_load_progress,
+            on_error=self.on_load_failed,
+            use_cache=restore
+        )
+    
+    def on_load_progress(self, rows: int, bytes_read: int):
+        self.status_label.config(text=f"Loading... {rows:,} users ({bytes_read / 1e6:.1f} MB)")
+    
+    def on_store_loaded(self, store: UserStore):
+        """Show a freshly loaded store and restore the selected user."""
+        self.store = store
+        
+        # Charts cached for the previous load are stale now
+        if self.data_fingerprint is not None:
+            ChartCache.instance().invalidate(self.data_fingerprint)
+        self.data_fingerprint = ChartCache.file_fingerprint(store.paths)
+        
+        self.update_stats_cards()
+        self.update_summary_and_charts()
+        self.render_population_dashboard()
+        self.update_user_browser()
+        source = "Restored" if self.restoring else "Loaded"
+        self.restoring = False
+        self.status_label.config(
+            text=f"✓ {source}: {store.matched_count} linked, {store.unmatched_count} unmatched",
+            foreground=self.theme_colors['SUCCESS']
+        )
+        if self.selected_user_id:
+            self.select_user(self.selected_user_id)
+        self.save_session(loaded=True)
+        self.start_store_cache(store)
+    
+    def start_store_cache(self, store: UserStore):
+        """Write the loaded users to the columnar cache on a worker, for the next session."""
+        def produce():
+            store.save_cache()
+            return ()
+        
+        self.cache_task = BackgroundTask(self.frame, produce, lambda item: None, on_error=lambda e: None).start()
+    
+    def on_load_failed(self, error: Exception):
+        self.restoring = False
+        messagebox.showerror("Error", f"Failed to load data: {str(error)}")
+        self.status_label.config(text="✗ Error loading data", foreground=self.theme_colors['ERROR'])
     
     def update_stats_cards(self):
         """Update stats cards row."""
@@ -371,8 +484,8 @@ class MigrationToolTab:
         for widget in self.stats_cards_frame.winfo_children():
             widget.destroy()
         
-        if self.sync_report:
-            stats = self.sync_report
+        stats = self.store.sync_report if self.store else None
+        if stats:
             # Create 4 stat cards in a horizontal row
             StatCard(
                 self.stats_cards_frame,
@@ -410,8 +523,8 @@ class MigrationToolTab:
         """Update summary text and charts."""
         # Update text
         self.stats_text.delete(1.0, tk.END)
-        if self.sync_report:
-            stats = self.sync_report
+        stats = self.store.sync_report if self.store else None
+        if stats:
             text = f"""SYNC REPORT SUMMARY
 {'='*70}
 
@@ -428,107 +541,102 @@ Mini-Game Records: {stats.get('total_mini_game_records', 0):,}
 """
             self.stats_text.insert(1.0, text)
         
-        # Clear and update charts
-        for widget in self.stats_charts_frame.winfo_children():
-            widget.destroy()
-        
-        if self.sync_report:
-            self.create_stats_charts()
+        # Update charts in place
+        self.create_stats_charts()
     
     def create_stats_charts(self):
         """Create statistics charts."""
-        if not self.sync_report:
+        stats = self.store.sync_report if self.store else None
+        if not stats:
+            if self.stats_chart_host is not None:
+                self.stats_chart_host.hide()
+            return
+        
+        if self.stats_chart_host is None:
+            self.stats_chart_host = self.create_chart_host(self.stats_charts_frame)
+        host = self.stats_chart_host
+        
+        from app.modules.migration_charts import MigrationCharts
+        MigrationCharts.draw_stats_charts(host, stats)
+        host.show()
+        host.draw()
+    
+    def render_population_dashboard(self):
+        """Render the population dashboard from the cached aggregates off the Tk thread."""
+        stats = self.store.population_stats if self.store else None
+        if not stats:
+            if self.dashboard_view is not None:
+                self.dashboard_view.pack_forget()
             return
         
-        stats = self.sync_report
-        fig = Figure(figsize=(10, 5), dpi=100, facecolor=self.theme_colors['BG_PRIMARY'])
-        
-        # Pie chart
-        ax1 = fig.add_subplot(121, facecolor=self.theme_colors['BG_PRIMARY'])
-        matched = stats.get('matched_users', 0)
-        unmatched = stats.get('clerk_only', 0) + stats.get('convex_only', 0)
-        if matched + unmatched > 0:
-            colors = [self.theme_colors['SUCCESS'], self.theme_colors['WARNING']]
-            ax1.pie([matched, unmatched], labels=['Matched', 'Unmatched'], autopct='%1.1f%%', startangle=90, colors=colors)
-            ax1.set_title('User Match Status', fontsize=13, fontweight='bold', color=self.theme_colors['TEXT_PRIMARY'], pad=15)
-        
-        # Bar chart
-        ax2 = fig.add_subplot(122, facecolor=self.theme_colors['BG_PRIMARY'])
-        clerk_total = stats.get('total_clerk_users', 0)
-        convex_total = stats.get('total_convex_users', 0)
-        bars = ax2.bar(['Clerk', 'Convex'], [clerk_total, convex_total], color=[self.theme_colors['PRIMARY'], self.theme_colors['INFO']])
-        ax2.set_title('Users by Source', fontsize=13, fontweight='bold', color=self.theme_colors['TEXT_PRIMARY'], pad=15)
-        ax2.set_ylabel('Count', color=self.theme_colors['TEXT_PRIMARY'])
-        ax2.tick_params(colors=self.theme_colors['TEXT_PRIMARY'])
-        ax2.spines['bottom'].set_color(self.theme_colors['BORDER'])
-        ax2.spines['top'].set_color(self.theme_colors['BORDER'])
-        ax2.spines['right'].set_color(self.theme_colors['BORDER'])
-        ax2.spines['left'].set_color(self.theme_colors['BORDER'])
-        
-        fig.tight_layout(pad=3.0)
-        
-        canvas = FigureCanvasTkAgg(fig, self.stats_charts_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True)
+        if self.dashboard_view is None:
+            self.dashboard_view = RenderedChart(self.dashboard_frame, placeholder="Rendering dashboard...")
+        self.dashboard_view.pack(fill="both", expand=True)
+        
+        # Toggling back to a theme shows its cached render instead of redrawing
+        theme_colors = dict(self.theme_colors)
+        from app.modules.migration_charts import MigrationCharts
+        self.dashboard_view.render(
+            lambda: MigrationCharts.build_population_dashboard(stats, theme_colors),
+            on_error=lambda e: messagebox.showerror("Error", f"Dashboard rendering failed: {str(e)}"),
+            cache_key=ChartCache.chart_key(self.data_fingerprint, "population-dashboard", (), "matplotlib", theme_colors)
+        )
     
     def update_user_browser(self):
         """Update user browser with loaded data."""
-        for item in self.user_tree.get_children():
-            self.user_tree.delete(item)
+        self.row_iids = np.array([str(row) for row in range(len(self.store))], dtype=object)
+        self.visible_rows = None
+        self.visible_mask = None
+        self.populate_user_tree()
+        self.apply_filters()
+    
+    def populate_user_tree(self):
+        """Insert every user row once; filtering and sorting only reorder/detach them."""
+        self.user_tree.delete(*self.user_tree.get_children())
         
-        all_users = []
-        for user in self.linked_users:
-            all_users.append(("matched", user))
-        for user in self.unmatched_users:
-            all_users.append(("unmatched", user))
+        store = self.store
+        for row, (user_id, email, name, points) in enumerate(store.summaries):
+            points_text = f"{points:,.0f}" if points is not None else "N/A"
+            self.user_tree.insert("", "end", iid=str(row), text=user_id[:45], values=(email[:50], name[:40], points_text), tags=(store.user_type(row),))
         
-        self.filtered_users = all_users
-        self.apply_filters()
+        self.user_tree.tag_configure("matched", foreground=self.theme_colors['SUCCESS'])
+        self.user_tree.tag_configure("unmatched", foreground=self.theme_colors['WARNING'])
     
     def apply_filters(self):
-        """Apply search and filter to user list."""
-        search_term = self.search_entry.get().lower()
-        filter_type = self.filter_var.get()
-        
-        for item in self.user_tree.get_children():
-            self.user_tree.delete(item)
-        
-        for user_type, user in self.filtered_users:
-            if filter_type == "matched" and user_type != "matched":
-                continue
-            if filter_type == "unmatched" and user_type != "unmatched":
-                continue
+        """Apply search, filter and sort order to the user list."""
+        if self.store is None:
+            return
+        with PerfMonitor.instance().timer('filter', "user browser") as counts:
+            mask = self.store.filter_mask(self.search_entry.get(), self.filter_var.get())
+            rows = self.store.filter_rows(sort_column=self.sort_column, descending=self.sort_descending, mask=mask)
+            counts['rows'] = len(rows)
             
-            if search_term:
-                user_id = user.get('clerkId') or user.get('id', '')
-                email = ""
-                name = ""
-                
-                if user_type == "matched":
-                    email = user.get('clerkData', {}).get('primary_email_address', '') or user.get('convexProfile', {}).get('email', '')
-                    name = user.get('convexProfile', {}).get('name', '') or f"{user.get('clerkData', {}).get('first_name', '')} {user.get('clerkData', {}).get('last_name', '')}"
-                else:
-                    email = user.get('data', {}).get('primary_email_address', '')
-                    name = f"{user.get('data', {}).get('first_name', '')} {user.get('data', {}).get('last_name', '')}"
-                
-                search_text = f"{user_id} {email} {name}".lower()
-                if search_term not in search_text:
-                    continue
+            # Skip the Tk round trip entirely when nothing visible changed
+            if self.visible_rows is not None and np.array_equal(rows, self.visible_rows):
+                return
+            self.visible_rows = rows
+            self.visible_mask = mask
             
-            if user_type == "matched":
-                user_id = user.get('clerkId', '')
-                email = user.get('clerkData', {}).get('primary_email_address', '') or user.get('convexProfile', {}).get('email', '')
-                name = user.get('convexProfile', {}).get('name', '') or f"{user.get('clerkData', {}).get('first_name', '')} {user.get('clerkData', {}).get('last_name', '')}"
-                points = user.get('totalPointsEarned', 0)
-                self.user_tree.insert("", "end", text=user_id[:45], values=(email[:50], name[:40], f"{points:,.0f}"), tags=(user_type,))
-            else:
-                user_id = user.get('id', '')
-                email = user.get('data', {}).get('primary_email_address', '')
-                name = f"{user.get('data', {}).get('first_name', '')} {user.get('data', {}).get('last_name', '')}"
-                self.user_tree.insert("", "end", text=user_id[:45], values=(email[:50], name[:40], "N/A"), tags=(user_type,))
+            # One set_children call reorders kept rows and detaches filtered-out ones
+            self.user_tree.set_children("", *self.row_iids[rows].tolist())
+    
+    def on_sort(self, column: str):
+        """Sort the user list by a column, toggling direction on repeat clicks."""
+        if self.sort_column == column:
+            self.sort_descending = not self.sort_descending
+        else:
+            self.sort_column = column
+            self.sort_descending = column == "points"
         
-        self.user_tree.tag_configure("matched", foreground=self.theme_colors['SUCCESS'])
-        self.user_tree.tag_configure("unmatched", foreground=self.theme_colors['WARNING'])
+        self.update_sort_headings()
+        self.apply_filters()
+    
+    def update_sort_headings(self):
+        """Mark the sorted column's heading with the sort direction."""
+        for name, heading in self.SORT_HEADINGS.items():
+            if name == self.sort_column:
+                heading = f"{heading} {'▼' if self.sort_descending else '▲'}"
+            self.user_tree.heading(name, text=heading)
     
     def on_search(self, event=None):
         self.apply_filters()
@@ -541,39 +649,64 @@ Mini-Game Records: {stats.get('total_mini_game_records', 0):,}
         if not selection:
             return
         
-        item = selection[0]
-        user_id = self.user_tree.item(item, "text")
-        tags = self.user_tree.item(item, "tags")
-        
-        if tags and len(tags) > 0:
-            user_type = tags[0]
-            if user_type == "matched":
-                for user in self.linked_users:
-                    if user.get('clerkId', '') == user_id:
-                        self.selected_user = user
-                        self.update_detail_view()
-                        break
-            else:
-                for user in self.unmatched_users:
-                    if user.get('id', '') == user_id:
-                        self.selected_user = user
-                        self.update_detail_view()
-                        break
+        # Tree iids are row indexes into the user store
+        rows = [int(item) for item in selection]
+        if len(rows) == 1:
+            try:
+                self.selected_user = self.store.detail(rows[0])
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to read user details: {str(e)}")
+                return
+            self.selected_user_id = self.store.summaries[rows[0]][0]
+            self.update_detail_view()
+        else:
+            self.selected_user = None
+            self.display_selection_summary(rows)
     
-    def update_detail_view(self):
+    def select_user(self, user_id: str) -> bool:
+        """Select and reveal a user in the browser by id or email."""
+        row = self.store.find(user_id) if self.store else None
+        if row is None or self.visible_mask is None or not self.visible_mask[row]:
+            return False
+        self.user_tree.selection_set(str(row))
+        self.user_tree.see(str(row))
+        return True
+    
+    def display_selection_summary(self, rows: List[int]):
+        """Show aggregated details for a multi-row selection."""
         self.detail_text.delete(1.0, tk.END)
+        if self.timeline_host is not None:
+            self.timeline_host.hide()
         
-        for widget in self.detail_charts_frame.winfo_children():
-            widget.destroy()
+        summary = self.store.selection_summary(rows)
+        text = f"""SELECTION SUMMARY - {summary['users']:,} USERS
+{'='*70}
+
+Matched Users: {summary['matched']:,}
+Unmatched Users: {summary['unmatched']:,}
+
+Total Points Earned: {summary['total_points']:,.0f}
+Average Points (matched): {summary['average_points']:,.1f}
+Points History Entries: {summary['history_entries']:,}
+Total Referrals Made: {summary['referrals']:,}
+"""
+        self.detail_text.insert(1.0, text)
+    
+    def update_detail_view(self):
+        self.detail_text.delete(1.0, tk.END)
         
         if not self.selected_user:
             self.detail_text.insert(1.0, "No user selected")
+            if self.timeline_host is not None:
+                self.timeline_host.hide()
             return
         
         if 'clerkId' in self.selected_user:
             self.display_matched_user_details()
         else:
             self.display_unmatched_user_details()
+            if self.timeline_host is not None:
+                self.timeline_host.hide()
     
     def display_matched_user_details(self):
         user = self.selected_user
@@ -640,33 +773,28 @@ USER DATA:
         
         self.detail_text.insert(1.0, text)
     
+    def create_chart_host(self, parent, **kwargs) -> 'ChartHost':
+        """Create a chart host, importing matplotlib on the first chart."""
+        from app.modules.chart_host import ChartHost
+        return ChartHost(parent, self.theme_colors, **kwargs)
+    
+    def get_timeline_host(self) -> 'ChartHost':
+        """Get the persistent points history chart host, creating it on first use."""
+        if self.timeline_host is None:
+            from app.modules.migration_charts import MigrationCharts
+            self.timeline_host = self.create_chart_host(self.detail_charts_frame)
+            self.timeline_host.enable_scroll_zoom(MigrationCharts.timeline_axes(self.timeline_host))
+        return self.timeline_host
+    
     def create_user_charts(self, user):
-        if not user or 'clerkId' not in user:
+        from app.modules.migration_charts import MigrationCharts
+        timeline = MigrationCharts.timeline_points(user)
+        if timeline is None:
+            if self.timeline_host is not None:
+                self.timeline_host.hide()
             return
         
-        points_history = user.get('pointsHistory', [])
-        if points_history:
-            fig = Figure(figsize=(10, 5), dpi=100, facecolor=self.theme_colors['BG_PRIMARY'])
-            ax = fig.add_subplot(111, facecolor=self.theme_colors['BG_PRIMARY'])
-            
-            dates = [entry.get('createdAt', entry.get('_creationTime', 0)) for entry in points_history]
-            points = [entry.get('pointsEarned', 0) for entry in points_history]
-            
-            if dates and dates[0] > 1000000000000:
-                dates = [datetime.datetime.fromtimestamp(d/1000) for d in dates]
-            
-            ax.plot(dates, points, marker='o', linewidth=2.5, color=self.theme_colors['PRIMARY'], markersize=8)
-            ax.set_title('Points History Timeline', fontsize=14, fontweight='bold', color=self.theme_colors['TEXT_PRIMARY'], pad=15)
-            ax.set_xlabel('Date', color=self.theme_colors['TEXT_PRIMARY'], fontsize=11)
-            ax.set_ylabel('Points Earned', color=self.theme_colors['TEXT_PRIMARY'], fontsize=11)
-            ax.grid(True, alpha=0.2, color=self.theme_colors['BORDER'])
-            ax.tick_params(colors=self.theme_colors['TEXT_PRIMARY'])
-            ax.spines['bottom'].set_color(self.theme_colors['BORDER'])
-            ax.spines['top'].set_color(self.theme_colors['BORDER'])
-            ax.spines['right'].set_color(self.theme_colors['BORDER'])
-            ax.spines['left'].set_color(self.theme_colors['BORDER'])
-            fig.autofmt_xdate()
-            
-            canvas = FigureCanvasTkAgg(fig, self.detail_charts_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill="both", expand=True)
+        # Long histories are drawn at screen resolution; zooming restores detail
+        host = self.get_timeline_host()
+        MigrationCharts.draw_timeline(host, *timeline)
+        host.show()
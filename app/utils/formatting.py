@@ -0,0 +1,9 @@
+"""Dependency-free formatting helpers safe to import at startup."""
+
+
+def format_bytes(size: float) -> str:
+    """Human-readable byte size."""
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if abs(size) < 1024 or unit == 'GB':
+            return f"{size:,.0f} {unit}" if unit == 'B' else f"{size:,.1f} {unit}"
+        size /= 1024
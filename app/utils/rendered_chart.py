@@ -0,0 +1,79 @@
+"""RenderedChart component for displaying figures rasterized off the Tk thread."""
+
+from tkinter import ttk
+from typing import Callable, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+    from app.modules.render_service import RenderedImage
+
+
+class RenderedChart(ttk.Label):
+    """A label that shows a chart image produced by the RenderService.
+
+    ``render`` submits a figure builder under this view's key, so asking for
+    a new chart before the previous one finished supersedes it. The label
+    shows a placeholder until the image arrives. Renders given a
+    ``cache_key`` are kept in the ChartCache and shown from it next time.
+    """
+    
+    _next_id = 0
+    
+    def __init__(self, parent, placeholder: str = "Rendering chart...", **kwargs):
+        super().__init__(parent, text=placeholder, anchor='center', **kwargs)
+        RenderedChart._next_id += 1
+        self.key = f"chart-{RenderedChart._next_id}"
+        self.photo = None
+        self.generation = 0
+    
+    def render(self, build: Callable[[], 'Figure'],
+               on_error: Optional[Callable[[Exception], None]] = None,
+               on_ready: Optional[Callable[['RenderedImage'], None]] = None,
+               key: Optional[str] = None,
+               cache_key: Optional[tuple] = None):
+        """Build and rasterize a figure on the render worker, then show it.
+        
+        Views that share a ``key`` coalesce: only the latest request renders.
+        A render cached under ``cache_key`` is shown at once instead, and it
+        supersedes any render still outstanding for the key.
+        """
+        from app.modules.render_service import RenderService
+        from app.modules.chart_cache import ChartCache
+        if key is not None:
+            self.key = key
+        service = RenderService.instance(self)
+        cache = ChartCache.instance()
+        
+        cached = cache.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            service.cancel(self.key)
+            self.show_image(cached)
+            if on_ready:
+                on_ready(cached)
+            return
+        
+        def deliver(result: 'RenderedImage'):
+            if cache_key is not None:
+                cache.put(cache_key, result)
+            self.show_image(result)
+            if on_ready:
+                on_ready(result)
+        
+        self.generation = service.submit(self.key, build, deliver, on_error)
+    
+    def show_image(self, result: 'RenderedImage'):
+        """Display a finished render (keeps the image referenced for Tk)."""
+        if not self.winfo_exists():
+            return
+        # Tk copies the pixels, after which the figure and its buffer can go
+        self.photo = result.to_photo()
+        self.config(image=self.photo, text="")
+    
+    def destroy(self):
+        """Cancel this view's render if it is still outstanding, then destroy."""
+        from app.modules.render_service import RenderService
+        service = RenderService._instance
+        if service is not None and self.photo is None and service.is_current(self.key, self.generation):
+            service.cancel(self.key)
+        self.photo = None
+        super().destroy()
@@ -0,0 +1,272 @@
+"""VirtualTable component for paging through very large DataFrames."""
+
+from tkinter import ttk
+from collections import OrderedDict
+from typing import List, Optional, Tuple, Union, TYPE_CHECKING
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from app.modules.columnar_store import ColumnarStore
+
+
+class VirtualTable(ttk.Frame):
+    """A Treeview that shows a window of a DataFrame instead of every row.
+
+    The tree only holds as many items as fit on screen. Scrolling moves a
+    row offset and rewrites those items from formatted pages: each page is
+    converted to strings column by column and kept in a small LRU cache, so
+    only the rows around the viewport are ever formatted. An optional array
+    of row positions (e.g. search results) selects which rows are shown
+    without copying the frame. Besides a DataFrame, the data may be any
+    source with ``len``, ``columns`` and ``take(positions)``, such as a
+    ColumnarStore.
+    """
+    
+    # Rows formatted per cached page
+    PAGE_ROWS = 200
+    # Formatted pages kept in the LRU cache
+    MAX_PAGES = 64
+    # Characters shown per cell
+    MAX_CHARS = 50
+    # Rows moved per mouse wheel notch
+    WHEEL_ROWS = 3
+    
+    def __init__(self, parent, column_width: int = 120, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.column_width = column_width
+        
+        self.data: Optional[Union[pd.DataFrame, 'ColumnarStore']] = None
+        self.positions: Optional[np.ndarray] = None
+        self.offset = 0
+        self.visible_rows = 1
+        self.selected_position: Optional[int] = None
+        self._pages: "OrderedDict[int, List[tuple]]" = OrderedDict()
+        self._prefetch_job = None
+        
+        self.tree = ttk.Treeview(self, show="headings", selectmode="browse")
+        self.v_scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.on_scrollbar)
+        self.h_scrollbar = ttk.Scrollbar(self, orient="horizontal", command=self.tree.xview)
+        self.tree.configure(xscrollcommand=self.h_scrollbar.set)
+        
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.v_scrollbar.grid(row=0, column=1, sticky="ns")
+        self.h_scrollbar.grid(row=1, column=0, sticky="ew")
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+        
+        self.tree.bind("<Configure>", self.on_resize)
+        self.tree.bind("<MouseWheel>", self.on_mousewheel)
+        self.tree.bind("<Button-4>", lambda e: self.scroll_rows(-self.WHEEL_ROWS))
+        self.tree.bind("<Button-5>", lambda e: self.scroll_rows(self.WHEEL_ROWS))
+        self.tree.bind("<Prior>", lambda e: self.scroll_rows(-self.visible_rows) or "break")
+        self.tree.bind("<Next>", lambda e: self.scroll_rows(self.visible_rows) or "break")
+        self.tree.bind("<Home>", lambda e: self.scroll_to(0) or "break")
+        self.tree.bind("<End>", lambda e: self.scroll_to(self.row_count) or "break")
+        self.tree.bind("<Up>", self.on_arrow)
+        self.tree.bind("<Down>", self.on_arrow)
+        self.tree.bind("<<TreeviewSelect>>", self.on_select)
+    
+    @property
+    def row_count(self) -> int:
+        """Number of rows currently shown (all rows, or the position subset)."""
+        if self.data is None:
+            return 0
+        return len(self.positions) if self.positions is not None else len(self.data)
+    
+    def set_data(self, data: Optional[Union[pd.DataFrame, 'ColumnarStore']]):
+        """Show a new DataFrame from the top."""
+        self.data = data
+        self.positions = None
+        self.selected_position = None
+        self._pages.clear()
+        
+        columns = [] if data is None else [str(col) for col in data.columns]
+        column_ids = ["#"] + [f"c{i}" for i in range(len(columns))]
+        self.tree.configure(columns=column_ids)
+        self.tree.heading("#", text="#")
+        self.tree.column("#", width=80, anchor='e', stretch=False)
+        for column_id, name in zip(column_ids[1:], columns):
+            self.tree.heading(column_id, text=name)
+            self.tree.column(column_id, width=self.column_width, anchor='w')
+        
+        self.scroll_to(0)
+    
+    def set_positions(self, positions: Optional[np.ndarray]):
+        """Show only the given row positions (sorted), or every row for None."""
+        self.positions = None if positions is None else np.asarray(positions, dtype=np.int64)
+        self._pages.clear()
+        self.scroll_to(0)
+    
+    def row_positions(self, start: int, stop: int) -> np.ndarray:
+        """Frame row positions for display rows [start, stop)."""
+        if self.positions is not None:
+            return self.positions[start:stop]
+        return np.arange(start, min(stop, len(self.data)))
+    
+    def format_page(self, page: int) -> List[tuple]:
+        """Format one page of rows to display strings, one column at a time."""
+        start = page * self.PAGE_ROWS
+        rows = self.row_positions(start, start + self.PAGE_ROWS)
+        if self.positions is None and isinstance(self.data, pd.DataFrame):
+            block = self.data.iloc[start:start + len(rows)]
+        else:
+            # Out-of-core stores read just these rows from their memory maps
+            block = self.data.take(rows)
+        
+        columns = [rows.astype(str).tolist()]
+        for i in range(block.shape[1]):
+            series = block.iloc[:, i]
+            text = series.astype(str).str.slice(0, self.MAX_CHARS)
+            columns.append(text.where(series.notna().to_numpy(), "").tolist())
+        return list(zip(*columns))
+    
+    def get_page(self, page: int) -> List[tuple]:
+        """Get a formatted page from the LRU cache, formatting it on a miss."""
+        rows = self._pages.get(page)
+        if rows is None:
+            rows = self.format_page(page)
+            self._pages[page] = rows
+            if len(self._pages) > self.MAX_PAGES:
+                self._pages.popitem(last=False)
+        else:
+            self._pages.move_to_end(page)
+        return rows
+    
+    def get_rows(self, start: int, stop: int) -> List[tuple]:
+        """Formatted rows for display rows [start, stop)."""
+        stop = min(stop, self.row_count)
+        rows = []
+        for page in range(start // self.PAGE_ROWS, (stop - 1) // self.PAGE_ROWS + 1 if stop > start else 0):
+            page_start = page * self.PAGE_ROWS
+            page_rows = self.get_page(page)
+            rows.extend(page_rows[max(start - page_start, 0):stop - page_start])
+        return rows
+    
+    def render(self):
+        """Rewrite the on-screen items for the current offset."""
+        items = self.tree.get_children()
+        if len(items) != self.visible_rows:
+            self.tree.delete(*items)
+            items = [self.tree.insert("", "end", iid=f"r{i}") for i in range(self.visible_rows)]
+        
+        rows = self.get_rows(self.offset, self.offset + self.visible_rows) if self.data is not None else []
+        selected = None
+        for i, item in enumerate(items):
+            if i < len(rows):
+                self.tree.item(item, values=rows[i])
+                if self.selected_position is not None and int(rows[i][0]) == self.selected_position:
+                    selected = item
+            else:
+                self.tree.item(item, values=())
+        
+        # Keep the highlight on the selected data row, not on the screen slot
+        if selected is not None:
+            self.tree.selection_set(selected)
+        elif self.tree.selection():
+            self.tree.selection_remove(*self.tree.selection())
+        
+        total = self.row_count
+        if total:
+            self.v_scrollbar.set(self.offset / total, min((self.offset + self.visible_rows) / total, 1.0))
+        else:
+            self.v_scrollbar.set(0.0, 1.0)
+        self.schedule_prefetch()
+    
+    def schedule_prefetch(self):
+        """Format the pages on either side of the viewport when idle."""
+        if self._prefetch_job is not None:
+            self.after_cancel(self._prefetch_job)
+        self._prefetch_job = self.after_idle(self.prefetch)
+    
+    def prefetch(self):
+        """Warm the cache with the neighbouring pages."""
+        self._prefetch_job = None
+        if self.data is None or not self.row_count:
+            return
+        page = self.offset // self.PAGE_ROWS
+        last_page = (self.row_count - 1) // self.PAGE_ROWS
+        for neighbour in (page + 1, page - 1):
+            if 0 <= neighbour <= last_page and neighbour not in self._pages:
+                self.get_page(neighbour)
+    
+    def scroll_to(self, offset: int):
+        """Move the first visible row, clamped to the data."""
+        max_offset = max(self.row_count - self.visible_rows, 0)
+        self.offset = int(min(max(offset, 0), max_offset))
+        self.render()
+    
+    def scroll_rows(self, delta: int):
+        """Scroll by a number of rows."""
+        self.scroll_to(self.offset + delta)
+    
+    def jump_to_row(self, position: int) -> bool:
+        """Scroll to and select a frame row position; False if it is not shown."""
+        if self.data is None or not 0 <= position < len(self.data):
+            return False
+        if self.positions is None:
+            index = position
+        else:
+            index = int(np.searchsorted(self.positions, position))
+            if index >= len(self.positions) or self.positions[index] != position:
+                return False
+        self.selected_position = position
+        self.scroll_to(index - self.visible_rows // 2)
+        return True
+    
+    def on_scrollbar(self, action: str, value: str, unit: Optional[str] = None):
+        """Handle scrollbar drags and arrow/page clicks."""
+        if action == "moveto":
+            self.scroll_to(round(float(value) * self.row_count))
+        elif action == "scroll":
+            step = self.visible_rows if unit == "pages" else 1
+            self.scroll_rows(int(value) * step)
+    
+    def on_mousewheel(self, event):
+        """Scroll with the mouse wheel (Windows/macOS delta conventions)."""
+        notches = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        self.scroll_rows(-int(notches) * self.WHEEL_ROWS)
+        return "break"
+    
+    def on_arrow(self, event):
+        """Scroll when the keyboard selection moves past the top or bottom item."""
+        items = self.tree.get_children()
+        focus = self.tree.focus()
+        if not items or focus not in items:
+            return None
+        if event.keysym == "Up" and focus == items[0] and self.offset > 0:
+            self.scroll_rows(-1)
+            return "break"
+        if event.keysym == "Down" and focus == items[-1]:
+            self.scroll_rows(1)
+            return "break"
+        return None
+    
+    def on_select(self, event=None):
+        """Remember the selected frame row so it survives scrolling."""
+        selection = self.tree.selection()
+        if selection:
+            values = self.tree.item(selection[0], 'values')
+            if values:
+                self.selected_position = int(values[0])
+    
+    def on_resize(self, event):
+        """Recompute how many rows fit when the tree is resized."""
+        row_height, header = self.row_metrics()
+        visible = max(int((event.height - header) // row_height), 1)
+        if visible != self.visible_rows:
+            self.visible_rows = visible
+            self.scroll_to(self.offset)
+    
+    def row_metrics(self) -> Tuple[int, int]:
+        """Row height and heading height of the tree in pixels."""
+        items = self.tree.get_children()
+        bbox = self.tree.bbox(items[0]) if items else None
+        if bbox:
+            return max(bbox[3], 1), bbox[1]
+        row_height = ttk.Style().lookup('Treeview', 'rowheight')
+        return int(row_height) if row_height else 20, 25
+    
+    def selected_row(self) -> Optional[int]:
+        """Frame row position of the selected row, if any."""
+        return self.selected_position
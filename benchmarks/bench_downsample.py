@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Downsampling Benchmark
+Measures line chart render time against point count, with and without
+screen-resolution downsampling.
+
+Usage: python benchmarks/bench_downsample.py [max_points]
+"""
+
+import io
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.modules.downsample import Downsampler
+
+
+def render_line(x: np.ndarray, y: np.ndarray, marker=None) -> float:
+    """Render one line chart to PNG and return the elapsed seconds."""
+    start = time.perf_counter()
+    fig = Figure(figsize=(10, 5), dpi=100)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    ax.plot(x, y, marker=marker, linewidth=2.5)
+    fig.savefig(io.BytesIO(), format='png')
+    return time.perf_counter() - start
+
+
+def main():
+    """Main entry point."""
+    max_points = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    pixel_width = 10 * 100
+    rng = np.random.default_rng(42)
+    
+    print(f"{'points':>10} {'raw (ms)':>10} {'minmax (ms)':>12} {'lttb (ms)':>10} {'kept':>7} {'extremes':>9}")
+    n = 1_000
+    while n <= max_points:
+        x = np.arange(n, dtype=np.float64)
+        y = np.cumsum(rng.standard_normal(n))
+        # Plant spikes that a naive stride would miss
+        y[n // 3] += 500
+        y[2 * n // 3] -= 500
+        
+        raw = render_line(x, y, marker='o')
+        
+        start = time.perf_counter()
+        minmax = Downsampler.line_indices(x, y, pixel_width)
+        minmax_elapsed = (time.perf_counter() - start) + render_line(x[minmax], y[minmax]) if minmax is not None else raw
+        
+        start = time.perf_counter()
+        lttb = Downsampler.line_indices(x, y, pixel_width, method="lttb")
+        lttb_elapsed = (time.perf_counter() - start) + render_line(x[lttb], y[lttb]) if lttb is not None else raw
+        
+        kept = len(minmax) if minmax is not None else n
+        extremes = minmax is None or (y.argmax() in minmax and y.argmin() in minmax)
+        print(f"{n:>10,} {raw * 1000:>10.1f} {minmax_elapsed * 1000:>12.1f} {lttb_elapsed * 1000:>10.1f} {kept:>7,} {str(extremes):>9}")
+        n *= 10
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Interactive Chart Benchmark
+Measures exported HTML size and build time of plotly scatter plots and
+histograms against row count, raw versus ChartEngine's aggregating renderers.
+
+Usage: python benchmarks/bench_plotly.py [max_rows]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.modules.chart_engine import ChartEngine
+
+
+def export(build) -> tuple:
+    """Build a figure and export it to HTML (plotly.js excluded); return (seconds, bytes)."""
+    start = time.perf_counter()
+    html = build().to_html(include_plotlyjs=False, full_html=False)
+    return time.perf_counter() - start, len(html.encode('utf-8'))
+
+
+def raw_scatter(data: pd.DataFrame) -> go.Figure:
+    """The unaggregated scatter: every point as an SVG marker."""
+    return go.Figure(go.Scatter(x=data['x'], y=data['y'], mode='markers'))
+
+
+def raw_histogram(data: pd.DataFrame) -> go.Figure:
+    """The unaggregated histogram: every value binned in the browser."""
+    return go.Figure(go.Histogram(x=data['x'], nbinsx=30))
+
+
+def main():
+    """Main entry point."""
+    max_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    rng = np.random.default_rng(42)
+    
+    print(f"{'rows':>10} {'chart':>10} {'raw (ms)':>10} {'raw size':>12} {'engine (ms)':>12} {'engine size':>12} {'renderer':>10}")
+    n = 1_000
+    while n <= max_rows:
+        data = pd.DataFrame({'x': rng.standard_normal(n), 'y': rng.standard_normal(n)})
+        
+        scatter = ChartEngine.create_scatter_plot_plotly(data, 'x', 'y')
+        histogram = ChartEngine.create_histogram_plotly(data['x'])
+        cases = [
+            ('scatter', raw_scatter, lambda: ChartEngine.create_scatter_plot_plotly(data, 'x', 'y'), scatter.data[0].type),
+            ('histogram', raw_histogram, lambda: ChartEngine.create_histogram_plotly(data['x']), histogram.data[0].type),
+        ]
+        for name, raw, engine, renderer in cases:
+            raw_elapsed, raw_size = export(lambda: raw(data))
+            engine_elapsed, engine_size = export(engine)
+            print(f"{n:>10,} {name:>10} {raw_elapsed * 1000:>10.1f} {raw_size:>12,} {engine_elapsed * 1000:>12.1f} {engine_size:>12,} {renderer:>10}")
+        n *= 10
+
+
+if __name__ == "__main__":
+    main()
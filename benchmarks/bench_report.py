@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Headless Report Benchmark
+Measures the time to render per-user points timelines for the headless
+report: a fresh figure per user against the report's reused figure, then
+the full report for N synthetic users across the process pool.
+
+Usage: python benchmarks/bench_report.py [users] [workers]
+"""
+
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.modules.chart_host import ChartHost
+from app.modules.migration_charts import MigrationCharts
+from app.modules.report_generator import ReportGenerator
+from app.modules.theme import Theme
+
+
+def synthetic_users(count: int, rng: np.random.Generator):
+    """Matched user records with 1-400 points history entries each."""
+    start = 1_735_689_600_000  # 2025-01-01 in epoch milliseconds
+    for i in range(count):
+        entries = int(rng.integers(1, 400))
+        created = np.sort(start + rng.integers(0, 365 * 86_400_000, entries))
+        earned = rng.integers(1, 500, entries)
+        yield {
+            'clerkId': f"user_{i:06d}",
+            'convexId': f"convex_{i:06d}",
+            'clerkData': {'primary_email_address': f"user{i}@example.com", 'first_name': "User", 'last_name': str(i)},
+            'convexProfile': {'name': f"User {i}", 'country': str(rng.choice(['US', 'GB', 'DE', 'IN'])), 'affiliateLevel': int(rng.integers(0, 4))},
+            'totalPointsEarned': int(earned.sum()),
+            'pointsHistory': [{'createdAt': int(c), 'pointsEarned': int(e), 'pointsType': 'signup'} for c, e in zip(created, earned)],
+        }
+
+
+def fresh_figure_ms(jobs, directory: Path, theme_colors: dict) -> float:
+    """Mean milliseconds per timeline when every user gets a new figure."""
+    started = time.perf_counter()
+    for _, name, (label, dates, points) in jobs:
+        host = ChartHost(None, theme_colors)
+        MigrationCharts.draw_timeline(host, dates, points)
+        ReportGenerator.save_figure(host.figure, directory, name, ('png',))
+    return (time.perf_counter() - started) / len(jobs) * 1000
+
+
+def main():
+    """Main entry point."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    rng = np.random.default_rng(42)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp) / "data"
+        data_dir.mkdir()
+        with open(data_dir / "linked_users.jsonl", 'w', encoding='utf-8') as f:
+            for user in synthetic_users(count, rng):
+                f.write(json.dumps(user) + "\n")
+        
+        generator = ReportGenerator(data_dir, Path(tmp) / "report", formats=('png',), workers=workers)
+        generator.load()
+        
+        # Per-timeline cost on one process, on a sample of users
+        _, sample = generator.build_jobs(generator.select_users(top=min(count, 200)))
+        baseline_dir = Path(tmp) / "baseline"
+        baseline_dir.mkdir()
+        theme_colors = Theme.get_light_theme()
+        fresh = fresh_figure_ms(sample, baseline_dir, theme_colors)
+        ReportGenerator.init_worker(str(baseline_dir), ('png',), theme_colors)
+        started = time.perf_counter()
+        for job in sample:
+            ReportGenerator.render_job(job)
+        reused = (time.perf_counter() - started) / len(sample) * 1000
+        print(f"{'timeline (ms)':>16} {'fresh figure':>14} {'reused figure':>14}")
+        print(f"{len(sample):>16,} {fresh:>14.1f} {reused:>14.1f}")
+        
+        summary = generator.run(top=None)
+        print(f"\n{summary['timelines']:,} timelines on {summary['workers']} workers: "
+              f"{summary['timeline_seconds']:.1f}s ({summary['timelines_per_second']:,.0f}/s); "
+              f"total report {summary['total_seconds']:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark
+Measures application import time with ``python -X importtime`` and the
+time from process launch to the first painted window and the first
+usable tab.
+
+Usage: python benchmarks/bench_startup.py [runs]
+"""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+# Child process: build the main window, report when it is mapped and when the
+# initially selected tab has been constructed, then exit
+PAINT_SCRIPT = """
+import sys, time
+import tkinter as tk
+from app.main_window import MainWindow
+root = tk.Tk()
+marks = {}
+root.bind('<Map>', lambda event: marks.setdefault('paint', time.time()), add='+')
+app = MainWindow(root)
+while 'paint' not in marks or not app.tabs:
+    root.update()
+print(marks['paint'], time.time())
+root.destroy()
+"""
+
+
+def import_profile(module: str = "app.main_window", top: int = 8):
+    """Return the cumulative import time of a module and its heaviest imports (µs)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        timings.append((int(cumulative), name.rstrip()))
+    total = next(cumulative for cumulative, name in timings if name.strip() == module)
+    heaviest = sorted(timings, reverse=True)[1:top + 1]
+    return total, heaviest
+
+
+def time_to_first_paint():
+    """Return (first paint, first tab ready) seconds after launch, or None without a display."""
+    start = time.time()
+    result = subprocess.run(
+        [sys.executable, "-c", PAINT_SCRIPT],
+        cwd=ROOT, capture_output=True, text=True, env={**os.environ, "PYTHONPATH": str(ROOT)}
+    )
+    if result.returncode != 0:
+        return None
+    painted, ready = (float(value) for value in result.stdout.split())
+    return painted - start, ready - start
+
+
+def main():
+    """Main entry point."""
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    
+    totals = [import_profile()[0] for _ in range(runs)]
+    _, heaviest = import_profile()
+    print(f"import app.main_window: {min(totals) / 1000:.1f} ms (best of {runs})")
+    print("heaviest imports:")
+    for cumulative, name in heaviest:
+        print(f"  {cumulative / 1000:>8.1f} ms {name}")
+    
+    paints = [time_to_first_paint() for _ in range(runs)]
+    paints = [paint for paint in paints if paint is not None]
+    if not paints:
+        print("time to first paint: skipped (no display available)")
+        return
+    print(f"time to first paint: {min(paint for paint, _ in paints) * 1000:.1f} ms (best of {runs})")
+    print(f"time to first tab:   {min(ready for _, ready in paints) * 1000:.1f} ms (best of {runs})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+User Store Benchmark
+Measures the UserStore against the previous per-view approach (every record
+parsed into a list, then scanned per keystroke) on N synthetic users:
+load time and throughput, retained memory, search as a term is typed,
+id/email lookup and on-demand detail fetches.
+
+Usage: python benchmarks/bench_user_store.py [users]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.modules.file_loader import FileLoader
+from app.modules.population_stats import PopulationStats
+from app.modules.user_store import UserStore
+
+
+def write_users(directory: Path, count: int, rng: np.random.Generator):
+    """Write linked and unmatched JSONL files (about 5% unmatched)."""
+    start = 1_735_689_600_000  # 2025-01-01 in epoch milliseconds
+    unmatched = count // 20
+    with open(directory / "linked_users.jsonl", 'w', encoding='utf-8') as f:
+        for i in range(count - unmatched):
+            entries = int(rng.integers(1, 40))
+            created = np.sort(start + rng.integers(0, 365 * 86_400_000, entries))
+            earned = rng.integers(1, 500, entries)
+            f.write(json.dumps({
+                'clerkId': f"user_{i:07d}",
+                'convexId': f"convex_{i:07d}",
+                'clerkData': {'primary_email_address': f"user{i}@example.com", 'first_name': "User", 'last_name': str(i)},
+                'convexProfile': {'name': f"User {i}", 'country': str(rng.choice(['US', 'GB', 'DE', 'IN'])), 'affiliateLevel': int(rng.integers(0, 4))},
+                'totalPointsEarned': int(earned.sum()),
+                'totalReferralsMade': int(rng.integers(0, 5)),
+                'pointsHistory': [{'createdAt': int(c), 'pointsEarned': int(e), 'pointsType': 'signup'} for c, e in zip(created, earned)],
+            }) + "\n")
+    with open(directory / "unmatched_users.jsonl", 'w', encoding='utf-8') as f:
+        for i in range(unmatched):
+            f.write(json.dumps({
+                'source': 'clerk', 'id': f"orphan_{i:07d}", 'reason': 'no convex profile',
+                'data': {'primary_email_address': f"orphan{i}@example.org", 'first_name': "Orphan", 'last_name': str(i)},
+            }) + "\n")
+
+
+def legacy_load(paths):
+    """Every record kept in lists, summaries and search text built alongside."""
+    linked = FileLoader.load_jsonl(paths[0])
+    unmatched = FileLoader.load_jsonl(paths[1])
+    rows = [("matched", user) for user in linked] + [("unmatched", user) for user in unmatched]
+    search_text = [" ".join(UserStore.summarize_user(user_type, user)[:3]).lower() for user_type, user in rows]
+    return rows, search_text, PopulationStats.from_users(linked)
+
+
+def timed(fn, repeat: int = 1):
+    """(result, mean seconds)."""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return result, (time.perf_counter() - started) / repeat
+
+
+def retained_mb(fn) -> float:
+    """Megabytes still allocated after fn's result is built."""
+    tracemalloc.start()
+    result = fn()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current / 1e6
+
+
+def main():
+    """Main entry point."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = np.random.default_rng(42)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        write_users(directory, count, rng)
+        paths = (str(directory / "linked_users.jsonl"), str(directory / "unmatched_users.jsonl"), "")
+        size_mb = sum(os.path.getsize(path) for path in paths[:2]) / 1e6
+        print(f"{count:,} users, {size_mb:.1f} MB of JSONL\n")
+        
+        # Load
+        (rows, search_text, _), legacy_s = timed(lambda: legacy_load(paths))
+        store, store_s = timed(lambda: UserStore.load(*paths))
+        legacy_mem = retained_mb(lambda: legacy_load(paths))
+        store_mem = retained_mb(lambda: UserStore.load(*paths))
+        print(f"{'load':<24} {'seconds':>8} {'MB/s':>8} {'rows/s':>10} {'retained MB':>12}")
+        for name, seconds, memory in (("record lists", legacy_s, legacy_mem), ("UserStore", store_s, store_mem)):
+            print(f"{name:<24} {seconds:>8.2f} {size_mb / seconds:>8.1f} {count / seconds:>10,.0f} {memory:>12.1f}")
+        
+        # Search while typing, one keystroke at a time
+        term = f"user{count // 3}@exa"
+        prefixes = [term[:i] for i in range(1, len(term) + 1)]
+        
+        def linear():
+            for prefix in prefixes:
+                [row for row, text in enumerate(search_text) if prefix in text]
+        
+        def vectorized():
+            for prefix in prefixes:
+                store._last_search = ("", None)
+                store.filter_rows(prefix)
+        
+        def incremental():
+            store._last_search = ("", None)
+            for prefix in prefixes:
+                store.filter_rows(prefix)
+        
+        print(f"\n{'typing ' + repr(term):<24} {'ms/key':>8}")
+        for name, fn in (("linear scan", linear), ("vectorized", vectorized), ("incremental", incremental)):
+            _, seconds = timed(fn, repeat=3)
+            print(f"{name:<24} {seconds / len(prefixes) * 1000:>8.2f}")
+        
+        # Sorted, filtered view (first call builds the cached permutation)
+        _, first = timed(lambda: store.filter_rows("", "matched", "points", True))
+        _, cached = timed(lambda: store.filter_rows("", "matched", "points", True), repeat=10)
+        print(f"\n{'sort by points':<24} {first * 1000:>8.2f} ms first, {cached * 1000:.2f} ms cached")
+        
+        # Lookup by id and email
+        keys = [f"user_{i:07d}" for i in rng.integers(0, count - count // 20, 100)]
+        emails = [f"USER{i}@example.com" for i in rng.integers(0, count - count // 20, 100)]
+        _, scan = timed(lambda: [next(row for row, (_, user) in enumerate(rows) if user.get('clerkId') == key) for key in keys])
+        _, indexed = timed(lambda: [store.find(key) for key in keys + emails])
+        print(f"{'lookup (linear scan)':<24} {scan / len(keys) * 1e6:>8.1f} us")
+        print(f"{'lookup (id/email index)':<24} {indexed / (len(keys) + len(emails)) * 1e6:>8.1f} us")
+        
+        # Details read from the file on demand
+        sample = rng.integers(0, len(store), 200)
+        _, cold = timed(lambda: [store.detail(int(row)) for row in sample])
+        _, warm = timed(lambda: [store.detail(int(row)) for row in sample[-UserStore.DETAIL_CACHE:]])
+        print(f"{'detail (from file)':<24} {cold / len(sample) * 1e6:>8.1f} us")
+        print(f"{'detail (cached)':<24} {warm / UserStore.DETAIL_CACHE * 1e6:>8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Headless Migration Report
+Renders the Migration Tool charts (sync statistics, population dashboard and
+per-user points timelines) to PNG/SVG/HTML without a display and writes a
+static report with index.html and report.json timings.
+
+Usage: python generate_report.py [--run-comparer] [--top N | --all-users | --users ID ...]
+"""
+
+import argparse
+import multiprocessing
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.modules.report_generator import ReportGenerator, RENDER_FORMATS
+
+
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Render the Migration Tool charts to a static report.")
+    parser.add_argument("--data-dir", default="output", help="Directory with linked_users.jsonl, unmatched_users.jsonl and sync_report.json")
+    parser.add_argument("--report-dir", default="report", help="Directory the report is written to")
+    parser.add_argument("--run-comparer", action="store_true", help="Run compare_users.py first to regenerate the data directory")
+    parser.add_argument("--formats", default="png", help=f"Comma-separated chart formats ({', '.join(RENDER_FORMATS)})")
+    parser.add_argument("--theme", choices=("light", "dark"), default="light")
+    parser.add_argument("--workers", type=int, default=None, help="Render processes (default: CPU count, at most 8)")
+    selection = parser.add_mutually_exclusive_group()
+    selection.add_argument("--top", type=int, default=50, help="Timelines for the N users with the most points (default 50)")
+    selection.add_argument("--all-users", action="store_true", help="Timelines for every matched user with points history")
+    selection.add_argument("--users", nargs="+", metavar="ID", help="Timelines for these Clerk ids or emails")
+    return parser.parse_args()
+
+
+def run_comparer(data_dir: str):
+    """Regenerate the data directory from the default Clerk CSV and Convex snapshot."""
+    from compare_users import UserDataComparer
+    
+    script_dir = Path(__file__).parent
+    clerk_csv = script_dir / "ins_2zQQjKKXdf536Mz8OXAmkRUqmUa (1).csv"
+    convex_snapshot = script_dir / "snapshot_agreeable-frog-992_1767312048617181600"
+    for path in (clerk_csv, convex_snapshot):
+        if not path.exists():
+            print(f"Error: comparer input not found: {path}")
+            sys.exit(1)
+    UserDataComparer(str(clerk_csv), str(convex_snapshot), output_dir=data_dir).run()
+
+
+def main():
+    """Main entry point."""
+    args = parse_args()
+    if args.run_comparer:
+        run_comparer(args.data_dir)
+    
+    try:
+        generator = ReportGenerator(
+            data_dir=args.data_dir,
+            report_dir=args.report_dir,
+            formats=[fmt.strip() for fmt in args.formats.split(",") if fmt.strip()],
+            theme=args.theme,
+            workers=args.workers
+        )
+        generator.load()
+    except (ValueError, FileNotFoundError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    
+    def progress(done: int, total: int):
+        if done == total or done % 500 == 0:
+            print(f"  {done:,}/{total:,} timelines", flush=True)
+    
+    print(f"Rendering report from {args.data_dir}/ with {generator.workers} workers...")
+    summary = generator.run(
+        user_ids=args.users,
+        top=None if args.all_users or args.users else args.top,
+        progress=progress
+    )
+    
+    print("\n" + "=" * 60)
+    print(f"Charts: {summary['charts']} in {summary['chart_seconds']:.2f}s")
+    print(f"Timelines: {summary['timelines']:,} in {summary['timeline_seconds']:.2f}s"
+          + (f" ({summary['timelines_per_second']:,.0f}/s, {summary['mean_timeline_ms']:.1f} ms each per worker)" if summary['timelines'] else ""))
+    print(f"Total: {summary['total_seconds']:.2f}s")
+    print(f"Report written to {Path(args.report_dir) / 'index.html'}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    # Frozen builds must not rerun the report in render worker processes
+    multiprocessing.freeze_support()
+    main()
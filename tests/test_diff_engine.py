@@ -0,0 +1,26 @@
+"""Tests for DiffEngine key matching."""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.modules.diff_engine import DiffEngine
+
+
+def write_jsonl(path: Path, records):
+    path.write_text("".join(json.dumps(record) + "\n" for record in records), encoding='utf-8')
+
+
+def test_duplicate_keys_compare_first_record_on_both_sides(tmp_path):
+    write_jsonl(tmp_path / "old.jsonl", [{'id': 1, 'v': 'a'}, {'id': 1, 'v': 'b'}, {'id': 2, 'v': 1}])
+    write_jsonl(tmp_path / "new.jsonl", [{'id': 1, 'v': 'a'}, {'id': 1, 'v': 'b'}, {'id': 2, 'v': 2}, {'id': 2, 'v': 3}])
+
+    result = DiffEngine.diff(tmp_path / "old.jsonl", tmp_path / "new.jsonl", workers=1)
+
+    assert result['duplicates'] == [('1', 'old'), ('1', 'new'), ('2', 'new')]
+    assert result['summary']['duplicates'] == 2
+    assert result['summary']['unchanged'] == 1
+    assert result['modified'] == [('2', [('v', 1, 2)])]
+    assert result['added'] == [] and result['removed'] == []
@@ -0,0 +1,40 @@
+"""Tests for DatasetProfiler top values and row sampling."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.modules.data_processor import DataProcessor
+from app.modules.profiler import DatasetProfiler
+
+
+def categorical_frame() -> pd.DataFrame:
+    values = pd.Categorical(['a', 'b', 'a', None], categories=list('abcdefghijklmnop'))
+    return pd.DataFrame({'letter': values})
+
+
+def test_top_values_skip_unused_categories():
+    profile = DatasetProfiler.profile(categorical_frame())
+    assert profile['columns']['letter']['top'] == [('a', 2, 0), ('b', 1, 0)]
+
+
+def test_dataframe_info_counts_only_present_categories():
+    info = DataProcessor.get_dataframe_info(categorical_frame())
+    assert info['categorical_counts']['letter'] == {'a': 2, 'b': 1}
+
+
+def test_sample_positions_are_sorted_distinct_and_in_range():
+    for total_rows, sample_rows in [(10, 10), (1_500, 1_000), (100_000, 1_000)]:
+        positions = DatasetProfiler.sample_positions(total_rows, sample_rows)
+        assert len(positions) == sample_rows
+        assert np.all(np.diff(positions) > 0)
+        assert positions[0] >= 0 and positions[-1] < total_rows
+
+
+def test_sample_positions_are_reproducible():
+    first = DatasetProfiler.sample_positions(100_000, 1_000, seed=3)
+    assert np.array_equal(first, DatasetProfiler.sample_positions(100_000, 1_000, seed=3))
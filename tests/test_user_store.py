@@ -0,0 +1,205 @@
+"""Tests for UserStore loading, indexes, filtering and on-demand details."""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.modules.columnar_store import ColumnarStore
+from app.modules.user_store import UserStore
+
+
+MATCHED = [
+    {
+        'clerkId': "user_a",
+        'clerkData': {'primary_email_address': "Alice@Example.com", 'first_name': "Alice", 'last_name': "Smith"},
+        'convexProfile': {'name': "Alice Smith"},
+        'totalPointsEarned': 300,
+        'totalReferralsMade': 2,
+        'pointsHistory': [{'createdAt': 1_735_689_600_000, 'pointsEarned': 300, 'pointsType': 'signup'}],
+    },
+    {
+        'clerkId': "user_b",
+        'clerkData': {'primary_email_address': "bob@example.com", 'first_name': "Bob", 'last_name': "Jones"},
+        'convexProfile': {'name': "Bob Jones"},
+        'totalPointsEarned': 100,
+        'totalReferralsMade': 0,
+        'pointsHistory': [],
+    },
+    {
+        'clerkId': "user_c",
+        'clerkData': {'primary_email_address': "carol@example.com", 'first_name': "Carol", 'last_name': "Alison"},
+        'convexProfile': {'name': "Carol Alison"},
+        'totalPointsEarned': 200,
+        'totalReferralsMade': 1,
+        'pointsHistory': [],
+    },
+]
+
+UNMATCHED = [
+    {'source': 'clerk', 'id': "orphan_1", 'data': {'primary_email_address': "dave@example.com", 'first_name': "Dave", 'last_name': "Alder"}},
+    {'source': 'clerk', 'id': "orphan_2", 'data': {'primary_email_address': "erin@example.com", 'first_name': "Erin", 'last_name': "Stone"}},
+]
+
+
+def write_jsonl(path: Path, records):
+    """Write records one per line, with a blank line in the middle."""
+    with open(path, 'w', encoding='utf-8') as f:
+        for index, record in enumerate(records):
+            f.write(json.dumps(record) + "\n")
+            if index == 0:
+                f.write("\n")
+
+
+@pytest.fixture
+def paths(tmp_path):
+    linked = tmp_path / "linked_users.jsonl"
+    unmatched = tmp_path / "unmatched_users.jsonl"
+    write_jsonl(linked, MATCHED)
+    write_jsonl(unmatched, UNMATCHED)
+    return str(linked), str(unmatched)
+
+
+@pytest.fixture
+def store(paths):
+    return UserStore.load(*paths)
+
+
+def test_iter_load_counts_rows_and_builds_columns(paths):
+    events = list(UserStore.iter_load(*paths))
+    kind, store, _ = events[-1]
+    assert kind == 'complete'
+    assert all(event[0] == 'progress' for event in events[:-1])
+    assert events[-2][1] == len(MATCHED) + len(UNMATCHED)
+    assert events[-2][2] == sum(os.path.getsize(path) for path in paths)
+
+    assert len(store) == 5
+    assert store.matched_count == 3
+    assert store.unmatched_count == 2
+    assert store.records is None
+    assert set(store.columns) == {'id', 'email', 'name', 'points', 'search', 'history_entries', 'referrals'}
+    assert list(store.columns['id']) == ["user_a", "user_b", "user_c", "orphan_1", "orphan_2"]
+    assert store.columns['email'][0] == "alice@example.com"
+    assert list(store.columns['history_entries']) == [1, 0, 0, 0, 0]
+    assert list(store.columns['referrals']) == [2, 0, 1, 0, 0]
+    assert list(store.matched) == [True, True, True, False, False]
+
+
+def test_iter_load_treats_missing_paths_as_empty(paths):
+    store = UserStore.load(paths[0], "")
+    assert len(store) == 3
+    assert store.unmatched_count == 0
+
+
+def test_find_by_id_and_email(store):
+    assert store.find("user_b") == 1
+    assert store.find("orphan_2") == 4
+    assert store.find("ALICE@example.COM") == 0
+    assert store.find("dave@example.com") == 3
+    assert store.find("nobody@example.com") is None
+    assert store.find("") is None
+
+
+def test_filter_mask_combines_search_and_type(store):
+    assert list(np.flatnonzero(store.filter_mask())) == [0, 1, 2, 3, 4]
+    assert list(np.flatnonzero(store.filter_mask(filter_type="matched"))) == [0, 1, 2]
+    assert list(np.flatnonzero(store.filter_mask(filter_type="unmatched"))) == [3, 4]
+    assert list(np.flatnonzero(store.filter_mask("ali"))) == [0, 2]
+    assert list(np.flatnonzero(store.filter_mask("AL", "unmatched"))) == [3]
+
+
+def test_filter_rows_sorts_both_directions(store):
+    assert list(store.filter_rows()) == [0, 1, 2, 3, 4]
+    assert list(store.filter_rows(sort_column="email")) == [0, 1, 2, 3, 4]
+    assert list(store.filter_rows(sort_column="email", descending=True)) == [4, 3, 2, 1, 0]
+    assert list(store.filter_rows("example", "matched", "points")) == [1, 2, 0]
+    assert list(store.filter_rows("example", "matched", "points", descending=True)) == [0, 2, 1]
+
+
+def test_filter_rows_keeps_unmatched_users_last_by_points(store):
+    assert list(store.filter_rows(sort_column="points")) == [1, 2, 0, 3, 4]
+    assert list(store.filter_rows(sort_column="points", descending=True)) == [0, 2, 1, 3, 4]
+
+
+def test_longer_search_term_rechecks_only_previous_hits(store):
+    assert list(store.filter_rows("al")) == [0, 2, 3]
+    assert store._last_search[0] == "al"
+    assert list(store._last_search[1]) == [0, 2, 3]
+
+    assert list(store.filter_rows("ali")) == [0, 2]
+    assert store._last_search[0] == "ali"
+    assert list(store._last_search[1]) == [0, 2]
+
+    # A term that does not extend the last one scans every row again
+    assert list(store.filter_rows("bob")) == [1]
+    assert list(store.filter_rows("")) == [0, 1, 2, 3, 4]
+
+
+def test_detail_rereads_records_by_offset(store):
+    assert store.detail(0) == MATCHED[0]
+    assert store.detail(2) == MATCHED[2]
+    assert store.detail(4) == UNMATCHED[1]
+    assert dict(store.iter_details()) == dict(enumerate(MATCHED + UNMATCHED))
+
+
+def test_detail_uses_kept_records(paths):
+    store = UserStore.load(*paths, keep_records=True)
+    assert store.records is not None
+    assert store.detail(3) == UNMATCHED[0]
+
+
+def test_detail_rejects_file_changed_since_load(store, paths):
+    with open(paths[1], 'a', encoding='utf-8') as f:
+        f.write(json.dumps({'id': "orphan_3", 'data': {}}) + "\n")
+    with pytest.raises(Exception, match="changed on disk"):
+        store.detail(3)
+
+
+def test_detail_rejects_file_touched_since_load(store, paths):
+    stat = os.stat(paths[0])
+    os.utime(paths[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    with pytest.raises(Exception, match="changed on disk"):
+        store.detail(1)
+
+
+@pytest.fixture
+def cache_root(tmp_path, monkeypatch):
+    root = tmp_path / "stores"
+    monkeypatch.setattr(ColumnarStore, 'cache_root', staticmethod(lambda: root))
+    return root
+
+
+def test_save_cache_reopens_without_parsing(store, paths, cache_root, monkeypatch):
+    assert UserStore.open_cache(*paths) is None
+    directory = store.save_cache()
+    assert directory.parent == cache_root
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cached load parsed the JSONL files")
+    monkeypatch.setattr(UserStore, 'iter_lines', staticmethod(fail))
+    cached = UserStore.load(*paths, use_cache=True)
+
+    assert cached.summaries == store.summaries
+    assert cached.matched_count == store.matched_count
+    assert np.array_equal(cached.offsets, store.offsets)
+    assert np.array_equal(cached.sources, store.sources)
+    assert cached.find("bob@example.com") == 1
+    assert list(cached.filter_rows(sort_column="points", descending=True)) == [0, 2, 1, 3, 4]
+    assert cached.selection_summary(np.arange(5)) == store.selection_summary(np.arange(5))
+    assert cached.population_stats['total_users'] == store.population_stats['total_users']
+    assert list(cached.population_stats['top_referrers'].index) == list(store.population_stats['top_referrers'].index)
+    assert cached.detail(4) == UNMATCHED[1]
+
+
+def test_cache_is_ignored_after_file_changes(store, paths, cache_root):
+    store.save_cache()
+    with open(paths[0], 'a', encoding='utf-8') as f:
+        f.write(json.dumps({'clerkId': "user_d", 'totalPointsEarned': 5}) + "\n")
+
+    assert UserStore.open_cache(*paths) is None
+    assert len(UserStore.load(*paths, use_cache=True)) == 6
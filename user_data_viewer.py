@@ -4,16 +4,19 @@ User Data Viewer GUI Application
 Visualizes user migration data with charts, browsing, and detailed views.
 """
 
+import sys
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import json
-import os
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Any, Optional
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
-import pandas as pd
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.modules.user_store import UserStore
 
 
 class ScrollableFrame(ttk.Frame):
@@ -67,10 +70,10 @@ class UserDataViewer:
         self.root.title("User Data Viewer - Migration Tool")
         self.root.geometry("1400x900")
         
-        # Data storage
-        self.linked_users: List[Dict[str, Any]] = []
-        self.unmatched_users: List[Dict[str, Any]] = []
-        self.sync_report: Optional[Dict[str, Any]] = None
+        # Data storage (tree iids are row indexes into the store)
+        self.store: Optional[UserStore] = None
+        self.load_task = None
+        self.row_iids: np.ndarray = np.empty(0, dtype=object)
         
         # File paths
         self.linked_users_path = ""
@@ -287,48 +290,37 @@ class UserDataViewer:
                 self.sync_report_path = str(report_file)
     
     def load_data(self):
-        """Load data from selected files."""
-        try:
-            # Load linked users
-            self.linked_users = []
-            if self.linked_users_path and os.path.exists(self.linked_users_path):
-                with open(self.linked_users_path, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line:
-                            self.linked_users.append(json.loads(line))
-            
-            # Load unmatched users
-            self.unmatched_users = []
-            if self.unmatched_users_path and os.path.exists(self.unmatched_users_path):
-                with open(self.unmatched_users_path, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line:
-                            self.unmatched_users.append(json.loads(line))
-            
-            # Load sync report
-            self.sync_report = None
-            if self.sync_report_path and os.path.exists(self.sync_report_path):
-                with open(self.sync_report_path, 'r', encoding='utf-8') as f:
-                    self.sync_report = json.load(f)
-            
-            # Update UI
-            self.update_stats_panel()
-            self.update_user_browser()
-            self.status_label.config(text=f"Loaded: {len(self.linked_users)} linked, {len(self.unmatched_users)} unmatched", foreground="green")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load data: {str(e)}")
-            self.status_label.config(text="Error loading data", foreground="red")
+        """Load data from selected files on a worker thread."""
+        if self.load_task is not None:
+            self.load_task.cancel()
+        self.status_label.config(text="Loading...", foreground="gray")
+        self.load_task = UserStore.load_async(
+            self.root,
+            self.linked_users_path,
+            self.unmatched_users_path,
+            self.sync_report_path,
+            on_done=self.on_store_loaded,
+            on_error=self.on_load_failed
+        )
+    
+    def on_store_loaded(self, store: UserStore):
+        """Show a freshly loaded store."""
+        self.store = store
+        self.update_stats_panel()
+        self.update_user_browser()
+        self.status_label.config(text=f"Loaded: {store.matched_count} linked, {store.unmatched_count} unmatched", foreground="green")
+    
+    def on_load_failed(self, error: Exception):
+        messagebox.showerror("Error", f"Failed to load data: {str(error)}")
+        self.status_label.config(text="Error loading data", foreground="red")
     
     def update_stats_panel(self):
         """Update statistics panel with data."""
         # Clear previous content
         self.stats_text.delete(1.0, tk.END)
         
-        if self.sync_report:
-            stats = self.sync_report
+        stats = self.store.sync_report if self.store else None
+        if stats:
             text = f"""SYNC REPORT SUMMARY
 {'='*50}
 
@@ -350,16 +342,11 @@ Mini-Game Records: {stats.get('total_mini_game_records', 0)}
             widget.destroy()
         
         # Create charts
-        if self.sync_report:
-            self.create_stats_charts()
+        if stats:
+            self.create_stats_charts(stats)
     
-    def create_stats_charts(self):
+    def create_stats_charts(self, stats: Dict[str, Any]):
         """Create statistics charts."""
-        if not self.sync_report:
-            return
-        
-        stats = self.sync_report
-        
         # Create figure for charts
         fig = Figure(figsize=(6, 4), dpi=100)
         
@@ -387,78 +374,26 @@ Mini-Game Records: {stats.get('total_mini_game_records', 0)}
         canvas.get_tk_widget().pack(fill="both", expand=True)
     
     def update_user_browser(self):
-        """Update user browser with loaded data."""
-        # Clear existing items
-        for item in self.user_tree.get_children():
-            self.user_tree.delete(item)
-        
-        # Combine all users
-        all_users = []
-        for user in self.linked_users:
-            all_users.append(("matched", user))
-        for user in self.unmatched_users:
-            all_users.append(("unmatched", user))
-        
-        # Filter and add to treeview
-        self.filtered_users = all_users
-        self.apply_filters()
-    
-    def apply_filters(self):
-        """Apply search and filter to user list."""
-        # Get search term
-        search_term = self.search_entry.get().lower()
-        
-        # Get filter
-        filter_type = self.filter_var.get()
-        
-        # Clear existing items
-        for item in self.user_tree.get_children():
-            self.user_tree.delete(item)
-        
-        # Filter and add users
-        for user_type, user in self.filtered_users:
-            # Apply type filter
-            if filter_type == "matched" and user_type != "matched":
-                continue
-            if filter_type == "unmatched" and user_type != "unmatched":
-                continue
-            
-            # Apply search filter
-            if search_term:
-                user_id = user.get('clerkId') or user.get('id', '')
-                email = ""
-                name = ""
-                points = 0
-                
-                if user_type == "matched":
-                    email = user.get('clerkData', {}).get('primary_email_address', '') or user.get('convexProfile', {}).get('email', '')
-                    name = user.get('convexProfile', {}).get('name', '') or f"{user.get('clerkData', {}).get('first_name', '')} {user.get('clerkData', {}).get('last_name', '')}"
-                    points = user.get('totalPointsEarned', 0)
-                else:
-                    email = user.get('data', {}).get('primary_email_address', '')
-                    name = f"{user.get('data', {}).get('first_name', '')} {user.get('data', {}).get('last_name', '')}"
-                
-                search_text = f"{user_id} {email} {name}".lower()
-                if search_term not in search_text:
-                    continue
-            
-            # Add to treeview
-            if user_type == "matched":
-                user_id = user.get('clerkId', '')
-                email = user.get('clerkData', {}).get('primary_email_address', '') or user.get('convexProfile', {}).get('email', '')
-                name = user.get('convexProfile', {}).get('name', '') or f"{user.get('clerkData', {}).get('first_name', '')} {user.get('clerkData', {}).get('last_name', '')}"
-                points = user.get('totalPointsEarned', 0)
-                item = self.user_tree.insert("", "end", text=user_id[:30], values=(email[:40], name[:30], points), tags=(user_type,))
-                self.user_tree.item(item, values=(email[:40], name[:30], points))
-            else:
-                user_id = user.get('id', '')
-                email = user.get('data', {}).get('primary_email_address', '')
-                name = f"{user.get('data', {}).get('first_name', '')} {user.get('data', {}).get('last_name', '')}"
-                item = self.user_tree.insert("", "end", text=user_id[:30], values=(email[:40], name[:30], "N/A"), tags=(user_type,))
+        """Insert every user row once; filtering only reorders and detaches them."""
+        self.user_tree.delete(*self.user_tree.get_children())
+        
+        store = self.store
+        for row, (user_id, email, name, points) in enumerate(store.summaries):
+            self.user_tree.insert("", "end", iid=str(row), text=user_id[:30], values=(email[:40], name[:30], "N/A" if points is None else points), tags=(store.user_type(row),))
+        self.row_iids = np.array([str(row) for row in range(len(store))], dtype=object)
         
         # Tag colors
         self.user_tree.tag_configure("matched", foreground="green")
         self.user_tree.tag_configure("unmatched", foreground="orange")
+        
+        self.apply_filters()
+    
+    def apply_filters(self):
+        """Apply search and filter to user list."""
+        if self.store is None:
+            return
+        rows = self.store.filter_rows(self.search_entry.get(), self.filter_var.get())
+        self.user_tree.set_children("", *self.row_iids[rows].tolist())
     
     def on_search(self, event=None):
         """Handle search input."""
@@ -474,26 +409,13 @@ Mini-Game Records: {stats.get('total_mini_game_records', 0)}
         if not selection:
             return
         
-        item = selection[0]
-        user_id = self.user_tree.item(item, "text")
-        tags = self.user_tree.item(item, "tags")
-        
-        if tags and len(tags) > 0:
-            user_type = tags[0]
-            if user_type == "matched":
-                # Find matched user
-                for user in self.linked_users:
-                    if user.get('clerkId', '') == user_id:
-                        self.selected_user = user
-                        self.update_detail_view()
-                        break
-            else:
-                # Find unmatched user
-                for user in self.unmatched_users:
-                    if user.get('id', '') == user_id:
-                        self.selected_user = user
-                        self.update_detail_view()
-                        break
+        # Tree iids are row indexes into the user store
+        try:
+            self.selected_user = self.store.detail(int(selection[0]))
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to read user details: {str(e)}")
+            return
+        self.update_detail_view()
     
     def update_detail_view(self):
         """Update detailed user view."""